@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""
+F1 Driver Analysis - Render Profile Benchmark
+
+Renders each plot type with the 'print' and 'web' render profiles on a
+synthetic 700-sample lap and reports the warm render time (median of several
+renders, after one warm-up render) and the PNG size. No session data or
+network access is needed.
+
+Run with: python examples/benchmark_render_profiles.py [--repeats 5]
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import tempfile
+import time
+
+# Add the parent directory to the path so we can import our modules
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+import pandas as pd
+
+from src.visualization import (plot_brake_usage_map, plot_colored_track_map, plot_corner_analysis,
+                               plot_driver_comparison, plot_gear_usage_map, plot_gg_diagram,
+                               plot_throttle_brake_trace)
+
+SAMPLES = 700
+LAP_LENGTH = 5000.0
+CORNERS = [600.0, 1400.0, 2300.0, 3100.0, 4200.0]
+
+
+def synthetic_lap(seed: int = 0) -> pd.DataFrame:
+    """Return a synthetic lap with the channels every plot type needs."""
+    rng = np.random.default_rng(seed)
+    distance = np.linspace(0, LAP_LENGTH, SAMPLES)
+    angle = distance / LAP_LENGTH * 2 * np.pi
+    speed = 300 - sum(180 * np.exp(-((distance - apex) / 120) ** 2) for apex in CORNERS)
+    speed = speed + rng.normal(0, 2, SAMPLES)
+    throttle = np.clip((speed - 120) / 1.8, 0, 100)
+    brake = np.where(np.gradient(speed) < -1.5, 1.0, 0.0)
+    return pd.DataFrame({
+        'Distance': distance,
+        'Speed': speed,
+        'Throttle': throttle,
+        'Brake': brake,
+        'nGear': np.clip((speed // 40).astype(int), 1, 8),
+        'X': 1500 * np.cos(angle) + 300 * np.cos(3 * angle),
+        'Y': 900 * np.sin(angle),
+        'GforceLat': rng.normal(0, 2, SAMPLES),
+        'GforceLong': np.gradient(speed) / 3,
+        'Sector': np.digitize(distance, [LAP_LENGTH / 3, 2 * LAP_LENGTH / 3]) + 1,
+    })
+
+
+def plot_jobs(lap: pd.DataFrame, other: pd.DataFrame):
+    """Return (name, function(save_path, profile)) for each benchmarked plot type."""
+    lap_info = {'lap_number': 1, 'lap_time': '1:30.000', 'sector1_end': LAP_LENGTH / 3,
+                'sector2_end': 2 * LAP_LENGTH / 3, 'sector3_end': LAP_LENGTH}
+    outline = lap[['X', 'Y']].to_numpy()
+    return [
+        ('trace', lambda path, profile: plot_throttle_brake_trace(lap, lap_info, 'VER', path, profile)),
+        ('compare', lambda path, profile: plot_driver_comparison(lap, other, 'VER', 'HAM', path, profile)),
+        ('gg', lambda path, profile: plot_gg_diagram(lap, 'VER', path, profile)),
+        ('corners', lambda path, profile: plot_corner_analysis(lap, CORNERS, 'VER', path, profile)),
+        ('gearmap', lambda path, profile: plot_gear_usage_map(lap, 'VER', path, profile)),
+        ('brakemap', lambda path, profile: plot_brake_usage_map(lap, 'VER', path, profile)),
+        ('trackmap', lambda path, profile: plot_colored_track_map(None, lap, 'nGear', 'VER', path, outline,
+                                                                  profile)),
+    ]
+
+
+def benchmark(render, path: str, profile: str, repeats: int):
+    """Return (median render time in ms, PNG size in KB) of a plot after one warm-up render."""
+    render(path, profile)
+    times = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        render(path, profile)
+        times.append(time.perf_counter() - start)
+    return statistics.median(times) * 1000, os.path.getsize(path) / 1024
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark the print and web render profiles')
+    parser.add_argument('--repeats', type=int, default=5, help='Timed renders per plot and profile')
+    args = parser.parse_args()
+
+    print(f"Synthetic {SAMPLES}-sample lap, warm render time and PNG size:")
+    with tempfile.TemporaryDirectory() as tmp:
+        for name, render in plot_jobs(synthetic_lap(0), synthetic_lap(1)):
+            results = []
+            for profile in ('print', 'web'):
+                ms, kb = benchmark(render, os.path.join(tmp, f'{name}_{profile}.png'), profile, args.repeats)
+                results.append(f"{profile} {ms:4.0f} ms {kb:4.0f} KB")
+            print(f"  {name:<9} " + ' | '.join(results))
+
+
+if __name__ == '__main__':
+    main()
@@ -3,8 +3,31 @@ F1 WHO IS BETTER DRIVER? - Source Package
 
 This package contains the core modules for F1 driver performance analysis:
 - data_acquisition: F1 data loading and session management
+- session_pool: In-memory LRU pool of loaded sessions
+- schedule_index: Persisted, TTL-refreshed event schedule index with fuzzy lookup
+- telemetry_store: On-disk columnar cache of cleaned lap telemetry
+- session_summary: On-disk lap tables, driver lists and info of warmed sessions
+- session_index: Per-session driver -> lap index for O(1) lap selection
+- warmup: Season-wide cache prefetch (sessions, telemetry, summaries)
+- telemetry_schema: Compact dtype schema for cleaned telemetry channels
+- csv_stream: Chunked CSV export of lap and multi-lap telemetry
+- mat_export: Compressed binary MATLAB (.mat) export of lap telemetry
 - performance_metrics: Driver analytics and comparison tools  
+- batch_metrics: Session-wide vectorized metrics over stacked lap telemetry
+- stint_analysis: Per-lap telemetry metrics aggregated per stint and compound
+- brake_analysis: Braking zones matched across laps and their lap-to-lap dispersion
+- incremental_metrics: Chunk-at-a-time rolling throttle and braking metrics for replayed or live telemetry
+- telemetry_stream: Streaming telemetry sources and a paced replay of exported lap files
+- circuit_cache: Corner apexes, marshal sectors and track layouts cached per circuit and year
 - visualization: Plotting and visualization engine
+- analysis: Picklable plot rendering and lap metrics for analysis jobs
+- jobs: Background job queue with process-based rendering
+- plot_cache: Content-addressed, size-bounded cache of rendered plots
+- http_cache: Content ETags, conditional GET and Cache-Control policies
+- plot_payloads: Compact numeric plot series for client-side rendering
+- downsampling: Shape-preserving (LTTB, min/max) telemetry decimation
+- resampling: Distance-grid lap resampling with a bounded per-lap cache
+- delta_matrix: All-pairs driver time-delta curves and gap ranking
 - app: Flask web application
 - main: Command-line interface
 
@@ -0,0 +1,136 @@
+"""
+F1 Analysis Rendering Module
+
+Self-contained rendering and metric helpers used by the web application's
+analysis jobs.
+
+render_plot() takes a plain, picklable "render spec" (telemetry frames,
+labels and options, but no FastF1 session) so that the CPU-bound matplotlib
+work can run in a separate worker process. compute_lap_metrics() produces the
+summary numbers shown next to each plot.
+"""
+
+from typing import Any, Dict, List
+
+import numpy as np
+import pandas as pd
+
+from .performance_metrics import DriverPerformanceAnalyzer
+from .visualization import (
+    plot_throttle_brake_trace,
+    plot_driver_comparison,
+    plot_speed_delta,
+    plot_gg_diagram,
+    plot_corner_analysis,
+    plot_gear_usage_map,
+    plot_brake_usage_map,
+    plot_colored_track_map
+)
+
+PLOT_TYPES = ['trace', 'compare', 'delta', 'gg', 'corners', 'gearmap', 'brakemap', 'trackmap']
+COMPARISON_PLOT_TYPES = ['compare', 'delta']
+
+
+def safe_round(value, decimals=2):
+    """Safely round numeric values, handle numpy types and NaN"""
+    try:
+        if pd.isna(value) or value is None:
+            return 0.0
+        # Convert numpy types to Python types
+        if hasattr(value, 'item'):
+            value = value.item()
+        # Handle boolean values
+        if isinstance(value, (bool, np.bool_)):
+            return float(value)
+        return round(float(value), decimals)
+    except (TypeError, ValueError, AttributeError):
+        return 0.0
+
+
+def compute_lap_metrics(telemetry: pd.DataFrame) -> Dict[str, float]:
+    """Return the JSON-safe summary metrics displayed for an analyzed lap."""
+    analyzer = DriverPerformanceAnalyzer(telemetry)
+    return {
+        'full_throttle_percentage': safe_round(analyzer.full_throttle_percentage()),
+        'coasting_time_percentage': safe_round(analyzer.coasting_time_percentage()),
+        'throttle_smoothness': safe_round(analyzer.throttle_smoothness()),
+        'max_speed': safe_round(telemetry['Speed'].max()),
+        'min_speed': safe_round(telemetry['Speed'].min()),
+        'avg_speed': safe_round(telemetry['Speed'].mean()),
+        'max_brake': safe_round(telemetry['Brake'].max()),
+        'max_throttle': safe_round(telemetry['Throttle'].max())
+    }
+
+
+def trace_lap_info(lap: Any, telemetry: pd.DataFrame) -> Dict[str, Any]:
+    """Return lap_info for plot_throttle_brake_trace with equal-thirds sector bounds."""
+    max_dist = telemetry['Distance'].max()
+    return {
+        'lap_number': lap.get('LapNumber', '?'),
+        'lap_time': lap.get('LapTime', '?'),
+        'sector1_end': max_dist / 3,
+        'sector2_end': 2 * max_dist / 3,
+        'sector3_end': max_dist
+    }
+
+
+def even_corner_locations(telemetry: pd.DataFrame, n_corners: int = 10) -> List[float]:
+    """Return n_corners evenly spaced distances (used when no corner data is known)."""
+    dists = telemetry['Distance']
+    return [dists.min() + i * (dists.max() - dists.min()) / n_corners for i in range(1, n_corners + 1)]
+
+
+def render_plot(spec: Dict[str, Any]) -> str:
+    """
+    Render one analysis plot described by a render spec.
+
+    Args:
+        spec: dict with keys:
+            plot_type: one of PLOT_TYPES
+            save_path: output PNG path
+            telemetry: primary driver telemetry
+            driver: primary driver label
+            telemetry2, compare_driver: second driver (compare/delta only)
+            lap_keys: optional resampling cache keys of both laps (delta only)
+            lap_info: trace lap info (trace only)
+            corner_locations: apex distances (corners only)
+            color_by, track_outline: track map options (trackmap only)
+            profile: render profile, 'print' (default) or 'web'
+
+    Returns:
+        str: The save_path that was written
+    """
+    plot_type = spec['plot_type']
+    telemetry = spec['telemetry']
+    driver = spec['driver']
+    save_path = spec['save_path']
+    profile = spec.get('profile', 'print')
+
+    if plot_type == 'trace':
+        lap_info = spec['lap_info']
+        # Assign sectors to telemetry
+        if 'Sector' not in telemetry:
+            telemetry = telemetry.copy()
+            telemetry['Sector'] = 1
+            telemetry.loc[telemetry['Distance'] > lap_info['sector1_end'], 'Sector'] = 2
+            telemetry.loc[telemetry['Distance'] > lap_info['sector2_end'], 'Sector'] = 3
+        plot_throttle_brake_trace(telemetry, lap_info, driver, save_path=save_path, profile=profile)
+    elif plot_type == 'compare':
+        plot_driver_comparison(telemetry, spec['telemetry2'], driver, spec['compare_driver'], save_path=save_path, profile=profile)
+    elif plot_type == 'delta':
+        plot_speed_delta(telemetry, spec['telemetry2'], driver, spec['compare_driver'], save_path=save_path, profile=profile,
+                         lap_keys=spec.get('lap_keys'))
+    elif plot_type == 'gg':
+        plot_gg_diagram(telemetry, driver, save_path=save_path, profile=profile)
+    elif plot_type == 'corners':
+        plot_corner_analysis(telemetry, spec['corner_locations'], driver, save_path=save_path, profile=profile)
+    elif plot_type == 'gearmap':
+        plot_gear_usage_map(telemetry, driver, save_path=save_path, profile=profile)
+    elif plot_type == 'brakemap':
+        plot_brake_usage_map(telemetry, driver, save_path=save_path, profile=profile)
+    elif plot_type == 'trackmap':
+        plot_colored_track_map(None, telemetry, color_by=spec.get('color_by', 'nGear'), driver_label=driver,
+                               save_path=save_path, track_outline=spec.get('track_outline'), profile=profile)
+    else:
+        raise ValueError(f'Unknown plot type: {plot_type}')
+    return save_path
@@ -5,32 +5,41 @@ A Flask-based web interface for F1 telemetry data analysis and visualization.
 Provides an interactive dashboard for users to explore F1 data without CLI.
 """
 
-from flask import Flask, render_template, request, jsonify, send_file, flash, redirect, url_for
+from flask import Flask, render_template, request, jsonify, send_file, flash, redirect, url_for, Response, stream_with_context
+from werkzeug.utils import secure_filename
 import fastf1
 import pandas as pd
 import numpy as np
 import os
 import json
-import uuid
 from pathlib import Path
 from datetime import datetime
 import traceback
 import logging
-from threading import Lock
 
 # Import our existing modules
 from .data_acquisition import F1DataLoader
-from .performance_metrics import DriverPerformanceAnalyzer
-from .visualization import (
-    plot_throttle_brake_trace,
-    plot_driver_comparison,
-    plot_speed_delta,
-    plot_gg_diagram,
-    plot_corner_analysis,
-    plot_gear_usage_map,
-    plot_brake_usage_map,
-    plot_colored_track_map
+from .schedule_index import ScheduleIndex
+from .circuit_cache import CIRCUIT_VERSION, CircuitCache, corner_distances, layout_array
+from .session_pool import SessionPool, make_session_key, format_session_key, parse_session_key
+from .batch_metrics import compute_batch_metrics
+from .telemetry_store import lap_store_key
+from .csv_stream import iter_csv, iter_laps_csv
+from .telemetry_stream import ReplaySource, find_replay_files, is_replayable, live_updates
+from .delta_matrix import compute_delta_matrix
+from .visualization import plot_delta_matrix
+from .analysis import (
+    PLOT_TYPES,
+    COMPARISON_PLOT_TYPES,
+    compute_lap_metrics,
+    even_corner_locations,
+    render_plot,
+    trace_lap_info
 )
+from .plot_payloads import INTERACTIVE_PLOT_TYPES, build_payload, encode_array
+from .http_cache import IMMUTABLE, NO_STORE, REVALIDATE, conditional_json, conditional_response, file_etag
+from .jobs import JobQueue
+from .plot_cache import PlotCache
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -40,14 +49,68 @@ logger = logging.getLogger(__name__)
 app = Flask(__name__)
 app.secret_key = 'f1-analysis-secret-key-change-in-production'
 
-# Global data loader instance
-data_loader = F1DataLoader(cache_dir='cache')
-loader_lock = Lock()
+# Global data loader backed by a pool of loaded sessions, so users looking at
+# different events don't evict each other's data
+session_pool = SessionPool(
+    max_sessions=int(os.environ.get('F1_SESSION_POOL_SIZE', 4)),
+    max_bytes=int(os.environ.get('F1_SESSION_POOL_MB', 2048)) * 1024 * 1024
+)
+data_loader = F1DataLoader(cache_dir='cache', pool=session_pool)
+
+# Background analysis jobs; rendering runs in separate processes. Job state is
+# per process, so the app is served by one worker process with threads (DEPLOYMENT.md)
+job_queue = JobQueue(
+    max_workers=int(os.environ.get('F1_JOB_WORKERS', 4)),
+    render_workers=int(os.environ.get('F1_RENDER_WORKERS', 2))
+)
+
+# Event schedules are indexed once per season and persisted across restarts
+schedule_index = ScheduleIndex(Path('cache') / 'schedule_index.json',
+                               ttl=float(os.environ.get('F1_SCHEDULE_TTL_HOURS', 24)) * 3600)
+
+# Corner apexes, marshal sectors and track layouts, computed once per circuit and season
+circuit_cache = CircuitCache(Path('cache') / 'circuits')
+
+# Telemetry export scopes: the selected lap, all laps of the driver, or the whole session
+EXPORT_SCOPES = ('lap', 'driver', 'session')
+
+# Exported telemetry that /api/stream/replay may read (nothing outside these directories)
+REPLAY_DIRS = [Path('outputs/web'), Path('outputs/data')]
 
 # Ensure output directories exist
 Path('outputs/web').mkdir(parents=True, exist_ok=True)
 Path('static/plots').mkdir(parents=True, exist_ok=True)
 
+# Rendered plots are content-addressed so identical requests reuse them
+plot_cache = PlotCache('static/plots', max_bytes=int(os.environ.get('F1_PLOT_CACHE_MB', 256)) * 1024 * 1024)
+
+# Browser plots use the fast screen-resolution profile; set F1_RENDER_PROFILE=print for 300 dpi output
+render_profile = os.environ.get('F1_RENDER_PROFILE', 'web')
+
+def resolve_session(params):
+    """
+    Return (session_key, session) for a request.
+    
+    Accepts either a 'session_key' (as returned by /api/load_session) or
+    explicit 'year', 'track' and 'session' fields; the track may be a round
+    number, event name or (misspelled) location and is resolved to its round
+    with the schedule index. Sessions that were evicted from the pool are
+    transparently reloaded; warmed sessions are served from their stored lap
+    table and only loaded once data beyond it is needed (see get_lap_session).
+    """
+    year, track, session_type = requested_session(params)
+    session = data_loader.get_lap_session(year, track, session_type)
+    return format_session_key(make_session_key(year, track, session_type)), session
+
+def requested_session(params):
+    """Return (year, track, session_type) named by a request (see resolve_session)."""
+    if params.get('session_key'):
+        return parse_session_key(params['session_key'])
+    if params.get('year') and params.get('track') and params.get('session'):
+        year = int(params['year'])
+        return year, schedule_index.resolve_race(year, params['track']), params['session']
+    raise ValueError('No session specified')
+
 @app.route('/')
 def index():
     """Main dashboard page"""
@@ -57,32 +120,8 @@ def index():
 def get_tracks(year):
     """Get available tracks for a given year"""
     try:
-        schedule = fastf1.get_event_schedule(year)
-        tracks = []
-        for idx, row in schedule.iterrows():
-            # Skip pre-season testing and other non-race events
-            if row.get('EventFormat', '').lower() == 'testing':
-                continue
-                
-            # Handle different possible column names
-            event_name = row.get('EventName', row.get('Event', ''))
-            location = row.get('Location', row.get('Country', ''))
-            round_number = row.get('RoundNumber', row.get('Round', idx + 1))
-            
-            # Skip events with round number 0 (usually testing)
-            if int(round_number) <= 0:
-                continue
-            
-            tracks.append({
-                'round': int(round_number),
-                'name': str(event_name),
-                'location': str(location),
-                'date': str(row.get('EventDate', ''))
-            })
-        
-        # Sort by round number
-        tracks.sort(key=lambda x: x['round'])
-        return jsonify({'success': True, 'tracks': tracks})
+        body, etag = schedule_index.tracks_json(year)
+        return conditional_response(body, etag=etag, cache_control='public, max-age=300')
     except Exception as e:
         logger.error(f"Error getting tracks for {year}: {e}")
         logger.error(f"Traceback: {traceback.format_exc()}")
@@ -90,16 +129,19 @@ def get_tracks(year):
 
 @app.route('/api/drivers')
 def get_drivers():
-    """Get available drivers for the current session"""
+    """Get available drivers for the requested session"""
     try:
-        if data_loader.session is None:
-            return jsonify({'success': False, 'error': 'No session loaded'})
-        
-        drivers = data_loader.get_all_drivers()
+        # Warmed sessions are answered from their stored summary without loading them
+        summary = data_loader.get_session_summary(*requested_session(request.args))
+        if summary is not None:
+            drivers = summary['drivers']
+        else:
+            _, session = resolve_session(request.args)
+            drivers = data_loader.get_all_drivers(session)
         if not drivers:
             return jsonify({'success': False, 'error': 'No drivers found in session'})
         
-        return jsonify({'success': True, 'drivers': drivers})
+        return conditional_json({'success': True, 'drivers': drivers})
     except Exception as e:
         logger.error(f"Error getting drivers: {e}")
         return jsonify({'success': False, 'error': str(e)})
@@ -110,16 +152,24 @@ def load_session():
     try:
         data = request.json
         year = int(data['year'])
-        track = data['track']
+        track = schedule_index.resolve_race(year, data['track'])
         session_type = data['session']
         
-        with loader_lock:
-            session = data_loader.load_session(year, track, session_type)
-            session_info = data_loader.get_session_info()
-            drivers = data_loader.get_all_drivers()
+        # Warmed sessions are answered from their stored summary; the session
+        # itself is loaded by the first analysis that needs it
+        summary = data_loader.get_session_summary(year, track, session_type)
+        if summary is not None:
+            session_key = format_session_key(make_session_key(year, track, session_type))
+            session_info = summary['session_info']
+            drivers = summary['drivers']
+        else:
+            session_key, session = resolve_session({'year': year, 'track': track, 'session': session_type})
+            session_info = data_loader.get_session_info(session)
+            drivers = data_loader.get_all_drivers(session)
         
         return jsonify({
             'success': True,
+            'session_key': session_key,
             'session_info': session_info,
             'drivers': drivers
         })
@@ -129,153 +179,251 @@ def load_session():
 
 @app.route('/api/analyze', methods=['POST'])
 def analyze_data():
-    """Perform data analysis and generate visualizations"""
+    """Queue a data analysis job and return its id immediately"""
     try:
         data = request.json
-        driver = data['driver'].upper()
-        lap_type = data.get('lap_type', 'fastest')
+        if not data.get('driver'):
+            return jsonify({'success': False, 'error': 'No driver specified'})
         plot_type = data.get('plot_type', 'trace')
-        compare_driver = data.get('compare_driver', '').upper() if data.get('compare_driver') else None
-        
-        if data_loader.session is None:
-            return jsonify({'success': False, 'error': 'No session loaded'})
-        
-        if not data_loader.validate_driver_code(driver):
-            return jsonify({'success': False, 'error': f'Driver {driver} not found in session'})
-        
-        # Generate unique filename for this analysis
-        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-        plot_id = f"{driver}_{plot_type}_{timestamp}_{uuid.uuid4().hex[:8]}"
-        plot_path = f"static/plots/{plot_id}.png"
+        if plot_type not in PLOT_TYPES or (plot_type in COMPARISON_PLOT_TYPES and not data.get('compare_driver')):
+            return jsonify({'success': False, 'error': f'Unknown plot type: {plot_type}'})
+        mode = data.get('mode', 'png')
+        if mode not in ('png', 'json'):
+            return jsonify({'success': False, 'error': f'Unknown mode: {mode}'})
+        if mode == 'json' and plot_type not in INTERACTIVE_PLOT_TYPES:
+            return jsonify({'success': False, 'error': f'Plot type {plot_type} is only available as an image'})
         
-        # Get driver lap and telemetry
-        lap = data_loader.get_driver_lap(driver, lap_type=lap_type)
-        telemetry = data_loader.get_telemetry(lap)
+        job_id = job_queue.submit(lambda job: run_analysis(job, data))
+        return jsonify({
+            'success': True,
+            'job_id': job_id,
+            'status_url': f'/api/jobs/{job_id}',
+            'result_url': f'/api/jobs/{job_id}/result'
+        }), 202
         
-        # Generate visualization based on plot type
+    except Exception as e:
+        logger.error(f"Error in analysis: {e}")
+        logger.error(traceback.format_exc())
+        return jsonify({'success': False, 'error': str(e)})
+
+def run_analysis(job, data):
+    """
+    Background part of /api/analyze.
+    
+    Looks up session and telemetry in this process, renders the plot in the
+    render process pool and returns the response payload for the job result.
+    With mode 'json' no image is rendered; the result carries the plot series
+    for client-side drawing instead of a plot_url.
+    """
+    driver = data['driver'].upper()
+    lap_type = data.get('lap_type', 'fastest')
+    plot_type = data.get('plot_type', 'trace')
+    compare_driver = data.get('compare_driver', '').upper() if data.get('compare_driver') else None
+    mode = data.get('mode', 'png')
+    
+    job.set_progress('Loading session')
+    session_key, session = resolve_session(data)
+    
+    if not data_loader.validate_driver_code(driver, session):
+        raise ValueError(f'Driver {driver} not found in session')
+    if plot_type in COMPARISON_PLOT_TYPES and not data_loader.validate_driver_code(compare_driver, session):
+        raise ValueError(f'Compare driver {compare_driver} not found')
+    
+    # Get driver lap and telemetry
+    job.set_progress('Extracting telemetry')
+    lap = data_loader.get_driver_lap(driver, lap_type=lap_type, session=session)
+    telemetry = data_loader.get_telemetry(lap)
+    if plot_type == 'gg' and ('GforceLat' not in telemetry or 'GforceLong' not in telemetry):
+        raise ValueError('G-force data not available for this session')
+    
+    def build_spec():
+        spec = {'plot_type': plot_type, 'telemetry': telemetry, 'driver': driver, 'profile': render_profile}
         if plot_type == 'trace':
-            # Create lap info for trace plot
-            lap_info = {
-                'lap_number': lap.get('LapNumber', '?'),
-                'lap_time': lap.get('LapTime', '?'),
-                'sector1_end': telemetry['Distance'].max() / 3,
-                'sector2_end': 2 * telemetry['Distance'].max() / 3,
-                'sector3_end': telemetry['Distance'].max()
-            }
-            
-            # Assign sectors to telemetry
-            if 'Sector' not in telemetry:
-                telemetry = telemetry.copy()
-                telemetry['Sector'] = 1
-                telemetry.loc[telemetry['Distance'] > lap_info['sector1_end'], 'Sector'] = 2
-                telemetry.loc[telemetry['Distance'] > lap_info['sector2_end'], 'Sector'] = 3
-            
-            plot_throttle_brake_trace(telemetry, lap_info, driver, save_path=plot_path)
-            
-        elif plot_type == 'compare' and compare_driver:
-            if not data_loader.validate_driver_code(compare_driver):
-                return jsonify({'success': False, 'error': f'Compare driver {compare_driver} not found'})
-            
-            lap2 = data_loader.get_driver_lap(compare_driver, lap_type=lap_type)
-            telemetry2 = data_loader.get_telemetry(lap2)
-            plot_driver_comparison(telemetry, telemetry2, driver, compare_driver, save_path=plot_path)
-            
-        elif plot_type == 'delta' and compare_driver:
-            if not data_loader.validate_driver_code(compare_driver):
-                return jsonify({'success': False, 'error': f'Compare driver {compare_driver} not found'})
-            
-            lap2 = data_loader.get_driver_lap(compare_driver, lap_type=lap_type)
-            telemetry2 = data_loader.get_telemetry(lap2)
-            plot_speed_delta(telemetry, telemetry2, driver, compare_driver, save_path=plot_path)
-            
-        elif plot_type == 'gg':
-            if 'GforceLat' not in telemetry or 'GforceLong' not in telemetry:
-                return jsonify({'success': False, 'error': 'G-force data not available for this session'})
-            plot_gg_diagram(telemetry, driver, save_path=plot_path)
-            
+            spec['lap_info'] = trace_lap_info(lap, telemetry)
+        elif plot_type in COMPARISON_PLOT_TYPES:
+            lap2 = data_loader.get_driver_lap(compare_driver, lap_type=lap_type, session=session)
+            spec['telemetry2'] = data_loader.get_telemetry(lap2)
+            spec['compare_driver'] = compare_driver
+            spec['lap_keys'] = [lap_store_key(lap), lap_store_key(lap2)]
         elif plot_type == 'corners':
-            # Generate corner locations (simplified)
-            n_corners = 10
-            dists = telemetry['Distance']
-            corner_locations = [dists.min() + i * (dists.max() - dists.min()) / n_corners for i in range(1, n_corners+1)]
-            plot_corner_analysis(telemetry, corner_locations, driver, save_path=plot_path)
-            
-        elif plot_type == 'gearmap':
-            plot_gear_usage_map(telemetry, driver, save_path=plot_path)
-            
-        elif plot_type == 'brakemap':
-            plot_brake_usage_map(telemetry, driver, save_path=plot_path)
-            
+            # Apex distances from the circuit geometry cache (evenly spaced if none are known)
+            spec['corner_locations'] = (corner_distances(circuit_cache.get(session, telemetry))
+                                        or even_corner_locations(telemetry))
         elif plot_type == 'trackmap':
-            color_by = data.get('color_by', 'nGear')
-            plot_colored_track_map(data_loader.session, telemetry, color_by=color_by, driver_label=driver, save_path=plot_path)
-        
-        else:
-            return jsonify({'success': False, 'error': f'Unknown plot type: {plot_type}'})
-        
-        # Calculate performance metrics with safe numeric conversion
-        def safe_round(value, decimals=2):
-            """Safely round numeric values, handle numpy types and NaN"""
+            spec['color_by'] = data.get('color_by', 'nGear')
+            spec['track_outline'] = layout_array(circuit_cache.get(session, telemetry))
+        return spec
+    
+    if mode == 'json':
+        job.set_progress('Preparing plot data')
+        plot = {'payload': build_payload(build_spec())}
+    else:
+        # Plots are keyed by everything that affects their content (key_for() adds PLOT_VERSION)
+        cache_key = plot_cache.key_for(
+            session=session_key,
+            driver=driver,
+            compare_driver=compare_driver if plot_type in COMPARISON_PLOT_TYPES else None,
+            lap_type=lap_type,
+            plot_type=plot_type,
+            color_by=data.get('color_by', 'nGear') if plot_type == 'trackmap' else None,
+            circuit=CIRCUIT_VERSION if plot_type in ('corners', 'trackmap') else None,
+            profile=render_profile
+        )
+        plot_path = plot_cache.lookup(cache_key)
+        if plot_path is None:
+            temp_path = plot_cache.temp_path(cache_key)
+            spec = build_spec()
+            spec['save_path'] = str(temp_path)
+            
+            job.set_progress('Rendering plot')
             try:
-                if pd.isna(value) or value is None:
-                    return 0.0
-                # Convert numpy types to Python types
-                if hasattr(value, 'item'):
-                    value = value.item()
-                # Handle boolean values
-                if isinstance(value, (bool, np.bool_)):
-                    return float(value)
-                return round(float(value), decimals)
-            except (TypeError, ValueError, AttributeError):
-                return 0.0
-
-        analyzer = DriverPerformanceAnalyzer(telemetry)
-        metrics = {
-            'full_throttle_percentage': safe_round(analyzer.full_throttle_percentage()),
-            'coasting_time_percentage': safe_round(analyzer.coasting_time_percentage()),
-            'throttle_smoothness': safe_round(analyzer.throttle_smoothness()),
-            'max_speed': safe_round(telemetry['Speed'].max()),
-            'min_speed': safe_round(telemetry['Speed'].min()),
-            'avg_speed': safe_round(telemetry['Speed'].mean()),
-            'max_brake': safe_round(telemetry['Brake'].max()),
-            'max_throttle': safe_round(telemetry['Throttle'].max())
+                job_queue.render(render_plot, spec)
+                plot_path = plot_cache.publish(cache_key, temp_path)
+            finally:
+                temp_path.unlink(missing_ok=True)
+        plot = {'plot_url': f'/{plot_path.as_posix()}'}
+    
+    return {
+        'success': True,
+        **plot,
+        'metrics': compute_lap_metrics(telemetry),
+        'lap_info': {
+            'lap_number': str(lap.get('LapNumber', '?')),
+            'lap_time': str(lap.get('LapTime', '?')),
+            'driver': driver
         }
+    }
+
+@app.route('/api/jobs/<job_id>')
+def job_status(job_id):
+    """Get the status of a background analysis job"""
+    job = job_queue.get(job_id)
+    if job is None:
+        return jsonify({'success': False, 'error': 'Job not found'}), 404
+    response = {'success': True, **job.to_dict()}
+    if job.status == 'done':
+        response['result'] = job.result
+    response = jsonify(response)
+    response.headers['Cache-Control'] = NO_STORE
+    return response
+
+@app.route('/api/jobs/<job_id>/result')
+def job_result(job_id):
+    """Get the result of a finished background analysis job"""
+    job = job_queue.get(job_id)
+    if job is None:
+        return jsonify({'success': False, 'error': 'Job not found'}), 404
+    if job.status == 'failed':
+        return jsonify({'success': False, 'error': job.error})
+    if job.status != 'done':
+        return jsonify({'success': False, 'error': 'Job not finished', **job.to_dict()}), 409
+    # A finished job's result never changes
+    return conditional_json(job.result, cache_control='private, max-age=3600')
+
+@app.route('/api/session_metrics')
+def session_metrics():
+    """Compute per-lap metrics for every driver and lap of a session"""
+    try:
+        _, session = resolve_session(request.args)
+        drivers = [d for d in request.args.get('drivers', '').split(',') if d] or None
+        stacked = data_loader.stack_session_telemetry(session, drivers=drivers)
+        metrics = compute_batch_metrics(stacked).round(3)
+        metrics = metrics.astype(object).where(metrics.notna(), None)
+        return conditional_json({'success': True, 'laps': metrics.to_dict(orient='records')})
+    except Exception as e:
+        logger.error(f"Error computing session metrics: {e}")
+        return jsonify({'success': False, 'error': str(e)})
+
+@app.route('/api/delta_matrix')
+def delta_matrix():
+    """Compute time gaps between every pair of drivers in a session"""
+    try:
+        session_key, session = resolve_session(request.args)
+        lap_type = request.args.get('lap_type', 'fastest')
+        drivers = [d.upper() for d in request.args.get('drivers', '').split(',') if d]
+        drivers = drivers or data_loader.get_all_drivers(session)
         
-        return jsonify({
-            'success': True,
-            'plot_url': f'/{plot_path}',
-            'metrics': metrics,
-            'lap_info': {
-                'lap_number': str(lap.get('LapNumber', '?')),
-                'lap_time': str(lap.get('LapTime', '?')),
-                'driver': driver
-            }
-        })
+        laps = {}
+        for driver in drivers:
+            try:
+                laps[driver] = data_loader.get_driver_lap(driver, lap_type=lap_type, session=session)
+            except Exception as e:
+                logger.warning(f"Skipping {driver} in delta matrix: {e}")
+        # Extract all laps concurrently; drivers whose telemetry fails are dropped
+        results = data_loader.get_telemetry_many(list(laps.values()), skip_errors=True)
+        telemetries, keys = {}, []
+        for (driver, lap), telemetry in zip(laps.items(), results):
+            if telemetry is None:
+                logger.warning(f"Skipping {driver} in delta matrix: no telemetry")
+                continue
+            telemetries[driver] = telemetry
+            keys.append(lap_store_key(lap))
+        matrix = compute_delta_matrix(telemetries, keys=keys)
+        gaps = matrix.final_gaps()
         
+        response = {
+            'success': True,
+            'drivers': matrix.drivers,
+            'final_gaps': gaps.round(3).to_numpy().tolist(),
+            'ranking': matrix.ranking().round(3).to_dict(orient='records')
+        }
+        if request.args.get('curves') == 'true':
+            # Per-driver elapsed time; any pair's curve is times[i] - times[j]
+            response['grid'] = encode_array(matrix.grid)
+            response['times'] = [encode_array(t) for t in matrix.times]
+        if request.args.get('plot') == 'true':
+            cache_key = plot_cache.key_for(session=session_key, lap_type=lap_type, drivers=matrix.drivers,
+                                           plot_type='deltamatrix', profile=render_profile)
+            plot_path = plot_cache.lookup(cache_key)
+            if plot_path is None:
+                temp_path = plot_cache.temp_path(cache_key)
+                try:
+                    job_queue.render(plot_delta_matrix, gaps, f'Lap Time Gap Matrix ({lap_type} laps)',
+                                     str(temp_path), render_profile)
+                    plot_path = plot_cache.publish(cache_key, temp_path)
+                finally:
+                    temp_path.unlink(missing_ok=True)
+            response['plot_url'] = f'/{plot_path.as_posix()}'
+        return conditional_json(response)
     except Exception as e:
-        logger.error(f"Error in analysis: {e}")
-        logger.error(traceback.format_exc())
+        logger.error(f"Error computing delta matrix: {e}")
         return jsonify({'success': False, 'error': str(e)})
 
 @app.route('/api/export_csv', methods=['POST'])
 def export_csv():
-    """Export telemetry data to CSV"""
+    """Export telemetry data to CSV, or queue a MATLAB .mat export job"""
     try:
         data = request.json
-        driver = data['driver'].upper()
+        driver = data.get('driver', '').upper()
         lap_type = data.get('lap_type', 'fastest')
         
-        if data_loader.session is None:
-            return jsonify({'success': False, 'error': 'No session loaded'})
+        export_format = data.get('format', 'csv')
+        if export_format not in ('csv', 'mat'):
+            return jsonify({'success': False, 'error': f'Unknown export format: {export_format}'}), 400
+        scope = data.get('scope', 'lap') if export_format == 'mat' else 'lap'
+        if scope not in EXPORT_SCOPES:
+            return jsonify({'success': False, 'error': f'Unknown export scope: {scope}'}), 400
         
-        # Get telemetry
-        lap = data_loader.get_driver_lap(driver, lap_type=lap_type)
-        telemetry = data_loader.get_telemetry(lap)
+        _, session = resolve_session(data)
+        if scope != 'session' and not data_loader.validate_driver_code(driver, session):
+            return jsonify({'success': False, 'error': f'Driver {driver} not found in session'}), 400
+        
+        if export_format == 'mat':
+            # Multi-lap conversions can take a while, so MAT-files are written by a background job
+            job_id = job_queue.submit(lambda job: run_mat_export(job, data, scope, driver))
+            return jsonify({
+                'success': True,
+                'job_id': job_id,
+                'status_url': f'/api/jobs/{job_id}',
+                'result_url': f'/api/jobs/{job_id}/result'
+            }), 202
         
         # Export to CSV
+        lap = data_loader.get_driver_lap(driver, lap_type=lap_type, session=session)
+        telemetry = data_loader.get_telemetry(lap)
         timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
         filename = f"{driver.lower()}_{timestamp}.csv"
-        csv_path = data_loader.export_to_csv(telemetry, filename, output_dir='outputs/web')
+        data_loader.export_to_csv(telemetry, filename, output_dir='outputs/web')
         
         return jsonify({
             'success': True,
@@ -287,19 +435,115 @@ def export_csv():
         logger.error(f"Error exporting CSV: {e}")
         return jsonify({'success': False, 'error': str(e)})
 
+def run_mat_export(job, data, scope, driver):
+    """
+    Background part of a MATLAB export: the selected lap, all laps of the
+    driver or the whole session, written to outputs/web.
+    """
+    job.set_progress('Loading session')
+    session_key, session = resolve_session(data)
+    if scope == 'lap':
+        laps = [data_loader.get_driver_lap(driver, lap_type=data.get('lap_type', 'fastest'), session=session)]
+    elif scope == 'driver':
+        laps = session.laps.pick_drivers([driver])
+    else:
+        laps = session.laps
+    job.set_progress('Writing MAT-file')
+    label = driver.lower() if scope != 'session' else session_key.replace(':', '_')
+    filename = secure_filename(f"{label}_{scope}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.mat")
+    data_loader.export_to_mat(laps, filename, output_dir='outputs/web')
+    return {'success': True, 'download_url': f'/download/{filename}', 'filename': filename}
+
+@app.route('/api/export_csv/stream')
+def export_csv_stream():
+    """Stream telemetry as CSV for one lap, all laps of a driver or a whole session"""
+    try:
+        session_key, session = resolve_session(request.args)
+        scope = request.args.get('scope', 'lap')
+        driver = request.args.get('driver', '').upper()
+        if scope not in EXPORT_SCOPES:
+            return jsonify({'success': False, 'error': f'Unknown export scope: {scope}'}), 400
+        if scope != 'session' and not data_loader.validate_driver_code(driver, session):
+            return jsonify({'success': False, 'error': f'Driver {driver} not found in session'}), 400
+        
+        if scope == 'lap':
+            lap = data_loader.get_driver_lap(driver, lap_type=request.args.get('lap_type', 'fastest'), session=session)
+            chunks = iter_csv(data_loader.get_telemetry(lap))
+        elif scope == 'driver':
+            chunks = iter_laps_csv(data_loader, session.laps.pick_drivers([driver]))
+        else:
+            chunks = iter_laps_csv(data_loader, session.laps)
+        
+        filename = f"{session_key.replace(':', '_')}_{driver.lower() or 'all'}_{scope}.csv"
+        return Response(stream_with_context(chunks), mimetype='text/csv',
+                        headers={'Content-Disposition': f'attachment; filename={filename}'})
+    except Exception as e:
+        logger.error(f"Error streaming CSV: {e}")
+        return jsonify({'success': False, 'error': str(e)})
+
+def replay_path(filename):
+    """Resolve a replay file name to an exported file inside REPLAY_DIRS, or raise ValueError."""
+    for directory in REPLAY_DIRS:
+        root = directory.resolve()
+        path = (root / filename).resolve()
+        if path.parent == root and is_replayable(path):
+            return path
+    raise ValueError(f'Replay file {filename} not found')
+
+@app.route('/api/stream/files')
+def stream_files():
+    """List exported telemetry files that can be replayed"""
+    files = [{'name': path.name, 'directory': path.parent.as_posix()} for path in find_replay_files(REPLAY_DIRS)]
+    response = jsonify({'success': True, 'files': files})
+    response.headers['Cache-Control'] = NO_STORE
+    return response
+
+@app.route('/api/stream/replay')
+def stream_replay():
+    """Replay an exported telemetry file as server-sent events carrying live rolling metrics"""
+    try:
+        window = int(request.args.get('window', 0)) or None
+        source = ReplaySource([replay_path(request.args.get('file', ''))],
+                              speedup=float(request.args.get('speedup', 1)))
+    except (TypeError, ValueError) as e:
+        return jsonify({'success': False, 'error': str(e)}), 400
+    
+    def events():
+        try:
+            for update in live_updates(source, window=window):
+                yield f"data: {json.dumps(update)}\n\n"
+            yield "event: end\ndata: {}\n\n"
+        except Exception as e:
+            logger.error(f"Error replaying telemetry: {e}")
+            yield f"event: failed\ndata: {json.dumps({'error': str(e)})}\n\n"
+        finally:
+            source.close()
+    
+    return Response(stream_with_context(events()), mimetype='text/event-stream',
+                    headers={'Cache-Control': NO_STORE, 'X-Accel-Buffering': 'no'})
+
 @app.route('/download/<filename>')
 def download_file(filename):
     """Download exported CSV files"""
     try:
-        file_path = Path('outputs/web') / filename
+        file_path = (Path('outputs/web') / filename).resolve()
         if file_path.exists():
-            return send_file(file_path, as_attachment=True)
+            response = send_file(file_path, as_attachment=True, conditional=True, etag=file_etag(file_path))
+            response.headers['Cache-Control'] = REVALIDATE
+            return response
         else:
             return jsonify({'error': 'File not found'}), 404
     except Exception as e:
         logger.error(f"Error downloading file: {e}")
         return jsonify({'error': str(e)}), 500
 
+@app.after_request
+def cache_static_plots(response):
+    """Rendered plots are content-addressed (the file name is a hash), so they never change"""
+    if request.path.startswith('/static/plots/') and response.status_code in (200, 304):
+        response.headers['Cache-Control'] = IMMUTABLE
+    return response
+
 @app.errorhandler(404)
 def not_found(error):
     return render_template('error.html', error='Page not found'), 404
@@ -0,0 +1,240 @@
+"""
+F1 Batch Metrics Module
+
+Session-wide versions of the DriverPerformanceAnalyzer metrics.
+
+Telemetry for every lap of every driver is stacked into one contiguous array
+per channel with per-lap offsets (StackedTelemetry). Metrics are then computed
+for all laps in a single vectorized pass using bincount/reduceat over the lap
+segments, instead of building one analyzer per lap in a Python loop.
+
+Example Usage:
+    stacked = loader.stack_session_telemetry(session)
+    metrics = compute_batch_metrics(stacked)
+    print(metrics.sort_values('full_throttle_percentage'))
+"""
+
+from typing import Hashable, Iterable, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from .performance_metrics import _segment_reduce, default_brake_threshold
+from .resampling import channel_values
+from .telemetry_schema import TELEMETRY_DTYPES, schema_dtype
+
+STACK_COLUMNS = ['Time', 'Distance', 'Speed', 'Throttle', 'Brake', 'RPM', 'nGear', 'DRS', 'X', 'Y', 'Z']
+
+
+class StackedTelemetry:
+    """
+    Telemetry for many laps held as contiguous per-channel arrays.
+
+    Attributes:
+        columns (dict): Channel name -> 1-D array covering all laps back to back
+            (Time is stored as seconds from the start of each lap)
+        offsets (np.ndarray): Lap i occupies rows offsets[i]:offsets[i+1]
+        keys (list): One (driver, lap_number) key per lap
+
+    Channels keep the compact telemetry schema dtypes (float32, int8 for nGear
+    and DRS); Time is float64 seconds.
+    """
+
+    def __init__(self, columns: dict, offsets: np.ndarray, keys: List[Tuple[Hashable, Hashable]]):
+        self.columns = columns
+        self.offsets = np.asarray(offsets, dtype=np.intp)
+        self.keys = list(keys)
+        if len(self.offsets) != len(self.keys) + 1:
+            raise ValueError("offsets must have one more entry than keys")
+
+    @classmethod
+    def from_frames(cls, frames: Iterable[Tuple[Tuple[Hashable, Hashable], pd.DataFrame]],
+                    columns: Optional[List[str]] = None) -> 'StackedTelemetry':
+        """
+        Stack per-lap telemetry frames.
+
+        Args:
+            frames: Iterable of ((driver, lap_number), telemetry DataFrame) pairs,
+                or a dict with the same keys
+            columns: Channels to stack (default: every STACK_COLUMNS channel present
+                in the first frame)
+        """
+        if isinstance(frames, dict):
+            frames = frames.items()
+        keys, parts = [], []
+        for key, frame in frames:
+            keys.append(key)
+            parts.append(frame)
+        if columns is None:
+            columns = [c for c in STACK_COLUMNS if parts and c in parts[0].columns]
+        lengths = np.array([len(p) for p in parts], dtype=np.intp)
+        offsets = np.concatenate(([0], np.cumsum(lengths)))
+        stacked = {}
+        for col in columns:
+            arrays = [_stack_values(p, col) for p in parts]
+            values = np.concatenate(arrays) if arrays else np.empty(0)
+            dtype = schema_dtype(col, values)
+            stacked[col] = values.astype(dtype, copy=False) if dtype is not None else values
+        return cls(stacked, offsets, keys)
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    @property
+    def lengths(self) -> np.ndarray:
+        """Number of samples in each lap."""
+        return np.diff(self.offsets)
+
+    @property
+    def lap_ids(self) -> np.ndarray:
+        """Lap position (0..n_laps-1) of every stacked sample."""
+        return np.repeat(np.arange(len(self.keys)), self.lengths)
+
+    def lap_frame(self, i: int) -> pd.DataFrame:
+        """Return lap i as a DataFrame (views into the stacked arrays)."""
+        lo, hi = self.offsets[i], self.offsets[i + 1]
+        return pd.DataFrame({col: values[lo:hi] for col, values in self.columns.items()})
+
+
+def _stack_values(frame: pd.DataFrame, col: str) -> np.ndarray:
+    # Frames already in the schema dtype are stacked without a float64 round trip
+    if col in frame.columns and frame[col].dtype == TELEMETRY_DTYPES.get(col):
+        return frame[col].to_numpy()
+    return channel_values(frame, col)
+
+
+def _within_lap_pairs(stacked: StackedTelemetry) -> Tuple[np.ndarray, np.ndarray]:
+    """Return (lap id of each consecutive sample pair, mask of pairs inside one lap)."""
+    lap_ids = stacked.lap_ids
+    return lap_ids[1:], lap_ids[1:] == lap_ids[:-1]
+
+
+def _zone_flags(stacked: StackedTelemetry, threshold: Optional[float]) -> Tuple[np.ndarray, np.ndarray]:
+    """Return boolean start/end flags of braking zones, with zones never spanning two laps."""
+    if threshold is None:
+        threshold = default_brake_threshold(stacked.columns['Brake'])
+    braking = stacked.columns['Brake'] > threshold
+    n = len(braking)
+    lap_start = np.zeros(n, dtype=bool)
+    lap_end = np.zeros(n, dtype=bool)
+    nonempty = stacked.lengths > 0
+    lap_start[stacked.offsets[:-1][nonempty]] = True
+    lap_end[stacked.offsets[1:][nonempty] - 1] = True
+    prev = np.concatenate(([False], braking[:-1]))
+    nxt = np.concatenate((braking[1:], [False]))
+    starts = braking & (~prev | lap_start)
+    ends = braking & (~nxt | lap_end)
+    return starts, ends
+
+
+def compute_batch_metrics(stacked: StackedTelemetry, brake_threshold: Optional[float] = None) -> pd.DataFrame:
+    """
+    Compute per-lap driving metrics for every stacked lap in one pass.
+
+    Args:
+        stacked: StackedTelemetry with at least Throttle, Brake and Speed
+        brake_threshold: Brake value above which a sample counts as braking
+            (default: default_brake_threshold() of the stacked Brake channel)
+
+    Returns:
+        pd.DataFrame: One row per lap with columns Driver, LapNumber, samples,
+            full_throttle_percentage, coasting_time_percentage,
+            throttle_smoothness, braking_zones, max_brake, upshifts,
+            max_speed, min_speed, avg_speed
+    """
+    n_laps = len(stacked)
+    lengths = stacked.lengths
+    lap_ids = stacked.lap_ids
+    with np.errstate(invalid='ignore', divide='ignore'):
+        counts = lengths.astype(float)
+        throttle = stacked.columns['Throttle']
+        brake = stacked.columns['Brake']
+        speed = stacked.columns['Speed']
+
+        full_throttle = np.bincount(lap_ids, weights=throttle > 95, minlength=n_laps) / counts * 100
+        coasting = np.bincount(lap_ids, weights=(throttle < 5) & (brake < 5), minlength=n_laps) / counts * 100
+
+        pair_laps, inside = _within_lap_pairs(stacked)
+        abs_change = np.abs(np.diff(throttle))
+        smoothness = (np.bincount(pair_laps[inside], weights=abs_change[inside], minlength=n_laps)
+                      / (counts - 1).clip(min=0))
+
+        starts, _ = _zone_flags(stacked, brake_threshold)
+        zones = np.bincount(lap_ids[starts], minlength=n_laps)
+
+        if 'nGear' in stacked.columns:
+            upshift = (np.diff(stacked.columns['nGear']) > 0) & inside
+            upshifts = np.bincount(pair_laps[upshift], minlength=n_laps)
+        else:
+            upshifts = np.zeros(n_laps, dtype=int)
+
+        lo, hi = stacked.offsets[:-1], stacked.offsets[1:]
+        result = pd.DataFrame({
+            'Driver': [k[0] for k in stacked.keys],
+            'LapNumber': [k[1] for k in stacked.keys],
+            'samples': lengths,
+            'full_throttle_percentage': full_throttle,
+            'coasting_time_percentage': coasting,
+            'throttle_smoothness': smoothness,
+            'braking_zones': zones,
+            'max_brake': _segment_reduce(np.fmax, brake, lo, hi),
+            'upshifts': upshifts,
+            'max_speed': _segment_reduce(np.fmax, speed, lo, hi),
+            'min_speed': _segment_reduce(np.fmin, speed, lo, hi),
+            'avg_speed': np.bincount(lap_ids, weights=speed, minlength=n_laps) / counts,
+        })
+    return result
+
+
+def batch_braking_zones(stacked: StackedTelemetry, brake_threshold: Optional[float] = None) -> pd.DataFrame:
+    """
+    Return every braking zone of every stacked lap as a tidy table.
+
+    Args:
+        stacked: StackedTelemetry with at least Brake
+        brake_threshold: Brake value above which a sample counts as braking
+            (default: default_brake_threshold() of the stacked Brake channel)
+
+    Returns:
+        pd.DataFrame: Columns Driver, LapNumber, lap_index, start_idx, end_idx
+            (row offsets within the lap), start_distance, end_distance, max_brake
+    """
+    starts, ends = _zone_flags(stacked, brake_threshold)
+    start_rows = np.flatnonzero(starts)
+    end_rows = np.flatnonzero(ends)
+    lap_index = stacked.lap_ids[start_rows]
+    lap_offset = stacked.offsets[lap_index]
+    dist = stacked.columns.get('Distance')
+    return pd.DataFrame({
+        'Driver': [stacked.keys[i][0] for i in lap_index],
+        'LapNumber': [stacked.keys[i][1] for i in lap_index],
+        'lap_index': lap_index,
+        'start_idx': start_rows - lap_offset,
+        'end_idx': end_rows - lap_offset,
+        'start_distance': dist[start_rows] if dist is not None else np.nan,
+        'end_distance': dist[end_rows] if dist is not None else np.nan,
+        'max_brake': _segment_reduce(np.fmax, stacked.columns['Brake'], start_rows, end_rows + 1),
+    })
+
+
+def batch_gear_shifts(stacked: StackedTelemetry) -> pd.DataFrame:
+    """
+    Return every upshift of every stacked lap as a tidy table.
+
+    Returns:
+        pd.DataFrame: Columns Driver, LapNumber, Distance, RPM, from_gear, to_gear
+            (distance and RPM taken at the last sample before the shift, as in
+            DriverPerformanceAnalyzer.gear_shift_timing)
+    """
+    gear = stacked.columns['nGear']
+    _, inside = _within_lap_pairs(stacked)
+    rows = np.flatnonzero((np.diff(gear) > 0) & inside)
+    lap_index = stacked.lap_ids[rows]
+    return pd.DataFrame({
+        'Driver': [stacked.keys[i][0] for i in lap_index],
+        'LapNumber': [stacked.keys[i][1] for i in lap_index],
+        'Distance': stacked.columns['Distance'][rows],
+        'RPM': stacked.columns['RPM'][rows],
+        'from_gear': gear[rows],
+        'to_gear': gear[rows + 1],
+    })
@@ -0,0 +1,165 @@
+"""
+F1 Brake Analysis Module
+
+Multi-lap braking consistency from stacked lap telemetry.
+
+Every braking zone of every lap is detected in one pass over the stacked
+arrays (batch_metrics.batch_braking_zones). Zones are matched across laps
+by track distance: the start distances of all zones are sorted, and a gap
+larger than the matching tolerance begins a new track braking zone, so each
+corner's braking zone gets one id in every lap. Brake points of close zones
+(a chicane) can chain across laps without such a gap, so a cluster reaching
+further than the tolerance from its median is split again at its largest
+gap. Per-zone dispersion of
+brake point, peak pressure and duration is then computed with bincount
+sums, without a loop over laps or zones.
+
+Example Usage:
+    stacked = loader.stack_session_telemetry(session, drivers=['VER'])
+    brakes = MultiLapBrakeAnalyzer(stacked)
+    print(brakes.zone_table())        # one row per track braking zone
+    print(brakes.consistency())       # mean brake point std (m)
+"""
+
+from typing import Iterable, Optional, Union
+
+import numpy as np
+import pandas as pd
+
+from .batch_metrics import StackedTelemetry, batch_braking_zones
+from .performance_metrics import default_brake_threshold
+
+
+def _cluster_points(values: np.ndarray, tolerance: float) -> np.ndarray:
+    """
+    Return cluster ids (0..K-1, ascending) for sorted values.
+
+    Values are split at gaps larger than tolerance. A cluster with a value
+    further than tolerance from the cluster median is split again at its
+    largest gap, until every cluster lies within tolerance of its median.
+    """
+    n = len(values)
+    if not n:
+        return np.zeros(0, dtype=np.intp)
+    bounds = np.concatenate(([0], np.flatnonzero(np.diff(values) > tolerance) + 1, [n]))
+    pending = list(zip(bounds[:-1].tolist(), bounds[1:].tolist()))
+    first = np.zeros(n, dtype=np.intp)
+    while pending:
+        lo, hi = pending.pop()
+        segment = values[lo:hi]
+        if hi - lo > 1 and np.abs(segment - np.median(segment)).max() > tolerance:
+            cut = lo + 1 + int(np.argmax(np.diff(segment)))
+            pending += [(lo, cut), (cut, hi)]
+        elif lo:
+            first[lo] = 1
+    return np.cumsum(first)
+
+
+class MultiLapBrakeAnalyzer:
+    """
+    Braking zones of many laps, matched across laps by track distance.
+
+    Attributes:
+        stacked (StackedTelemetry): Telemetry of all laps
+        brake_threshold (float): Brake value above which a sample counts as braking
+        tolerance (float): Maximum distance (m) between brake points of the
+            same zone on consecutive laps in sorted order, and from a brake
+            point to the zone's median brake point
+        min_lap_fraction (float): Zones braked in fewer than this fraction of
+            laps (lifts, brake stabs, off-line moments) are ignored
+        zones (pd.DataFrame): One row per matched lap zone with lap_index,
+            zone, brake_point (m), peak_pressure and duration (s)
+
+    Example Usage:
+        brakes = MultiLapBrakeAnalyzer([tel_lap1, tel_lap2, tel_lap3])
+        table = brakes.zone_table()
+    """
+
+    def __init__(self,
+                 laps: Union[StackedTelemetry, Iterable[pd.DataFrame]],
+                 brake_threshold: Optional[float] = None,
+                 tolerance: float = 50.0,
+                 min_lap_fraction: float = 0.5):
+        if not isinstance(laps, StackedTelemetry):
+            laps = StackedTelemetry.from_frames(((None, i + 1), frame) for i, frame in enumerate(laps))
+        self.stacked = laps
+        self.brake_threshold = (brake_threshold if brake_threshold is not None
+                                else default_brake_threshold(laps.columns['Brake']))
+        self.tolerance = tolerance
+        self.min_lap_fraction = min_lap_fraction
+        self.zones = self._match_zones()
+
+    def _match_zones(self) -> pd.DataFrame:
+        raw = batch_braking_zones(self.stacked, self.brake_threshold)
+        # Zones without a brake point distance cannot be matched
+        raw = raw[np.isfinite(raw['start_distance'].to_numpy(dtype=float))]
+        starts = raw['start_distance'].to_numpy(dtype=float)
+        if not len(raw):
+            return pd.DataFrame(columns=['lap_index', 'zone', 'brake_point', 'peak_pressure', 'duration'])
+        offsets = self.stacked.offsets[raw['lap_index'].to_numpy()]
+        if 'Time' in self.stacked.columns:
+            time = self.stacked.columns['Time']
+            duration = (time[offsets + raw['end_idx'].to_numpy()] - time[offsets + raw['start_idx'].to_numpy()])
+        else:
+            duration = np.full(len(raw), np.nan)
+
+        # Cluster brake points along the track into track braking zones
+        order = np.argsort(starts, kind='stable')
+        cluster = np.empty(len(order), dtype=np.intp)
+        cluster[order] = _cluster_points(starts[order], self.tolerance)
+
+        zones = pd.DataFrame({
+            'lap_index': raw['lap_index'].to_numpy(),
+            'zone': cluster,
+            'brake_point': starts,
+            'peak_pressure': raw['max_brake'].to_numpy(dtype=float),
+            'duration': np.asarray(duration, dtype=float),
+        })
+        # Keep the first braking of each lap in a zone, and zones most laps brake in
+        zones = zones[~zones.duplicated(['zone', 'lap_index'])]
+        laps_per_zone = np.bincount(zones['zone'].to_numpy(), minlength=cluster.max() + 1)
+        common = laps_per_zone >= max(2, self.min_lap_fraction * len(self.stacked))
+        zones = zones[common[zones['zone'].to_numpy()]].copy()
+        # Renumber the kept zones 0..K-1 in track order
+        zones['zone'] = np.unique(zones['zone'].to_numpy(), return_inverse=True)[1]
+        return zones.sort_values(['zone', 'lap_index'], kind='stable').reset_index(drop=True)
+
+    def zone_table(self) -> pd.DataFrame:
+        """
+        Return per-zone dispersion across laps.
+
+        Returns:
+            pd.DataFrame: One row per track braking zone with zone, laps,
+                distance (median brake point, m), and mean/std of brake_point (m),
+                peak_pressure and duration (s); std is the population std (ddof=0)
+        """
+        zone_ids = self.zones['zone'].to_numpy(dtype=np.intp)
+        n_zones = int(zone_ids.max()) + 1 if len(zone_ids) else 0
+        counts = np.bincount(zone_ids, minlength=n_zones).astype(float)
+        table = {'zone': np.arange(n_zones), 'laps': counts.astype(int),
+                 'distance': self.zones.groupby('zone')['brake_point'].median().reindex(range(n_zones)).to_numpy()}
+        with np.errstate(invalid='ignore', divide='ignore'):
+            for col in ['brake_point', 'peak_pressure', 'duration']:
+                values = self.zones[col].to_numpy(dtype=float)
+                mean = np.bincount(zone_ids, weights=values, minlength=n_zones) / counts
+                # Center before squaring to keep the variance numerically stable
+                centered = values - mean[zone_ids]
+                var = np.bincount(zone_ids, weights=centered ** 2, minlength=n_zones) / counts
+                table[f'{col}_mean'] = mean
+                table[f'{col}_std'] = np.sqrt(var)
+        return pd.DataFrame(table)
+
+    def consistency(self, metric: str = 'brake_point') -> float:
+        """
+        Return the mean across zones of a metric's lap-to-lap std; lower is more consistent.
+
+        Args:
+            metric: 'brake_point' (m), 'peak_pressure' or 'duration' (s)
+
+        Returns:
+            float: Mean per-zone std, NaN without matched zones
+        """
+        if metric not in ('brake_point', 'peak_pressure', 'duration'):
+            raise ValueError(f"Unknown brake metric: {metric}")
+        table = self.zone_table()
+        return float(table[f'{metric}_std'].mean()) if len(table) else np.nan
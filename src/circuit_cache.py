@@ -0,0 +1,218 @@
+"""
+F1 Circuit Cache Module
+
+This module provides the CircuitCache class, a persisted cache of circuit
+geometry per circuit and season: corner apex distances, marshal sectors and
+the track layout polyline.
+
+Corner analysis needs apex distances and the track map needs an outline.
+Both come from session.get_circuit_info(), which fetches the circuit data
+and then measures the marker distances against the fastest lap's
+telemetry. That work is done once per (circuit, year). The result is kept
+in memory and stored as JSON, so later requests for any session at that
+circuit need no extra session calls.
+
+If the session has no circuit info (or its markers have no distances),
+corners are detected from the reference lap's telemetry as speed minima
+(DriverPerformanceAnalyzer.speed_minima). The layout polyline is always the
+reference lap's X/Y position trace, so it shares the telemetry coordinate
+frame.
+
+Layout:
+    <root>/v<version>/<year>/<circuit>.json
+
+Example Usage:
+    circuits = CircuitCache('cache/circuits')
+    geometry = circuits.get(session, telemetry)
+    corner_distances(geometry)        # [412.3, 1023.8, ...]
+    layout_array(geometry)            # N x 2 array of X/Y points
+"""
+
+from pathlib import Path
+from threading import Lock
+from typing import Any, Dict, List, Optional, Tuple, Union
+import json
+import logging
+import os
+import uuid
+
+import numpy as np
+import pandas as pd
+
+from .performance_metrics import DriverPerformanceAnalyzer
+from .telemetry_store import _slug
+
+logger = logging.getLogger(__name__)
+
+CIRCUIT_VERSION = 1
+LAYOUT_POINTS = 800
+
+CircuitKey = Tuple[str, int]
+
+
+def circuit_key(session: Any) -> CircuitKey:
+    """Return the (circuit, year) cache key of a session, from its event location."""
+    event = session.event
+    name = event.get('Location') or event.get('EventName')
+    return _slug(name), int(event.year)
+
+
+def _number(value: Any) -> Optional[float]:
+    """Return value as a JSON-safe float (None for NaN/missing)."""
+    try:
+        value = float(value)
+    except (TypeError, ValueError):
+        return None
+    return value if np.isfinite(value) else None
+
+
+def _markers(frame: Optional[pd.DataFrame], columns: List[str]) -> List[Dict[str, Any]]:
+    """Convert a CircuitInfo marker frame into JSON records ordered by distance."""
+    if frame is None or not len(frame) or 'Distance' not in frame.columns:
+        return []
+    frame = frame.sort_values('Distance', kind='stable')
+    records = []
+    for row in frame.itertuples(index=False):
+        record = {'number': int(row.Number), 'distance': _number(row.Distance)}
+        for col in columns:
+            value = getattr(row, col, None)
+            record[col.lower()] = _number(value) if col in ('X', 'Y') else (str(value) if pd.notna(value) else '')
+        records.append(record)
+    return records
+
+
+def _reference_telemetry(session: Any) -> Optional[pd.DataFrame]:
+    try:
+        return session.laps.pick_fastest().get_telemetry()
+    except Exception as e:
+        logger.warning(f"No reference lap telemetry for circuit geometry: {e}")
+        return None
+
+
+def layout_polyline(telemetry: Optional[pd.DataFrame], max_points: int = LAYOUT_POINTS) -> List[List[float]]:
+    """Return the X/Y trace of a lap as at most max_points [x, y] pairs (every k-th sample)."""
+    if telemetry is None or 'X' not in telemetry.columns or 'Y' not in telemetry.columns:
+        return []
+    xy = telemetry[['X', 'Y']].to_numpy(dtype=float)
+    xy = xy[np.isfinite(xy).all(axis=1)]
+    step = max(1, -(-len(xy) // max_points))
+    return np.round(xy[::step], 1).tolist()
+
+
+def build_circuit_geometry(session: Any, telemetry: Optional[pd.DataFrame] = None) -> Dict[str, Any]:
+    """
+    Compute the geometry of a session's circuit.
+
+    Args:
+        session: Loaded FastF1 session
+        telemetry: Reference lap telemetry (default: the session's fastest lap)
+
+    Returns:
+        dict: {'circuit', 'year', 'source' ('circuit_info' or 'speed_minima'),
+            'corners' [{'number', 'letter', 'distance', 'x', 'y'}],
+            'marshal_sectors' [{'number', 'distance'}], 'rotation', 'layout' [[x, y], ...]}
+    """
+    circuit, year = circuit_key(session)
+    if telemetry is None:
+        telemetry = _reference_telemetry(session)
+    geometry = {'version': CIRCUIT_VERSION, 'circuit': circuit, 'year': year, 'source': 'circuit_info',
+                'corners': [], 'marshal_sectors': [], 'rotation': None, 'layout': layout_polyline(telemetry)}
+    try:
+        info = session.get_circuit_info()
+        geometry['corners'] = [c for c in _markers(info.corners, ['Letter', 'X', 'Y']) if c['distance'] is not None]
+        geometry['marshal_sectors'] = [m for m in _markers(info.marshal_sectors, []) if m['distance'] is not None]
+        geometry['rotation'] = _number(info.rotation)
+    except Exception as e:
+        logger.warning(f"No circuit info for {circuit} {year}: {e}")
+    if not geometry['corners'] and telemetry is not None and len(telemetry):
+        apexes = DriverPerformanceAnalyzer(telemetry).speed_minima()
+        geometry['source'] = 'speed_minima'
+        geometry['corners'] = [{'number': i + 1, 'letter': '', 'distance': round(d, 1), 'x': None, 'y': None}
+                               for i, d in enumerate(apexes)]
+    logger.info(f"Built circuit geometry for {circuit} {year}: {len(geometry['corners'])} corners "
+                f"({geometry['source']})")
+    return geometry
+
+
+def corner_distances(geometry: Dict[str, Any]) -> List[float]:
+    """Return the apex distances (m) of a geometry's corners, in track order."""
+    return [corner['distance'] for corner in geometry.get('corners', [])]
+
+
+def layout_array(geometry: Dict[str, Any]) -> Optional[np.ndarray]:
+    """Return a geometry's layout polyline as an N x 2 array, or None if it has none."""
+    layout = geometry.get('layout')
+    return np.asarray(layout, dtype=float) if layout else None
+
+
+class CircuitCache:
+    """
+    In-memory and on-disk cache of circuit geometry per (circuit, year).
+
+    Attributes:
+        root (Path): Root directory of the JSON files
+
+    Example Usage:
+        circuits = CircuitCache('cache/circuits')
+        apexes = corner_distances(circuits.get(session))
+    """
+
+    def __init__(self, root: Union[str, Path] = 'cache/circuits'):
+        self.root = Path(root)
+        self._lock = Lock()
+        self._memory: Dict[CircuitKey, Dict[str, Any]] = {}
+
+    def path_for(self, key: CircuitKey) -> Path:
+        """Return the JSON file holding the geometry for a (circuit, year) key."""
+        circuit, year = key
+        return self.root / f"v{CIRCUIT_VERSION}" / str(year) / f"{_slug(circuit)}.json"
+
+    def load(self, key: CircuitKey) -> Optional[Dict[str, Any]]:
+        """Return the cached geometry for a key (memory, then disk), or None."""
+        with self._lock:
+            geometry = self._memory.get(key)
+        if geometry is not None:
+            return geometry
+        path = self.path_for(key)
+        try:
+            geometry = json.loads(path.read_text())
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable circuit geometry {path}: {e}")
+            return None
+        with self._lock:
+            self._memory[key] = geometry
+        return geometry
+
+    def save(self, key: CircuitKey, geometry: Dict[str, Any]) -> Path:
+        """Persist a geometry (written to a temporary file and renamed into place)."""
+        path = self.path_for(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(f".{path.name}.{uuid.uuid4().hex[:8]}.tmp")
+        try:
+            tmp.write_text(json.dumps(geometry))
+            os.replace(tmp, path)
+        except OSError as e:
+            logger.warning(f"Could not persist circuit geometry to {path}: {e}")
+        finally:
+            if tmp.exists():
+                tmp.unlink()
+        with self._lock:
+            self._memory[key] = geometry
+        return path
+
+    def get(self, session: Any, telemetry: Optional[pd.DataFrame] = None) -> Dict[str, Any]:
+        """
+        Return the geometry of a session's circuit, building and storing it on a miss.
+
+        Args:
+            session: FastF1 session (only its event is read on a hit)
+            telemetry: Reference lap telemetry used on a miss (default: fastest lap)
+        """
+        key = circuit_key(session)
+        geometry = self.load(key)
+        if geometry is None:
+            geometry = build_circuit_geometry(session, telemetry)
+            self.save(key, geometry)
+        return geometry
@@ -0,0 +1,150 @@
+"""
+F1 CSV Streaming Module
+
+Chunked CSV export of lap telemetry.
+
+iter_csv() turns a telemetry frame into CSV text a few thousand rows at a
+time: each chunk is a slice of the original frame, with only that slice's Time
+column converted to seconds. No full copy of the frame is made. iter_laps_csv()
+chains many laps (all laps of a driver, or a whole session) into one CSV
+stream with Driver/LapNumber columns. Telemetry is extracted lap by lap while
+the stream is consumed, so memory stays bounded by one lap whatever the export
+size. The chunks can be written to a file (write_csv) or returned directly as
+a streaming HTTP response.
+
+Example Usage:
+    write_csv(iter_csv(telemetry), 'outputs/data/ver_monaco.csv')
+    for chunk in iter_laps_csv(loader, session.laps.pick_drivers(['VER'])):
+        response.write(chunk)
+"""
+
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, Optional, Union
+import io
+import logging
+import os
+import uuid
+
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+# Columns written for MATLAB (Time in seconds)
+EXPORT_COLUMNS = ['Time', 'Distance', 'Speed', 'Throttle', 'Brake', 'RPM', 'nGear', 'X', 'Y', 'Z']
+
+CHUNK_ROWS = 5000
+
+
+def _time_origin(time: pd.Series):
+    """Return the value Time is measured from (None for timedelta, which is already relative)."""
+    if pd.api.types.is_datetime64_any_dtype(time) and len(time):
+        return time.iloc[0]
+    return None
+
+
+def _time_seconds(time: pd.Series, origin) -> pd.Series:
+    if pd.api.types.is_timedelta64_dtype(time):
+        return time.dt.total_seconds()
+    if pd.api.types.is_datetime64_any_dtype(time):
+        return (time - origin).dt.total_seconds()
+    return time
+
+
+def iter_csv(telemetry: pd.DataFrame,
+             chunk_rows: int = CHUNK_ROWS,
+             header: bool = True,
+             prefix: Optional[Dict[str, Any]] = None,
+             columns: Optional[list] = None) -> Iterator[str]:
+    """
+    Yield a telemetry frame as CSV text in chunks of rows.
+
+    Args:
+        telemetry: Telemetry DataFrame (e.g. from F1DataLoader.get_telemetry())
+        chunk_rows: Rows per yielded chunk
+        header: Emit the header line with the first chunk
+        prefix: Constant leading columns added to every row (e.g. {'Driver': 'VER'})
+        columns: Channels to write (default: EXPORT_COLUMNS present in the frame);
+            channels missing from the frame are written empty
+
+    Yields:
+        str: CSV text (the header, if requested, is part of the first chunk)
+    """
+    if columns is None:
+        columns = [c for c in EXPORT_COLUMNS if c in telemetry.columns]
+    prefix = prefix or {}
+    origin = _time_origin(telemetry['Time']) if 'Time' in telemetry.columns else None
+    if len(telemetry) == 0 and header:
+        yield ','.join(list(prefix) + columns) + '\n'
+        return
+    for start in range(0, len(telemetry), chunk_rows):
+        part = {name: value for name, value in prefix.items()}
+        chunk = telemetry.iloc[start:start + chunk_rows]
+        for col in columns:
+            if col not in chunk.columns:
+                part[col] = None
+            else:
+                part[col] = _time_seconds(chunk[col], origin) if col == 'Time' else chunk[col]
+        buffer = io.StringIO()
+        pd.DataFrame(part, index=chunk.index, columns=list(prefix) + columns).to_csv(
+            buffer, index=False, header=header and start == 0)
+        yield buffer.getvalue()
+
+
+def iter_laps_csv(loader: Any,
+                  laps: Iterable,
+                  chunk_rows: int = CHUNK_ROWS,
+                  columns: Optional[list] = None) -> Iterator[str]:
+    """
+    Yield the telemetry of many laps as one CSV stream.
+
+    Every row is prefixed with Driver and LapNumber. Laps are extracted one at a
+    time with loader.get_telemetry() as the stream is consumed; laps without
+    telemetry are skipped.
+
+    Args:
+        loader: F1DataLoader used to extract (or read stored) telemetry
+        laps: FastF1 Laps frame or iterable of Lap objects
+        chunk_rows: Rows per yielded chunk
+        columns: Channels to write (default: EXPORT_COLUMNS)
+
+    Yields:
+        str: CSV text, starting with a single header line
+    """
+    columns = columns or EXPORT_COLUMNS
+    if hasattr(laps, 'iterlaps'):
+        laps = (lap for _, lap in laps.iterlaps())
+    yield ','.join(['Driver', 'LapNumber'] + columns) + '\n'
+    exported = 0
+    for lap in laps:
+        try:
+            telemetry = loader.get_telemetry(lap)
+        except Exception as e:
+            logger.warning(f"Skipping lap {lap['LapNumber']} of {lap['Driver']} in CSV export: {e}")
+            continue
+        prefix = {'Driver': lap['Driver'], 'LapNumber': int(lap['LapNumber'])}
+        yield from iter_csv(telemetry, chunk_rows, header=False, prefix=prefix, columns=columns)
+        exported += 1
+    logger.info(f"Streamed CSV for {exported} laps")
+
+
+def write_csv(chunks: Iterable[str], path: Union[str, Path]) -> Path:
+    """
+    Write CSV chunks to a file.
+
+    The file is written under a temporary name and renamed into place when
+    complete, so readers never see a partial export.
+
+    Returns:
+        Path: The written file
+    """
+    path = Path(path)
+    tmp = path.with_name(f".{path.name}.{uuid.uuid4().hex[:8]}.tmp")
+    try:
+        with open(tmp, 'w', newline='') as f:
+            for chunk in chunks:
+                f.write(chunk)
+        os.replace(tmp, path)
+    finally:
+        if tmp.exists():
+            tmp.unlink()
+    return path
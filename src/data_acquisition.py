@@ -18,14 +18,54 @@ Dependencies:
 import fastf1
 import pandas as pd
 import numpy as np
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional, Union, Literal
+from collections import OrderedDict
+from threading import Lock
+from typing import Iterable, List, Optional, Union, Literal
 import logging
+import os
+import weakref
+
+from .session_pool import SessionPool, make_session_key
+from .telemetry_store import TelemetryStore, lap_store_key
+from .session_summary import SessionSummaryStore, StoredSession
+from .session_index import SessionIndex
+from .batch_metrics import StackedTelemetry
+from .telemetry_schema import TELEMETRY_COLUMNS, apply_telemetry_schema
+from .csv_stream import iter_csv, write_csv
+from .mat_export import mat_name, write_mat
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Stored lap tables kept in memory by get_lap_session()
+STORED_SESSIONS = 8
+
+def clean_telemetry(telemetry: pd.DataFrame) -> pd.DataFrame:
+    """
+    Normalize raw FastF1 telemetry to the TELEMETRY_COLUMNS frame.
+    
+    Missing channels are added (NaN, or 0 for nGear) and numeric channels are
+    coerced to numbers with invalid values replaced by 0, then cast to the
+    compact TELEMETRY_DTYPES schema (see telemetry_schema.py).
+    """
+    df = pd.DataFrame(telemetry)
+    
+    # Ensure all expected columns are present
+    for col in TELEMETRY_COLUMNS:
+        if col not in df.columns:
+            df[col] = np.nan if col != 'nGear' else 0
+    
+    # Ensure proper data types for numeric columns
+    for col in TELEMETRY_COLUMNS[1:]:
+        # Convert boolean and other types to numeric, handle errors gracefully
+        df[col] = pd.to_numeric(df[col], errors='coerce').fillna(0)
+    
+    return apply_telemetry_schema(df[TELEMETRY_COLUMNS].reset_index(drop=True))
+
+
 # Create a class F1DataLoader that handles all F1 data acquisition
 class F1DataLoader:
     """
@@ -41,6 +81,10 @@ class F1DataLoader:
     Attributes:
         cache_dir (Path): Directory path for FastF1 cache storage
         session: Currently loaded FastF1 session object
+        pool (SessionPool): In-memory pool of loaded sessions keyed by
+            (year, event, session_type), shared by get_session()
+        telemetry_store (TelemetryStore): On-disk columnar cache of cleaned
+            lap telemetry used by get_telemetry() (None to disable)
         
     Example Usage:
         loader = F1DataLoader(cache_dir='cache')
@@ -50,14 +94,115 @@ class F1DataLoader:
         loader.export_to_csv(telemetry, 'verstappen_monaco_q.csv')
     """
     
-    def __init__(self, cache_dir: str = 'cache'):
+    def __init__(self,
+                 cache_dir: str = 'cache',
+                 pool: Optional[SessionPool] = None,
+                 use_telemetry_store: bool = True,
+                 use_session_summaries: bool = True):
         """
         Initialize F1DataLoader with caching enabled.
+        
+        Args:
+            cache_dir: Directory for the FastF1 cache
+            pool: Optional session pool to share between loaders
+                (a private pool is created if omitted)
+            use_telemetry_store: Persist cleaned lap telemetry under
+                cache_dir/telemetry and serve repeat requests from it
+            use_session_summaries: Serve session info and driver lists of
+                warmed sessions from cache_dir/sessions without loading them
         """
         self.cache_dir = Path(cache_dir)
         self.cache_dir.mkdir(parents=True, exist_ok=True)
         fastf1.Cache.enable_cache(str(self.cache_dir))
         self.session = None
+        self.pool = pool if pool is not None else SessionPool()
+        self.telemetry_store = TelemetryStore(self.cache_dir / 'telemetry') if use_telemetry_store else None
+        self.summary_store = SessionSummaryStore(self.cache_dir / 'sessions') if use_session_summaries else None
+        self._session_indexes = weakref.WeakKeyDictionary()
+        self._index_lock = Lock()
+        self._stored_sessions = OrderedDict()
+    
+    def get_session(self,
+                    year: int,
+                    race: Union[int, str],
+                    session_type: Literal['FP1', 'FP2', 'FP3', 'Q', 'S', 'R']) -> fastf1.core.Session:
+        """
+        Return a loaded session from the pool, loading it on a miss.
+        
+        Unlike load_session(), this does not change self.session, so it is
+        safe to call from concurrent web requests that each work on their
+        own session.
+        
+        Args:
+            year: Season year (e.g., 2024)
+            race: Race name or round number
+            session_type: Session identifier ('FP1', 'FP2', 'FP3', 'Q', 'S', 'R')
+        
+        Returns:
+            fastf1.core.Session: Loaded session object
+        
+        Raises:
+            ValueError: If session cannot be loaded or doesn't exist
+        """
+        if isinstance(race, str) and race.strip().isdigit():
+            race = int(race)
+        key = make_session_key(year, race, session_type)
+        return self.pool.get_or_load(key, lambda: self._load_fastf1_session(year, race, session_type))
+    
+    def get_lap_session(self,
+                        year: int,
+                        race: Union[int, str],
+                        session_type: Literal['FP1', 'FP2', 'FP3', 'Q', 'S', 'R']):
+        """
+        Return a session for lap selection, without loading it if it was warmed.
+        
+        A pooled session is returned as is. Otherwise, if the session's lap
+        table is in the summary store (see save_session_summary()), a
+        StoredSession built from it is returned: laps and their stored
+        telemetry are served from disk, and the session is loaded through
+        get_session() only when data beyond the lap table is needed.
+        Sessions without a stored lap table are loaded with get_session().
+        
+        Args:
+            year: Season year (e.g., 2024)
+            race: Race name or round number
+            session_type: Session identifier ('FP1', 'FP2', 'FP3', 'Q', 'S', 'R')
+        
+        Returns:
+            fastf1.core.Session or StoredSession
+        """
+        if isinstance(race, str) and race.strip().isdigit():
+            race = int(race)
+        key = make_session_key(year, race, session_type)
+        if key in self.pool or self.summary_store is None:
+            return self.get_session(year, race, session_type)
+        with self._index_lock:
+            stored = self._stored_sessions.get(key)
+            if stored is not None:
+                self._stored_sessions.move_to_end(key)
+                return stored
+        summary = self.summary_store.load(key)
+        laps = self.summary_store.load_laps(key) if summary is not None and 'event' in summary else None
+        if laps is None:
+            return self.get_session(year, race, session_type)
+        stored = StoredSession(key, summary, laps, load=lambda: self.get_session(year, race, session_type))
+        logger.info(f"Serving laps of {key} from the summary store")
+        with self._index_lock:
+            self._stored_sessions[key] = stored
+            while len(self._stored_sessions) > STORED_SESSIONS:
+                self._stored_sessions.popitem(last=False)
+        return stored
+    
+    def _load_fastf1_session(self, year, race, session_type) -> fastf1.core.Session:
+        try:
+            session = fastf1.get_session(year, race, session_type)
+            session.load()
+            self.session_index(session)
+            logger.info(f"Loaded session: {year} {race} {session_type}")
+            return session
+        except Exception as e:
+            logger.error(f"Failed to load session: {e}")
+            raise ValueError(f"Could not load session: {year} {race} {session_type}") from e
     
     def load_session(self, 
                      year: int, 
@@ -84,27 +229,19 @@ class F1DataLoader:
             ValueError: If session cannot be loaded or doesn't exist
             
         Implementation:
-            - Use fastf1.get_session() to fetch session
-            - Call session.load() to load all session data
+            - Fetch the session through get_session() (pooled)
             - Store session in self.session for later use
-            - Add logging for successful load
-            - Implement error handling for invalid sessions
             - Return the loaded session object
         """
-        try:
-            session = fastf1.get_session(year, race, session_type)
-            session.load()
-            self.session = session
-            logger.info(f"Loaded session: {year} {race} {session_type}")
-            return session
-        except Exception as e:
-            logger.error(f"Failed to load session: {e}")
-            raise ValueError(f"Could not load session: {year} {race} {session_type}") from e
+        session = self.get_session(year, race, session_type)
+        self.session = session
+        return session
     
     def get_driver_lap(self, 
                        driver_code: str, 
                        lap_type: Literal['fastest', 'first', 'last'] = 'fastest',
-                       lap_number: Optional[int] = None) -> fastf1.core.Lap:
+                       lap_number: Optional[int] = None,
+                       session: Optional[fastf1.core.Session] = None) -> fastf1.core.Lap:
         """
         Retrieve a specific lap for a driver from the loaded session.
         
@@ -115,6 +252,7 @@ class F1DataLoader:
                 'first'   - First completed lap
                 'last'    - Last completed lap
             lap_number: Specific lap number to retrieve (overrides lap_type)
+            session: Session to pick from (defaults to self.session)
         
         Returns:
             fastf1.core.Lap: Lap object containing lap data and telemetry
@@ -124,37 +262,42 @@ class F1DataLoader:
             
         Implementation:
             - Check if session is loaded, raise error if not
-            - Use session.laps.pick_driver() to filter driver laps
-            - If lap_number specified, use .pick_lap(lap_number)
-            - If lap_type is 'fastest', use .pick_fastest()
-            - If lap_type is 'first' or 'last', use appropriate indexing
+            - Look the lap up in the session's SessionIndex (built once per
+              session): by lap number if given, otherwise the precomputed
+              fastest (as pick_fastest()), first or last lap pointer
             - Verify lap is valid (not null, has telemetry)
             - Add logging with driver code and lap info
             - Return the lap object
         """
-        if self.session is None:
+        session = session if session is not None else self.session
+        if session is None:
             raise ValueError("No session loaded. Call load_session() first.")
         driver_code = driver_code.upper()
-        # Use pick_drivers (returns DataFrame) instead of deprecated pick_driver
-        laps = self.session.laps.pick_drivers([driver_code])
-        if laps.empty:
+        index = self.session_index(session)
+        if not index.has_driver(driver_code):
             logger.error(f"No laps found for driver {driver_code}")
             raise ValueError(f"Driver {driver_code} not found in session.")
-        lap = None
-        if lap_number is not None:
-            lap = laps.pick_lap(lap_number)
-        elif lap_type == 'fastest':
-            lap = laps.pick_fastest()
-        elif lap_type == 'first':
-            lap = laps.iloc[0] if len(laps) > 0 else None
-        elif lap_type == 'last':
-            lap = laps.iloc[-1] if len(laps) > 0 else None
+        lap = index.lap(driver_code, lap_type=lap_type, lap_number=lap_number)
         if lap is None or (hasattr(lap, 'empty') and lap.empty):
             logger.error(f"Lap not found for driver {driver_code} (lap_type={lap_type}, lap_number={lap_number})")
             raise ValueError(f"Lap not found for driver {driver_code}.")
         logger.info(f"Selected lap for {driver_code}: LapTime={lap['LapTime'] if 'LapTime' in lap else 'N/A'}")
         return lap
     
+    def session_index(self, session: fastf1.core.Session) -> SessionIndex:
+        """
+        Return the lap index of a session, building it on first use.
+        
+        Indexes are held per session object and dropped with the session, and
+        rebuilt if the session's lap table is replaced.
+        """
+        with self._index_lock:
+            index = self._session_indexes.get(session)
+            if index is None or index.laps is not session.laps:
+                index = SessionIndex(session.laps)
+                self._session_indexes[session] = index
+            return index
+    
     def get_telemetry(self, lap: fastf1.core.Lap) -> pd.DataFrame:
         """
         Extract telemetry data from a lap object.
@@ -174,37 +317,130 @@ class F1DataLoader:
                 - DRS: DRS status (0-14)
                 - X, Y, Z: Position coordinates (meters)
                 - Status: Session status
+                Channels use the compact TELEMETRY_DTYPES schema
+                (float32, int8 for nGear and DRS)
                 
         Implementation:
-            - Call lap.get_telemetry() to retrieve telemetry
-            - Verify telemetry data exists and is not empty
-            - Convert telemetry to pandas DataFrame if needed
-            - Ensure all expected channels are present
-            - Handle missing channels gracefully (fill with NaN or 0)
-            - Add logging with telemetry shape and available channels
+            - Serve the cleaned frame from the telemetry store if present
+            - Otherwise call lap.get_telemetry() and clean it with
+              clean_telemetry(), then persist it to the store
             - Return clean DataFrame
         """
+        key = lap_store_key(lap) if self.telemetry_store is not None else None
+        if key is not None:
+            cached = self.telemetry_store.load(key)
+            if cached is not None:
+                return cached
+        return self._extract_telemetry(lap, key)
+    
+    def _extract_telemetry(self, lap: fastf1.core.Lap, key) -> pd.DataFrame:
+        """Extract, clean and store telemetry for a lap that is not in the store."""
         telemetry = lap.get_telemetry()
         if telemetry is None or len(telemetry) == 0:
             logger.error("No telemetry data found for lap.")
             raise ValueError("No telemetry data found for lap.")
-        df = pd.DataFrame(telemetry)
+        df = clean_telemetry(telemetry)
+        logger.info(f"Telemetry shape: {df.shape}, columns: {df.columns.tolist()}")
+        if key is not None:
+            try:
+                self.telemetry_store.save(key, df)
+            except Exception as e:
+                logger.warning(f"Could not store telemetry for {key}: {e}")
+        return df
+    
+    def get_telemetry_many(self,
+                           laps: Union[fastf1.core.Laps, Iterable[fastf1.core.Lap]],
+                           max_workers: Optional[int] = None,
+                           skip_errors: bool = False) -> List[Optional[pd.DataFrame]]:
+        """
+        Extract telemetry for many laps concurrently.
         
-        # Ensure all expected columns are present
-        expected_cols = ['Time', 'Distance', 'Speed', 'Throttle', 'Brake', 'RPM', 'nGear', 'DRS', 'X', 'Y', 'Z']
-        for col in expected_cols:
-            if col not in df.columns:
-                df[col] = np.nan if col != 'nGear' else 0
+        Args:
+            laps: FastF1 Laps frame or iterable of Lap objects
+            max_workers: Maximum concurrent extractions (default: min(8, CPU count))
+            skip_errors: Return None for laps whose telemetry cannot be
+                extracted instead of raising
         
-        # Ensure proper data types for numeric columns
-        numeric_cols = ['Distance', 'Speed', 'Throttle', 'Brake', 'RPM', 'nGear', 'DRS', 'X', 'Y', 'Z']
-        for col in numeric_cols:
-            if col in df.columns:
-                # Convert boolean and other types to numeric, handle errors gracefully
-                df[col] = pd.to_numeric(df[col], errors='coerce').fillna(0)
+        Returns:
+            list: One cleaned telemetry DataFrame per lap (see get_telemetry()),
+                in the same order as laps
         
-        logger.info(f"Telemetry shape: {df.shape}, columns: {df.columns.tolist()}")
-        return df[expected_cols]
+        Raises:
+            ValueError: If a lap has no telemetry and skip_errors is False
+            
+        Implementation:
+            - Serve laps already in the telemetry store directly
+            - Fan the remaining laps out over a bounded thread pool, each
+              running lap.get_telemetry() and clean_telemetry() and storing
+              the result
+            - Threads rather than processes: a Lap carries its whole session,
+              which would have to be pickled to every worker process
+        """
+        if hasattr(laps, 'iterlaps'):
+            laps = [lap for _, lap in laps.iterlaps()]
+        else:
+            laps = list(laps)
+        results = [None] * len(laps)
+        pending = []
+        for i, lap in enumerate(laps):
+            key = lap_store_key(lap) if self.telemetry_store is not None else None
+            cached = self.telemetry_store.load(key) if key is not None else None
+            if cached is not None:
+                results[i] = cached
+            else:
+                pending.append((i, lap, key))
+        if not pending:
+            return results
+        
+        workers = max(1, min(max_workers or min(8, os.cpu_count() or 1), len(pending)))
+        logger.info(f"Extracting telemetry for {len(pending)} laps with {workers} workers "
+                    f"({len(laps) - len(pending)} served from store)")
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix='f1-telemetry') as executor:
+            futures = [executor.submit(self._extract_telemetry, lap, key) for _, lap, key in pending]
+            for (i, lap, _), future in zip(pending, futures):
+                try:
+                    results[i] = future.result()
+                except Exception as e:
+                    if not skip_errors:
+                        for f in futures:
+                            f.cancel()
+                        raise
+                    logger.warning(f"Skipping lap {lap['LapNumber']} of {lap['Driver']}: {e}")
+        return results
+    
+    def stack_session_telemetry(self,
+                                session: Optional[fastf1.core.Session] = None,
+                                drivers: Optional[list] = None,
+                                max_workers: Optional[int] = None) -> StackedTelemetry:
+        """
+        Extract telemetry for every lap of the given drivers and stack it.
+        
+        Args:
+            session: Session to read laps from (defaults to self.session)
+            drivers: Driver codes to include (default: all drivers)
+            max_workers: Maximum concurrent extractions (see get_telemetry_many())
+        
+        Returns:
+            StackedTelemetry: Contiguous telemetry keyed by (driver, lap_number),
+                ready for compute_batch_metrics()
+        
+        Implementation:
+            - Select laps with pick_drivers() when drivers are given
+            - Extract all laps with get_telemetry_many(), skipping laps without telemetry
+            - Stack the frames into one array per channel
+        """
+        session = session if session is not None else self.session
+        if session is None:
+            raise ValueError("No session loaded. Call load_session() first.")
+        laps = session.laps
+        if drivers:
+            laps = laps.pick_drivers([d.upper() for d in drivers])
+        lap_list = [lap for _, lap in laps.iterlaps()]
+        telemetry = self.get_telemetry_many(lap_list, max_workers=max_workers, skip_errors=True)
+        frames = [((lap['Driver'], int(lap['LapNumber'])), df)
+                  for lap, df in zip(lap_list, telemetry) if df is not None]
+        logger.info(f"Stacked telemetry for {len(frames)} laps")
+        return StackedTelemetry.from_frames(frames)
     
     def export_to_csv(self, 
                       telemetry: pd.DataFrame, 
@@ -224,9 +460,10 @@ class F1DataLoader:
         Implementation:
             - Create output directory if it doesn't exist
             - Construct full output path using Path
-            - Convert Time column to seconds if it's datetime
             - Select relevant columns for MATLAB:
               Time, Distance, Speed, Throttle, Brake, RPM, nGear, X, Y, Z
+            - Stream rows to the file in chunks (csv_stream.iter_csv),
+              converting Time to seconds per chunk
             - Export to CSV with headers, no index
             - Add logging with file path and size
             - Return Path object of exported file
@@ -240,22 +477,79 @@ class F1DataLoader:
         output_path = Path(output_dir)
         output_path.mkdir(parents=True, exist_ok=True)
         full_path = output_path / filename
-        df = telemetry.copy()
-        # Convert Time to seconds if it's a datetime or timedelta
-        if pd.api.types.is_timedelta64_dtype(df['Time']):
-            df['Time'] = df['Time'].dt.total_seconds()
-        elif pd.api.types.is_datetime64_any_dtype(df['Time']):
-            df['Time'] = (df['Time'] - df['Time'].iloc[0]).dt.total_seconds()
-        # Select only relevant columns
+        # Stream the relevant columns in chunks (Time converted to seconds per
+        # chunk) instead of converting a full copy of the frame
         cols = ['Time', 'Distance', 'Speed', 'Throttle', 'Brake', 'RPM', 'nGear', 'X', 'Y', 'Z']
-        df = df[cols]
-        df.to_csv(full_path, index=False)
+        write_csv(iter_csv(apply_telemetry_schema(telemetry), columns=cols), full_path)
         logger.info(f"Exported telemetry to {full_path} ({full_path.stat().st_size} bytes)")
         return full_path
     
-    def get_session_info(self) -> dict:
+    def export_to_mat(self,
+                      laps: Union[fastf1.core.Laps, Iterable[fastf1.core.Lap], dict],
+                      filename: str,
+                      output_dir: str = 'outputs/data',
+                      max_workers: Optional[int] = None) -> Path:
+        """
+        Export the telemetry of one or more laps to a compressed MATLAB .mat file.
+        
+        Args:
+            laps: FastF1 Laps frame or iterable of Lap objects, or a dict of
+                session label -> laps for a multi-session export
+            filename: Output filename (e.g., 'verstappen_monaco.mat')
+            output_dir: Directory for output files (default: 'outputs/data')
+            max_workers: Maximum concurrent telemetry extractions
+        
+        Returns:
+            Path: Full path to the exported MAT-file
+            
+        Implementation:
+            - Extract telemetry for all laps with get_telemetry_many(),
+              skipping laps without telemetry
+            - Nest one struct per lap (channel arrays in schema dtypes, Time
+              in seconds) under its driver: data.VER.lap_12.Speed, with an
+              extra session level for multi-session exports
+            - Add a 'laps' index table (Session, Driver, LapNumber, LapTime)
+            - Write with mat_export.write_mat() (zlib-compressed MAT v5)
+        """
+        groups = laps if isinstance(laps, dict) else {None: laps}
+        tree = {}
+        index = []
+        for label, session_laps in groups.items():
+            if hasattr(session_laps, 'iterlaps'):
+                session_laps = [lap for _, lap in session_laps.iterlaps()]
+            else:
+                session_laps = list(session_laps)
+            telemetries = self.get_telemetry_many(session_laps, max_workers=max_workers, skip_errors=True)
+            node = tree if label is None else tree.setdefault(mat_name(label), {})
+            for lap, telemetry in zip(session_laps, telemetries):
+                if telemetry is None:
+                    continue
+                driver = mat_name(lap['Driver'])
+                field = mat_name(f"lap_{int(lap['LapNumber'])}")
+                node.setdefault(driver, {})[field] = telemetry
+                lap_time = lap.get('LapTime', pd.NaT)
+                index.append({
+                    'Session': '' if label is None else str(label),
+                    'Driver': str(lap['Driver']),
+                    'LapNumber': int(lap['LapNumber']),
+                    'LapTime': lap_time.total_seconds() if pd.notna(lap_time) else np.nan,
+                    'Field': f"{'' if label is None else mat_name(label) + '.'}{driver}.{field}",
+                })
+        if not index:
+            raise ValueError("No lap telemetry to export")
+        
+        output_path = Path(output_dir)
+        output_path.mkdir(parents=True, exist_ok=True)
+        full_path = write_mat(tree, output_path / filename, index=pd.DataFrame(index))
+        logger.info(f"Exported {len(index)} laps to {full_path} ({full_path.stat().st_size} bytes)")
+        return full_path
+    
+    def get_session_info(self, session: Optional[fastf1.core.Session] = None) -> dict:
         """
-        Get metadata about the currently loaded session.
+        Get metadata about the currently loaded session (or the given one).
+        
+        Args:
+            session: Session to describe (defaults to self.session)
         
         Returns:
             dict: Session information including:
@@ -274,55 +568,120 @@ class F1DataLoader:
             - Compile information into dictionary
             - Return session info dict
         """
-        if self.session is None:
+        session = session if session is not None else self.session
+        if session is None:
             return None
         info = {
-            'year': self.session.event['Year'] if 'Year' in self.session.event else None,
-            'race': self.session.event['EventName'] if 'EventName' in self.session.event else None,
-            'session_type': self.session.name if hasattr(self.session, 'name') else None,
-            'date': self.session.date if hasattr(self.session, 'date') else None,
-            'weather': getattr(self.session, 'weather', None),
-            'track_length': getattr(self.session, 'trackLength', None),
-            'drivers': sorted(self.session.laps['Driver'].unique()) if hasattr(self.session, 'laps') and not self.session.laps.empty else [],
+            'year': session.event['Year'] if 'Year' in session.event else None,
+            'race': session.event['EventName'] if 'EventName' in session.event else None,
+            'session_type': session.name if hasattr(session, 'name') else None,
+            'date': session.date if hasattr(session, 'date') else None,
+            'weather': getattr(session, 'weather', None),
+            'track_length': getattr(session, 'trackLength', None),
+            'drivers': sorted(session.laps['Driver'].unique()) if hasattr(session, 'laps') and not session.laps.empty else [],
         }
         return info
     
-    def get_all_drivers(self) -> list:
+    def get_session_summary(self,
+                            year: int,
+                            race: Union[int, str],
+                            session_type: str) -> Optional[dict]:
+        """
+        Return the stored summary of a session without loading it.
+        
+        Args:
+            year: Season year (e.g., 2024)
+            race: Race name or round number, as passed to get_session()
+            session_type: Session identifier ('FP1', 'FP2', 'FP3', 'Q', 'S', 'R')
+        
+        Returns:
+            dict or None: {'session_info': ..., 'drivers': [...], 'n_laps': int}
+                if the session was summarized (see save_session_summary())
+        """
+        if self.summary_store is None:
+            return None
+        return self.summary_store.load(make_session_key(year, race, session_type))
+    
+    def save_session_summary(self,
+                             session: fastf1.core.Session,
+                             keys: Iterable[tuple]) -> Optional[dict]:
+        """
+        Persist the lap table, driver list, lap count and info of a loaded session.
+        
+        The lap table is written once, under the first key; the summaries of
+        the other keys link to it (see SessionSummaryStore.load_laps()).
+        
+        Args:
+            session: Loaded session
+            keys: (year, race, session_type) tuples the summary should be
+                found under (e.g. both the round number and the event name)
+        
+        Returns:
+            dict or None: The stored summary (None if summaries are disabled)
+        """
+        if self.summary_store is None:
+            return None
+        keys = [make_session_key(*key) for key in keys]
+        if not keys:
+            return None
+        event = session.event
+        summary = {
+            'session_info': self.get_session_info(session),
+            'event': {
+                'year': int(event.year),
+                'EventName': str(event.get('EventName', '')),
+                'Location': str(event.get('Location', '')),
+                'Country': str(event.get('Country', '')),
+                'RoundNumber': int(event.get('RoundNumber', 0) or 0),
+            },
+            'drivers': self.get_all_drivers(session) or [],
+            'n_laps': int(len(session.laps)),
+            'laps_key': list(keys[0]),
+        }
+        self.summary_store.save_laps(keys[0], session.laps)
+        for key in keys:
+            self.summary_store.save(key, summary)
+        return summary
+    
+    def get_all_drivers(self, session: Optional[fastf1.core.Session] = None) -> list:
         """
-        Get list of all driver codes in the current session.
+        Get list of all driver codes in the current session (or the given one).
+        
+        Args:
+            session: Session to list drivers from (defaults to self.session)
         
         Returns:
             list: List of three-letter driver codes
             
         Implementation:
-            - Extract unique driver codes from session.laps
-            - Sort alphabetically
+            - Take the sorted driver codes from the session's SessionIndex
             - Return as list
         """
-        if self.session is None or not hasattr(self.session, 'laps') or self.session.laps.empty:
+        session = session if session is not None else self.session
+        if session is None or not hasattr(session, 'laps') or session.laps.empty:
             return None
-        drivers = sorted(self.session.laps['Driver'].unique())
-        return drivers
+        return list(self.session_index(session).drivers)
     
-    def validate_driver_code(self, driver_code: str) -> bool:
+    def validate_driver_code(self, driver_code: str, session: Optional[fastf1.core.Session] = None) -> bool:
         """
-        Validate if a driver code exists in the current session.
+        Validate if a driver code exists in the current session (or the given one).
         
         Args:
             driver_code: Three-letter driver code to validate
+            session: Session to check (defaults to self.session)
             
         Returns:
             bool: True if driver exists, False otherwise
             
         Implementation:
-            - Get list of drivers in session
-            - Check if driver_code exists in list (case-insensitive)
+            - Look driver_code up in the session's SessionIndex driver set
+              (case-insensitive)
             - Return boolean result
         """
-        drivers = self.get_all_drivers()
-        if not drivers:
+        session = session if session is not None else self.session
+        if session is None or not hasattr(session, 'laps') or session.laps.empty:
             return False
-        return driver_code.upper() in [d.upper() for d in drivers]
+        return self.session_index(session).has_driver(driver_code)
 
 
 # Example usage demonstrating the complete workflow
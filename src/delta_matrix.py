@@ -0,0 +1,102 @@
+"""
+F1 Delta Matrix Module
+
+All-pairs time-delta analysis for a session.
+
+Every driver's chosen lap (fastest by default) is resampled onto one shared
+distance grid (see resampling.py), giving a stacked (drivers x grid) array of
+elapsed time. The cumulative time-delta curve of every pair of drivers is then
+a single broadcasted subtraction, T[:, None, :] - T[None, :, :], instead of one
+plot_speed_delta-style comparison per pair (190 for a 20-car grid).
+
+Example Usage:
+    matrix = compute_delta_matrix({'VER': tel_ver, 'HAM': tel_ham, 'LEC': tel_lec})
+    print(matrix.final_gaps())        # seconds, row driver minus column driver
+    print(matrix.ranking())
+"""
+
+from typing import Dict, Hashable, List, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+
+from .resampling import DEFAULT_GRID_POINTS, LapResampler, resample_laps
+
+
+class DeltaMatrix:
+    """
+    Cumulative time deltas between every pair of drivers.
+
+    Attributes:
+        drivers (list): Driver labels, in row/column order
+        grid (np.ndarray): Shared distances, shape (G,)
+        times (np.ndarray): Elapsed time since the start of the grid per driver, shape (N, G)
+        curves (np.ndarray): curves[i, j] = times[i] - times[j], shape (N, N, G);
+            positive means driver i is behind driver j at that distance
+    """
+
+    def __init__(self, drivers: List[str], grid: np.ndarray, times: np.ndarray):
+        self.drivers = list(drivers)
+        self.grid = grid
+        self.times = times
+        self.curves = times[:, None, :] - times[None, :, :]
+
+    def __len__(self) -> int:
+        return len(self.drivers)
+
+    def pair(self, driver1: str, driver2: str) -> np.ndarray:
+        """Return the cumulative time delta of driver1 minus driver2 along the grid."""
+        return self.curves[self.drivers.index(driver1), self.drivers.index(driver2)]
+
+    def final_gaps(self) -> pd.DataFrame:
+        """Return the gap at the end of the grid (seconds) as a drivers x drivers frame."""
+        return pd.DataFrame(self.curves[:, :, -1], index=self.drivers, columns=self.drivers)
+
+    def ranking(self) -> pd.DataFrame:
+        """
+        Rank drivers by elapsed time over the common distance range.
+
+        Returns:
+            pd.DataFrame: Columns Position, Driver, time (s over the grid),
+                gap_to_best (s) and mean_gap (average gap to every other driver)
+        """
+        total = self.times[:, -1]
+        n = len(self.drivers)
+        gaps = self.curves[:, :, -1]
+        mean_gap = gaps.sum(axis=1) / max(n - 1, 1)
+        order = np.argsort(total, kind='stable')
+        return pd.DataFrame({
+            'Position': np.arange(1, n + 1),
+            'Driver': [self.drivers[i] for i in order],
+            'time': total[order],
+            'gap_to_best': total[order] - total[order[0]],
+            'mean_gap': mean_gap[order],
+        })
+
+
+def compute_delta_matrix(telemetries: Dict[str, pd.DataFrame], n_points: int = DEFAULT_GRID_POINTS,
+                         keys: Optional[Sequence[Optional[Hashable]]] = None,
+                         resampler: Optional[LapResampler] = None) -> DeltaMatrix:
+    """
+    Compute the all-pairs time-delta matrix for one lap per driver.
+
+    Args:
+        telemetries: Driver label -> lap telemetry (with Distance and Time)
+        n_points: Number of distance grid points
+        keys: Optional resampling cache key per lap, in telemetries order
+        resampler: LapResampler to use (default: the shared resampling cache)
+
+    Returns:
+        DeltaMatrix: Curves for every pair over the distance range all laps cover
+
+    Raises:
+        ValueError: If fewer than two laps are given
+    """
+    if len(telemetries) < 2:
+        raise ValueError("At least two drivers are needed for a delta matrix")
+    drivers = list(telemetries)
+    laps = resample_laps([telemetries[d] for d in drivers], columns=['Time'], keys=keys, n_points=n_points,
+                         resampler=resampler)
+    times = laps.channel('Time')
+    times = times - times[:, :1]  # Elapsed time from the start of the common range
+    return DeltaMatrix(drivers, laps.grid, times)
@@ -0,0 +1,175 @@
+"""
+F1 Telemetry Downsampling Module
+
+Shape-preserving decimation of telemetry series for plotting and API payloads.
+
+Plot and transfer cost grows with the number of samples drawn, while a chart
+is only a few hundred to a few thousand pixels wide. These helpers reduce a
+series to a target point count while keeping the features that matter in
+telemetry (braking spikes, speed minima, gear changes):
+
+- lttb_indices: Largest-Triangle-Three-Buckets, keeps the visually most
+  significant point of each bucket
+- minmax_indices: keeps the minimum and maximum of each bucket, so every
+  extreme value survives exactly
+- downsample_indices / downsample_frame: the union of per-channel selections,
+  so peaks survive in every plotted channel
+
+All functions return sorted row indices, so the caller can take the same rows
+from any other column (e.g. DRS flags, X/Y) that belongs with the series.
+
+Example Usage:
+    small = downsample_frame(telemetry, 1000, columns=['Speed', 'Throttle', 'Brake'])
+"""
+
+from typing import List, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+
+DOWNSAMPLING_METHODS = ['lttb', 'minmax']
+
+
+def _as_float(values) -> np.ndarray:
+    return np.asarray(values, dtype=float)
+
+
+def lttb_indices(x, y, n_out: int) -> np.ndarray:
+    """
+    Select n_out points of (x, y) with the Largest-Triangle-Three-Buckets algorithm.
+
+    The first and last points are always kept. The samples in between are split
+    into n_out - 2 buckets and from each bucket the point forming the largest
+    triangle with the previously selected point and the mean of the next bucket
+    is kept.
+
+    Args:
+        x: Monotonic x values (e.g. Distance)
+        y: Values to preserve the shape of
+        n_out: Target number of points
+
+    Returns:
+        np.ndarray: Sorted indices into x/y (all indices if len(y) <= n_out)
+    """
+    x = _as_float(x)
+    y = _as_float(y)
+    n = len(y)
+    if n_out >= n or n_out < 3:
+        return np.arange(n)
+    n_buckets = n_out - 2
+    bounds = np.append(np.linspace(1, n - 1, n_buckets + 1).astype(np.intp), n)
+    starts, stops = bounds[:-2], bounds[1:-1]
+
+    # Mean of the following bucket (the last bucket is followed by the last point)
+    valid = ~np.isnan(y)
+    next_x = np.add.reduceat(x, bounds[1:-1]) / np.diff(bounds[1:])
+    with np.errstate(invalid='ignore', divide='ignore'):
+        next_y = np.add.reduceat(np.where(valid, y, 0.0), bounds[1:-1]) / np.add.reduceat(valid, bounds[1:-1])
+
+    # Candidates of every bucket as a padded 2-D array. The triangle area with the
+    # previously selected point (xa, ya) is |xa * p + ya * q + r|, so only the
+    # (inherently sequential) choice of that point is left to the loop below.
+    width = int((stops - starts).max())
+    rows = starts[:, None] + np.arange(width)
+    inside = rows < stops[:, None]
+    rows = np.where(inside, rows, stops[:, None] - 1)
+    cand_x, cand_y = x[rows], y[rows]
+    p = cand_y - next_y[:, None]
+    q = next_x[:, None] - cand_x
+    r = cand_x * next_y[:, None] - next_x[:, None] * cand_y
+    usable = inside & ~np.isnan(p)
+
+    out = np.empty(n_out, dtype=np.intp)
+    out[0], out[-1] = 0, n - 1
+    a = 0
+    for i in range(n_buckets):
+        xa, ya = x[a], y[a]
+        if np.isnan(ya):
+            ya = 0.0
+        area = np.abs(xa * p[i] + ya * q[i] + r[i])
+        a = rows[i, np.argmax(np.where(usable[i], area, -1.0))]
+        out[i + 1] = a
+    return out
+
+
+def minmax_indices(y, n_out: int) -> np.ndarray:
+    """
+    Select the minimum and maximum of each bucket of y (plus the first and last point).
+
+    Every local extreme at bucket resolution is kept exactly, which makes this
+    the safest choice for peak-sensitive channels like Brake.
+
+    Args:
+        y: Values to preserve the extremes of
+        n_out: Maximum number of points
+
+    Returns:
+        np.ndarray: Sorted indices into y (all indices if len(y) <= n_out)
+    """
+    y = _as_float(y)
+    n = len(y)
+    if n_out >= n or n_out < 4:
+        return np.arange(n)
+    n_buckets = (n_out - 2) // 2
+    bounds = np.linspace(0, n, n_buckets + 1).astype(np.intp)
+    bucket = np.repeat(np.arange(n_buckets), np.diff(bounds))
+    nan = np.isnan(y)
+    # Within each bucket (contiguous after sorting by bucket), the first row is the minimum
+    by_min = np.lexsort((np.where(nan, np.inf, y), bucket))
+    by_max = np.lexsort((np.where(nan, -np.inf, y), bucket))
+    mins = by_min[bounds[:-1]]
+    maxs = by_max[bounds[1:] - 1]
+    return np.unique(np.concatenate(([0, n - 1], mins, maxs)))
+
+
+def downsample_indices(x, channels: Sequence, n_out: int, method: str = 'lttb') -> np.ndarray:
+    """
+    Select rows that preserve the shape of several channels sharing one x axis.
+
+    The point budget is split between channels and the per-channel selections
+    are merged, so the result has at most about n_out rows and keeps the
+    features of every channel.
+
+    Args:
+        x: Shared x values (e.g. Distance)
+        channels: Sequence of y arrays, one per channel
+        n_out: Target number of points
+        method: 'lttb' or 'minmax'
+
+    Returns:
+        np.ndarray: Sorted row indices
+    """
+    if method not in DOWNSAMPLING_METHODS:
+        raise ValueError(f"Unknown downsampling method: {method} (expected one of {DOWNSAMPLING_METHODS})")
+    n = len(x)
+    if n <= n_out or not len(channels):
+        return np.arange(n)
+    budget = max(4, n_out // len(channels))
+    selected = [lttb_indices(x, y, budget) if method == 'lttb' else minmax_indices(y, budget) for y in channels]
+    return np.unique(np.concatenate(selected))
+
+
+def downsample_frame(telemetry: pd.DataFrame, n_out: int, x: str = 'Distance', columns: Optional[List[str]] = None,
+                     method: str = 'lttb') -> pd.DataFrame:
+    """
+    Return the rows of a telemetry frame that preserve the shape of the given columns.
+
+    Args:
+        telemetry: Telemetry DataFrame
+        n_out: Target number of rows
+        x: Column used as the shared x axis (falls back to the row number if missing)
+        columns: Channels whose shape must be preserved (default: all numeric columns except x)
+        method: 'lttb' or 'minmax'
+
+    Returns:
+        pd.DataFrame: Subset of telemetry rows (the frame itself if it is already small enough)
+    """
+    if len(telemetry) <= n_out:
+        return telemetry
+    if columns is None:
+        columns = [c for c in telemetry.select_dtypes(include='number').columns if c != x]
+    columns = [c for c in columns if c in telemetry]
+    x_values = telemetry[x].to_numpy(dtype=float) if x in telemetry else np.arange(len(telemetry), dtype=float)
+    channels = [pd.to_numeric(telemetry[c], errors='coerce').to_numpy(dtype=float) for c in columns]
+    idx = downsample_indices(x_values, channels, n_out, method)
+    return telemetry.iloc[idx]
@@ -0,0 +1,101 @@
+"""
+F1 HTTP Cache Module
+
+Validators and Cache-Control policies for the web application's read-only
+responses.
+
+Read-only endpoints return deterministic content for a given request, so a
+hash of the response body is a strong ETag. conditional_json() serializes a
+payload canonically (sorted keys, compact separators), tags it with its
+SHA-1, and lets Werkzeug answer a matching If-None-Match with an empty
+304 Not Modified. Browsers and the reverse proxy then revalidate instead of
+downloading the body again. file_etag() does the same for files on disk,
+hashing each file once per (size, mtime).
+
+Cache-Control policies:
+- IMMUTABLE: content-addressed files (static/plots/<hash>.png never change)
+- REVALIDATE: reusable, but always revalidated with the ETag
+- NO_STORE: volatile state such as background job status
+
+Example Usage:
+    return conditional_json({'success': True, 'drivers': drivers}, cache_control=REVALIDATE)
+"""
+
+from pathlib import Path
+from threading import Lock
+from typing import Any, Dict, Optional, Tuple, Union
+import hashlib
+import json
+
+from flask import Response, request
+
+IMMUTABLE = 'public, max-age=31536000, immutable'
+REVALIDATE = 'public, no-cache'
+NO_STORE = 'no-store'
+
+_file_etags: Dict[Tuple[str, int, int], str] = {}
+_file_etags_lock = Lock()
+_MAX_FILE_ETAGS = 4096
+
+
+def content_etag(body: bytes) -> str:
+    """Return the strong ETag (SHA-1 hex digest) of a response body."""
+    return hashlib.sha1(body).hexdigest()
+
+
+def conditional_response(body: bytes,
+                         mimetype: str = 'application/json',
+                         etag: Optional[str] = None,
+                         cache_control: str = REVALIDATE) -> Response:
+    """
+    Build a response tagged with a content ETag, answering If-None-Match with a 304.
+
+    Args:
+        body: Response body
+        mimetype: Content type
+        etag: Precomputed ETag of body (default: content_etag(body))
+        cache_control: Cache-Control header value
+
+    Returns:
+        Response: 200 with the body, or 304 without it if the client's copy is current
+    """
+    response = Response(body, mimetype=mimetype)
+    response.set_etag(etag or content_etag(body))
+    response.headers['Cache-Control'] = cache_control
+    return response.make_conditional(request)
+
+
+def json_body(payload: Any) -> bytes:
+    """Serialize a payload canonically, so equal payloads give equal bytes (and ETags)."""
+    return json.dumps(payload, sort_keys=True, separators=(',', ':'), default=str).encode('utf-8')
+
+
+def conditional_json(payload: Any, cache_control: str = REVALIDATE) -> Response:
+    """Return payload as a JSON response with a content ETag (see conditional_response())."""
+    return conditional_response(json_body(payload), cache_control=cache_control)
+
+
+def file_etag(path: Union[str, Path]) -> str:
+    """
+    Return the content hash of a file, memoized per (path, size, mtime).
+
+    Raises:
+        OSError: If the file cannot be read
+    """
+    path = Path(path)
+    stat = path.stat()
+    key = (str(path.resolve()), stat.st_size, stat.st_mtime_ns)
+    with _file_etags_lock:
+        etag = _file_etags.get(key)
+    if etag is not None:
+        return etag
+    digest = hashlib.sha1()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1024 * 1024), b''):
+            digest.update(block)
+    etag = digest.hexdigest()
+    with _file_etags_lock:
+        if len(_file_etags) >= _MAX_FILE_ETAGS:
+            _file_etags.clear()
+        _file_etags[key] = etag
+    return etag
@@ -0,0 +1,218 @@
+"""
+F1 Incremental Metrics Module
+
+This module provides the IncrementalAnalyzer class, a chunk-at-a-time version
+of the DriverPerformanceAnalyzer throttle and braking metrics for replayed or
+live telemetry.
+
+DriverPerformanceAnalyzer recomputes every metric over the whole frame, so a
+feed that appends samples and asks for fresh metrics rescans an ever-growing
+frame on each update. IncrementalAnalyzer instead keeps running sums of the
+per-sample terms of each metric:
+
+- full_throttle_percentage: samples with Throttle > 95
+- coasting_time_percentage: samples with Throttle < 5 and Brake < 5
+- throttle_smoothness: |change of Throttle| between consecutive samples
+
+Each update costs O(chunk). With a window, the per-sample terms are kept in a
+fixed-size ring buffer and the terms of samples leaving the window are
+subtracted again, so metrics cover the last `window` samples only. Braking
+zones are detected per chunk with edge detection. A zone still open at the
+end of a chunk is carried over and completed by a later chunk.
+
+Metrics over the window equal DriverPerformanceAnalyzer's metrics on a frame
+holding the same samples.
+
+Example Usage:
+    live = IncrementalAnalyzer(window=2000)
+    for chunk in feed:
+        metrics = live.update(chunk)
+        print(metrics['full_throttle_percentage'], metrics['braking_zones'])
+"""
+
+from collections import deque
+from typing import Any, Dict, Optional
+
+import numpy as np
+import pandas as pd
+
+from .performance_metrics import _segment_reduce, default_brake_threshold
+from .resampling import channel_values
+
+
+class RollingSums:
+    """
+    Column sums over the last `window` rows pushed (all rows if window is None).
+
+    Attributes:
+        window (int or None): Number of most recent rows covered
+        sums (np.ndarray): Per-column sums over the covered rows
+        count (int): Number of covered rows
+        total (int): Number of rows pushed so far
+    """
+
+    def __init__(self, n_columns: int, window: Optional[int] = None):
+        if window is not None and window < 1:
+            raise ValueError("window must be a positive number of samples")
+        self.window = window
+        self.sums = np.zeros(n_columns)
+        self.count = 0
+        self.total = 0
+        self._ring = np.zeros((window, n_columns)) if window is not None else None
+
+    def push(self, rows: np.ndarray) -> None:
+        """Add rows (n x n_columns) and drop the rows that leave the window."""
+        n = len(rows)
+        if self._ring is not None and n:
+            if n >= self.window:
+                # The chunk replaces the whole window
+                self._ring[(self.total + np.arange(n - self.window, n)) % self.window] = rows[-self.window:]
+                self.sums = rows[-self.window:].sum(axis=0)
+            else:
+                slots = (self.total + np.arange(n)) % self.window
+                occupied = self.total + np.arange(n) >= self.window
+                self.sums = self.sums - self._ring[slots[occupied]].sum(axis=0) + rows.sum(axis=0)
+                self._ring[slots] = rows
+        elif n:
+            self.sums = self.sums + rows.sum(axis=0)
+        self.total += n
+        self.count = self.total if self.window is None else min(self.total, self.window)
+
+    def oldest(self) -> Optional[np.ndarray]:
+        """Return the oldest covered row (None without a window or rows)."""
+        if self._ring is None or not self.count:
+            return None
+        return self._ring[self.total % self.window if self.total >= self.window else 0]
+
+
+class IncrementalAnalyzer:
+    """
+    Throttle and braking metrics updated chunk by chunk.
+
+    Attributes:
+        window (int or None): Samples covered by the metrics (None: everything seen)
+        brake_threshold (float or None): Brake value above which a sample counts as
+            braking; None chooses it from the Brake scale of the first chunk that
+            brakes (see performance_metrics.default_brake_threshold)
+        samples (int): Samples received so far
+
+    Example Usage:
+        live = IncrementalAnalyzer(window=1000)
+        live.update(telemetry.iloc[:250])
+        live.update(telemetry.iloc[250:500])
+        live.zones()    # completed braking zones in the window
+    """
+
+    def __init__(self, window: Optional[int] = None, brake_threshold: Optional[float] = None):
+        self.window = window
+        self.brake_threshold = brake_threshold
+        # Per-sample terms: full throttle, coasting, |throttle change|
+        self._sums = RollingSums(3, window)
+        self._last_throttle = np.nan
+        self._last_distance = np.nan
+        self._open_zone: Optional[Dict[str, Any]] = None
+        self._zones: deque = deque()
+
+    @property
+    def samples(self) -> int:
+        return self._sums.total
+
+    def update(self, chunk: pd.DataFrame) -> Dict[str, Any]:
+        """
+        Add a chunk of telemetry samples (consecutive rows of one feed).
+
+        Args:
+            chunk: DataFrame with Throttle and Brake columns (Distance and Time optional)
+
+        Returns:
+            dict: metrics() after the update
+        """
+        n = len(chunk)
+        if not n:
+            return self.metrics()
+        throttle = channel_values(chunk, 'Throttle')
+        brake = channel_values(chunk, 'Brake')
+        start = self._sums.total
+
+        change = np.abs(np.diff(np.concatenate(([self._last_throttle], throttle))))
+        terms = np.column_stack([throttle > 95, (throttle < 5) & (brake < 5), np.nan_to_num(change)])
+        self._sums.push(terms.astype(float))
+        self._last_throttle = throttle[-1]
+
+        self._update_zones(chunk, brake, start)
+        return self.metrics()
+
+    def _update_zones(self, chunk: pd.DataFrame, brake: np.ndarray, start: int) -> None:
+        n = len(brake)
+        distance = channel_values(chunk, 'Distance')
+        threshold = self.brake_threshold
+        if threshold is None:
+            threshold = default_brake_threshold(brake)
+            # Before the first braking sample any threshold gives the same (no) zones
+            if np.nanmax(brake, initial=0) > 0:
+                self.brake_threshold = threshold
+        braking = (brake > threshold).astype(np.int8)
+        carried = self._open_zone is not None
+        # Edges against the carried state; a virtual non-braking sample closes the chunk
+        edges = np.diff(np.concatenate(([int(carried)], braking, [0])))
+        starts = np.flatnonzero(edges == 1)
+        ends = np.flatnonzero(edges == -1)  # exclusive end index within the chunk
+        seg_starts = np.concatenate(([0], starts)) if carried else starts
+        peaks = _segment_reduce(np.fmax, brake, seg_starts, ends)
+
+        for i, (lo, hi, peak) in enumerate(zip(seg_starts.tolist(), ends.tolist(), peaks.tolist())):
+            if i == 0 and carried:
+                zone = self._open_zone
+                zone['max_brake'] = float(np.fmax(zone['max_brake'], peak))
+            else:
+                zone = {'start_sample': start + lo, 'start_distance': distance[lo], 'max_brake': peak}
+            if hi == n and braking[-1]:
+                self._open_zone = zone
+                break
+            zone['end_sample'] = start + hi - 1
+            # A carried zone may end right before this chunk
+            zone['end_distance'] = distance[hi - 1] if hi else self._last_distance
+            self._zones.append(zone)
+            self._open_zone = None
+        self._last_distance = distance[-1]
+        if self.window is not None:
+            first = self._sums.total - self.window
+            while self._zones and self._zones[0]['start_sample'] < first:
+                self._zones.popleft()
+
+    def zones(self) -> pd.DataFrame:
+        """
+        Return the completed braking zones that start within the window.
+
+        Returns:
+            pd.DataFrame: start_sample, end_sample (inclusive, counted from the
+                first sample received), start_distance, end_distance, max_brake
+        """
+        return pd.DataFrame(list(self._zones),
+                            columns=['start_sample', 'end_sample', 'start_distance', 'end_distance', 'max_brake'])
+
+    def metrics(self) -> Dict[str, Any]:
+        """
+        Return the current metrics over the window.
+
+        Returns:
+            dict: samples (in the window), full_throttle_percentage,
+                coasting_time_percentage, throttle_smoothness, braking_zones
+                (completed zones starting in the window) and in_braking_zone; NaN before
+                the first sample
+        """
+        count = self._sums.count
+        full, coast, change = self._sums.sums
+        # The oldest sample's change is relative to a sample outside the window
+        oldest = self._sums.oldest()
+        change_pairs = count - 1
+        if oldest is not None:
+            change -= oldest[2]
+        return {
+            'samples': count,
+            'full_throttle_percentage': full / count * 100 if count else np.nan,
+            'coasting_time_percentage': coast / count * 100 if count else np.nan,
+            'throttle_smoothness': change / change_pairs if change_pairs > 0 else np.nan,
+            'braking_zones': len(self._zones),
+            'in_braking_zone': self._open_zone is not None,
+        }
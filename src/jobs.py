@@ -0,0 +1,153 @@
+"""
+F1 Analysis Job Queue Module
+
+This module provides the JobQueue class used by the web application to run
+analyses in the background instead of inside the request thread.
+
+Each submitted job runs on a small thread pool, where it does the
+session/telemetry lookup (which needs the in-process session pool). CPU-bound
+rendering is handed from there to a process pool via JobQueue.render(), so
+matplotlib work is not serialized by the GIL and does not tie up web workers.
+Clients poll the job status by id and fetch the result when it is done.
+
+Jobs are held in the memory of the process that created them, so the web
+application must run as a single worker process (with threads for
+concurrency, see DEPLOYMENT.md); a poll reaching another process would not
+find the job.
+"""
+
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from multiprocessing import get_context
+from threading import Lock
+from typing import Any, Callable, Dict, Optional
+import logging
+import time
+import traceback
+import uuid
+
+logger = logging.getLogger(__name__)
+
+JOB_STATUSES = ('queued', 'running', 'done', 'failed')
+
+
+class Job:
+    """
+    A single background job.
+
+    Attributes:
+        id (str): Unique job id
+        status (str): One of 'queued', 'running', 'done', 'failed'
+        progress (str): Free-form description of the current stage
+        result: Return value of the job function once done
+        error (str): Error message if the job failed
+    """
+
+    def __init__(self):
+        self.id = uuid.uuid4().hex
+        self.status = 'queued'
+        self.progress = 'Queued'
+        self.result = None
+        self.error = None
+        self.created_at = time.time()
+        self.finished_at = None
+
+    def set_progress(self, progress: str) -> None:
+        """Update the human-readable progress stage."""
+        self.progress = progress
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the job status as a JSON-safe dict (without the result)."""
+        return {
+            'job_id': self.id,
+            'status': self.status,
+            'progress': self.progress,
+            'error': self.error,
+        }
+
+
+class JobQueue:
+    """
+    Background job runner with pollable job status.
+
+    Attributes:
+        max_workers (int): Concurrent jobs (threads doing data lookup)
+        render_workers (int): Worker processes for render(); 0 renders in the job thread
+        max_finished (int): Finished jobs kept for polling before the oldest are dropped
+
+    Example Usage:
+        jobs = JobQueue(max_workers=4, render_workers=2)
+        job_id = jobs.submit(lambda job: jobs.render(render_plot, spec))
+        jobs.get(job_id).status
+    """
+
+    def __init__(self, max_workers: int = 4, render_workers: int = 2, max_finished: int = 500):
+        self.max_workers = max_workers
+        self.render_workers = render_workers
+        self.max_finished = max_finished
+        self._jobs = OrderedDict()
+        self._lock = Lock()
+        self._threads = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='f1-job')
+        self._processes = None
+
+    def submit(self, fn: Callable[[Job], Any]) -> str:
+        """
+        Queue fn(job) for background execution.
+
+        Returns:
+            str: Job id for get()
+        """
+        job = Job()
+        with self._lock:
+            self._jobs[job.id] = job
+            self._prune_locked()
+        self._threads.submit(self._run, job, fn)
+        return job.id
+
+    def get(self, job_id: str) -> Optional[Job]:
+        """Return the job with the given id, or None if unknown or expired."""
+        with self._lock:
+            return self._jobs.get(job_id)
+
+    def render(self, fn: Callable[..., Any], *args) -> Any:
+        """
+        Run a CPU-bound, picklable fn(*args) in the render process pool and wait for it.
+
+        Intended to be called from inside a job function.
+        """
+        if self.render_workers <= 0:
+            return fn(*args)
+        with self._lock:
+            if self._processes is None:
+                # spawn avoids forking a multi-threaded web worker
+                self._processes = ProcessPoolExecutor(max_workers=self.render_workers,
+                                                      mp_context=get_context('spawn'))
+            processes = self._processes
+        return processes.submit(fn, *args).result()
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Stop accepting jobs and release the worker pools."""
+        self._threads.shutdown(wait=wait)
+        if self._processes is not None:
+            self._processes.shutdown(wait=wait)
+
+    def _run(self, job: Job, fn: Callable[[Job], Any]) -> None:
+        job.status = 'running'
+        job.progress = 'Running'
+        try:
+            job.result = fn(job)
+            job.status = 'done'
+            job.progress = 'Done'
+        except Exception as e:
+            logger.error(f"Job {job.id} failed: {e}")
+            logger.debug(traceback.format_exc())
+            job.error = str(e)
+            job.status = 'failed'
+            job.progress = 'Failed'
+        finally:
+            job.finished_at = time.time()
+
+    def _prune_locked(self) -> None:
+        finished = [job_id for job_id, job in self._jobs.items() if job.status in ('done', 'failed')]
+        for job_id in finished[:max(0, len(finished) - self.max_finished)]:
+            del self._jobs[job_id]
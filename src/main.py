@@ -12,6 +12,9 @@ from .visualization import (
     plot_gear_usage_map,
     plot_brake_usage_map
 )
+from .circuit_cache import CircuitCache, corner_distances, layout_array
+from .schedule_index import ScheduleIndex
+from .stint_analysis import stint_lap_metrics, summarize_stints, write_stint_report
 import sys
 import argparse
 
@@ -19,35 +22,79 @@ def main():
 	parser = argparse.ArgumentParser(
 		description="F1 Telemetry Data Analysis CLI"
 	)
-	parser.add_argument('--year', type=int, required=True, help='Season year (e.g., 2024)')
-	parser.add_argument('--track', type=str, required=True, help='Track/circuit name or round number (e.g., Monaco or 7)')
-	parser.add_argument('--session', type=str, required=True, choices=['FP1', 'FP2', 'FP3', 'Q', 'S', 'R'], help='Session type (FP1, FP2, FP3, Q, S, R)')
-	parser.add_argument('--driver', type=str, required=True, help='Three-letter driver code (e.g., VER, HAM)')
+	parser.add_argument('--year', type=int, help='Season year (e.g., 2024)')
+	parser.add_argument('--track', type=str, help='Track/circuit name or round number (e.g., Monaco or 7)')
+	parser.add_argument('--session', type=str, choices=['FP1', 'FP2', 'FP3', 'Q', 'S', 'R'], help='Session type (FP1, FP2, FP3, Q, S, R)')
+	parser.add_argument('--driver', type=str, help='Three-letter driver code (e.g., VER, HAM)')
 	parser.add_argument('--lap', type=str, default='fastest', choices=['fastest', 'first', 'last'], help='Lap type to analyze')
 	parser.add_argument('--compare', type=str, help='Compare with another driver (three-letter code)')
 	parser.add_argument('--plot', type=str, default='trace', choices=['trace', 'compare', 'delta', 'gg', 'corners', 'gearmap', 'brakemap', 'trackmap'], help='Type of plot to generate')
 	parser.add_argument('--color-by', type=str, default='nGear', help='Telemetry column to color track map by (e.g., nGear, Speed, Throttle)')
 	parser.add_argument('--export', action='store_true', help='Export telemetry to CSV')
+	parser.add_argument('--export-format', type=str, default='csv', choices=['csv', 'mat'], help='Export format: csv (text) or mat (compressed MATLAB file with one struct per lap)')
 	parser.add_argument('--output', type=str, help='Output file name for CSV or plot')
 	parser.add_argument('--list-tracks', action='store_true', help='List available tracks for the given year and exit')
+	parser.add_argument('--warm-cache', type=str, metavar='YEARS', help='Prefetch every session of a season or range (e.g., 2024 or 2022-2024) into the caches and exit')
+	parser.add_argument('--warm-sessions', type=str, nargs='+', choices=['FP1', 'FP2', 'FP3', 'Q', 'S', 'R'], help='Session types to prefetch with --warm-cache (default: all)')
+	parser.add_argument('--warm-parallel', type=int, default=2, help='Sessions prefetched concurrently with --warm-cache')
+	parser.add_argument('--no-warm-telemetry', action='store_true', help='With --warm-cache, skip storing lap telemetry (lap tables and session summaries only)')
 	parser.add_argument('--all-laps', action='store_true', help='Analyze all laps for the driver (multi-lap/stint analysis)')
+	parser.add_argument('--stint-telemetry', action='store_true', help='With --all-laps, extract telemetry for every lap in parallel and report per-stint metrics (degradation, braking consistency, throttle smoothness drift)')
+	parser.add_argument('--replay', type=str, nargs='+', metavar='FILE', help='Replay exported telemetry files (CSV or telemetry store lap directories) as a live feed, print rolling metrics and exit')
+	parser.add_argument('--replay-speed', type=float, default=1.0, help='Replay speed-up factor for --replay (e.g., 10 for 10x real time)')
+	parser.add_argument('--replay-window', type=int, default=2000, help='Samples covered by the rolling metrics of --replay (0 for the whole feed)')
+	parser.add_argument('--report-dir', type=str, default='outputs/stints', help='Directory for --all-laps plots and stint reports')
 
 	args = parser.parse_args()
 
+	if args.warm_cache:
+		from .warmup import parse_years, warm_season
+		try:
+			years = parse_years(args.warm_cache)
+		except ValueError as e:
+			parser.error(str(e))
+		results = warm_season(years, cache_dir='cache', session_types=args.warm_sessions,
+							  max_sessions=args.warm_parallel, telemetry=not args.no_warm_telemetry)
+		failed = [r for r in results if 'error' in r]
+		for r in results:
+			status = f"error: {r['error']}" if 'error' in r else f"{r['laps']} laps, {r['telemetry_laps']} with telemetry, {r['seconds']} s"
+			print(f"  {r['year']} Round {r['round']} {r['event']} {r['session']}: {status}")
+		print(f"Warmed {len(results) - len(failed)} sessions ({len(failed)} failed).")
+		sys.exit(1 if failed else 0)
+
 	if args.list_tracks:
-		import fastf1
 		if not args.year:
 			print('Please provide --year to list tracks.')
 			sys.exit(1)
-		schedule = fastf1.get_event_schedule(args.year)
+		tracks = ScheduleIndex('cache/schedule_index.json').tracks(args.year)
 		print(f"Tracks for {args.year}:")
-		for rnd, row in schedule.iterrows():
-			print(f"  Round {row['RoundNumber']}: {row['EventName']} ({row['Location']})")
+		for track in tracks:
+			print(f"  Round {track['round']}: {track['name']} ({track['location']})")
+		sys.exit(0)
+
+	if args.replay:
+		from .telemetry_stream import ReplaySource, live_updates
+		try:
+			source = ReplaySource(args.replay, speedup=args.replay_speed)
+		except ValueError as e:
+			parser.error(str(e))
+		with source:
+			for update in live_updates(source, window=args.replay_window or None):
+				m = update['metrics']
+				speed = update['last'].get('Speed')
+				print(f"{update['replay_time']:8.1f} s  speed {speed if speed is not None else '-':>5}  full throttle {m['full_throttle_percentage']:5.1f}%  "
+					  f"coasting {m['coasting_time_percentage']:5.1f}%  braking zones {m['braking_zones']}")
 		sys.exit(0)
 
+	missing = [f"--{name}" for name in ('year', 'track', 'session', 'driver') if getattr(args, name) is None]
+	if missing:
+		parser.error(f"the following arguments are required: {', '.join(missing)}")
+
 	loader = F1DataLoader(cache_dir='cache')
+	# Round number, event name or (misspelled) location -> round number
+	race = ScheduleIndex('cache/schedule_index.json').resolve_race(args.year, args.track)
 	try:
-		session = loader.load_session(args.year, args.track, args.session)
+		session = loader.load_session(args.year, race, args.session)
 	except Exception as e:
 		print(f"Error loading session: {e}")
 		sys.exit(1)
@@ -71,7 +118,11 @@ def main():
 			print(f"  Average lap time: {avg_lap_time:.3f} s")
 			print(f"  Lap time std dev: {std_lap_time:.3f} s")
 			# Optionally, export all lap times
-			if args.export:
+			if args.export and args.export_format == 'mat':
+				out_name = args.output or f"{args.driver.lower()}_{args.track.lower()}_{args.session.lower()}_all_laps.mat"
+				out_path = loader.export_to_mat(laps, out_name)
+				print(f"Exported telemetry of all laps to {out_path}")
+			elif args.export:
 				laps[['LapNumber', 'LapTime']].to_csv(args.output or f"{args.driver.lower()}_{args.track.lower()}_{args.session.lower()}_all_laps.csv", index=False)
 				print(f"Exported all lap times to CSV.")
 			# Optionally, analyze stints (by compound)
@@ -80,16 +131,36 @@ def main():
 				for compound, stint_laps in laps.groupby('Compound'):
 					stint_times = stint_laps['LapTime'].dt.total_seconds()
 					print(f"  {compound}: {len(stint_laps)} laps, avg {stint_times.mean():.3f} s, std {stint_times.std():.3f} s")
-			# Optionally, plot lap times
-			import matplotlib.pyplot as plt
-			plt.figure(figsize=(10,5))
-			plt.plot(laps['LapNumber'], lap_times, marker='o')
-			plt.xlabel('Lap Number')
-			plt.ylabel('Lap Time (s)')
-			plt.title(f"Lap Times for {args.driver} ({args.track} {args.session})")
-			plt.grid(True, linestyle='--', alpha=0.5)
-			plt.tight_layout()
-			plt.show()
+			report_name = f"{args.driver.lower()}_{args.track.lower()}_{args.session.lower()}"
+			if args.stint_telemetry:
+				# Per-lap telemetry metrics aggregated per stint, written as a headless report
+				lap_metrics = stint_lap_metrics(loader, laps)
+				stints = summarize_stints(lap_metrics)
+				print("Stint telemetry summary:")
+				for _, stint in stints.iterrows():
+					print(f"  Stint {stint['Stint']} ({stint['Compound']}): {stint['laps']} laps, "
+						  f"degradation {stint['degradation_slope']:+.3f} s/lap, "
+						  f"braking consistency {stint['braking_consistency']:.1f} m, "
+						  f"smoothness drift {stint['smoothness_drift']:+.3f}/lap")
+				paths = write_stint_report(lap_metrics, stints, args.report_dir, report_name,
+										   title=f"Stint Analysis for {args.driver} ({args.track} {args.session})")
+				print(f"Wrote stint report: {', '.join(str(p) for p in paths.values())}")
+			else:
+				# Plot lap times to a file (no window, so this also runs in batch jobs)
+				from pathlib import Path
+				import matplotlib.pyplot as plt
+				Path(args.report_dir).mkdir(parents=True, exist_ok=True)
+				plot_path = Path(args.report_dir) / f"{report_name}_lap_times.png"
+				plt.figure(figsize=(10,5))
+				plt.plot(laps['LapNumber'], lap_times, marker='o')
+				plt.xlabel('Lap Number')
+				plt.ylabel('Lap Time (s)')
+				plt.title(f"Lap Times for {args.driver} ({args.track} {args.session})")
+				plt.grid(True, linestyle='--', alpha=0.5)
+				plt.tight_layout()
+				plt.savefig(plot_path)
+				plt.close()
+				print(f"Saved lap time plot to {plot_path}")
 			# End of all-laps analysis
 		else:
 			lap = loader.get_driver_lap(args.driver, lap_type=args.lap)
@@ -100,8 +171,11 @@ def main():
 
 	if not args.all_laps:
 		if args.export:
-			out_name = args.output or f"{args.driver.lower()}_{args.track.lower()}_{args.session.lower()}.csv"
-			out_path = loader.export_to_csv(telemetry, out_name)
+			out_name = args.output or f"{args.driver.lower()}_{args.track.lower()}_{args.session.lower()}.{args.export_format}"
+			if args.export_format == 'mat':
+				out_path = loader.export_to_mat([lap], out_name)
+			else:
+				out_path = loader.export_to_csv(telemetry, out_name)
 			print(f"Exported telemetry to {out_path}")
 
 		# Plotting options
@@ -158,14 +232,9 @@ def main():
 				sys.exit(1)
 			plot_gg_diagram(telemetry, args.driver, save_path=args.output)
 		elif args.plot == 'corners':
-			# Use official corner apex distances if available
-			try:
-				circuit_info = session.get_circuit_info()
-				if 'Corners' in circuit_info:
-					corner_locations = [corner['Apex'][0] for corner in circuit_info['Corners'] if 'Apex' in corner]
-				else:
-					raise Exception('No official corners')
-			except Exception:
+			# Official corner apex distances (or detected speed minima), cached per circuit and year
+			corner_locations = corner_distances(CircuitCache('cache/circuits').get(session, telemetry))
+			if not corner_locations:
 				# fallback: evenly spaced corners
 				n_corners = 10
 				dists = telemetry['Distance']
@@ -177,7 +246,8 @@ def main():
 			plot_brake_usage_map(telemetry, args.driver, save_path=args.output)
 		elif args.plot == 'trackmap':
 			from .visualization import plot_colored_track_map
-			plot_colored_track_map(session, telemetry, color_by=args.color_by, driver_label=args.driver, save_path=args.output)
+			track_outline = layout_array(CircuitCache('cache/circuits').get(session, telemetry))
+			plot_colored_track_map(session, telemetry, color_by=args.color_by, driver_label=args.driver, save_path=args.output, track_outline=track_outline)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,122 @@
+"""
+F1 MATLAB Export Module
+
+Binary MATLAB (.mat) export of lap telemetry.
+
+CSV exports are text: every value is formatted and parsed again, files are
+several times the size of the data, and types are lost on the way to MATLAB.
+write_mat() stores telemetry as typed arrays in a single compressed MAT-file
+(level 5, readable with load() in MATLAB and scipy.io.loadmat). Channels keep
+the loader's schema dtypes (see telemetry_schema.py): float32 for continuous
+channels, int8 for gear and DRS, and float64 seconds for Time. The file holds
+one struct per lap, nested per driver (and per session for multi-session
+exports):
+
+    data = load('ver_monaco_q.mat');
+    plot(data.VER.lap_12.Distance, data.VER.lap_12.Speed)
+    data.laps        % index table: Driver, LapNumber, LapTime, Field
+
+Example Usage:
+    write_mat({'VER': {'lap_12': telemetry}}, 'outputs/data/ver_monaco_q.mat')
+"""
+
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Union
+import logging
+import os
+import re
+import uuid
+
+import numpy as np
+import pandas as pd
+
+from .telemetry_schema import schema_dtype
+
+logger = logging.getLogger(__name__)
+
+# Channels written for MATLAB (Time in seconds)
+MAT_COLUMNS = ['Time', 'Distance', 'Speed', 'Throttle', 'Brake', 'RPM', 'nGear', 'DRS', 'X', 'Y', 'Z']
+
+# MATLAB identifiers are limited to 63 characters
+_MAX_NAME = 63
+
+
+def mat_name(label: Any, prefix: str = 'x') -> str:
+    """
+    Turn a label into a valid MATLAB field/variable name.
+
+    Invalid characters become underscores and names that do not start with a
+    letter get prefix prepended (e.g. 12 -> 'x_12', '2024 Monaco Q' -> 'x_2024_Monaco_Q').
+    """
+    name = re.sub(r'\W', '_', str(label))
+    if not re.match(r'[A-Za-z]', name):
+        name = f'{prefix}_{name}'
+    return name[:_MAX_NAME]
+
+
+def lap_arrays(telemetry: pd.DataFrame, columns: Optional[List[str]] = None) -> Dict[str, np.ndarray]:
+    """
+    Return a lap's channels as typed arrays for a MATLAB struct.
+
+    Time is converted to float64 seconds; other channels use the telemetry
+    schema dtype (or float64 when outside the schema). Channels missing from
+    the frame are omitted.
+    """
+    arrays = {}
+    for col in columns or MAT_COLUMNS:
+        if col not in telemetry.columns:
+            continue
+        values = telemetry[col]
+        if pd.api.types.is_timedelta64_dtype(values):
+            arrays[col] = values.dt.total_seconds().to_numpy(dtype=np.float64)
+        elif pd.api.types.is_datetime64_any_dtype(values):
+            arrays[col] = (values - values.iloc[0]).dt.total_seconds().to_numpy(dtype=np.float64) if len(values) \
+                else np.empty(0)
+        else:
+            dtype = schema_dtype(col, values) or np.dtype('float64')
+            arrays[col] = pd.to_numeric(values, errors='coerce').to_numpy().astype(dtype, copy=False)
+    return arrays
+
+
+def _to_struct(node: Any, columns: Optional[List[str]]) -> Any:
+    if isinstance(node, pd.DataFrame):
+        return lap_arrays(node, columns)
+    if isinstance(node, dict):
+        return {mat_name(key): _to_struct(value, columns) for key, value in node.items()}
+    return node
+
+
+def write_mat(tree: Dict[str, Any],
+              path: Union[str, Path],
+              columns: Optional[List[str]] = None,
+              index: Optional[pd.DataFrame] = None) -> Path:
+    """
+    Write nested telemetry to a compressed MAT-file.
+
+    Args:
+        tree: Nested dicts whose leaves are telemetry DataFrames (each becomes a
+            struct of channel arrays) or plain values; keys become MATLAB names
+        path: Output file (written under a temporary name and renamed into place)
+        columns: Channels to write per lap (default: MAT_COLUMNS)
+        index: Optional table stored as the 'laps' struct of column arrays
+
+    Returns:
+        Path: The written file
+    """
+    from scipy.io import savemat
+
+    path = Path(path)
+    variables = _to_struct(tree, columns)
+    if index is not None:
+        variables['laps'] = {mat_name(col): (index[col].to_numpy(dtype=object) if index[col].dtype == object
+                                             else index[col].to_numpy())
+                             for col in index.columns}
+    tmp = path.with_name(f".{path.name}.{uuid.uuid4().hex[:8]}.tmp")
+    try:
+        with open(tmp, 'wb') as f:
+            savemat(f, variables, do_compression=True, oned_as='column', long_field_names=True)
+        os.replace(tmp, path)
+    finally:
+        if tmp.exists():
+            tmp.unlink()
+    return path
@@ -1,60 +1,120 @@
 import numpy as np
 import pandas as pd
 
+from .resampling import nearest_indices
+from .telemetry_schema import apply_telemetry_schema
+
+def _segment_reduce(ufunc, values, starts, stops):
+    """Apply ufunc.reduceat over values[start:stop] segments; empty segments give NaN."""
+    values = np.asarray(values, dtype=float)
+    starts = np.asarray(starts, dtype=np.intp)
+    stops = np.asarray(stops, dtype=np.intp)
+    out = np.full(len(starts), np.nan)
+    if len(starts) == 0 or len(values) == 0:
+        return out
+    # Pad so that a stop equal to len(values) is a valid reduceat index
+    padded = np.append(values, np.nan)
+    starts = starts.clip(0, len(values))
+    stops = stops.clip(0, len(values))
+    bounds = np.column_stack([starts, stops]).ravel()
+    reduced = ufunc.reduceat(padded, bounds)[::2]
+    nonempty = stops > starts
+    out[nonempty] = reduced[nonempty]
+    return out
+
+
+def default_brake_threshold(brake) -> float:
+    """
+    Return a braking threshold suited to the scale of a Brake channel.
+
+    FastF1 reports Brake as on/off (0/1), for which the percentage threshold
+    of 10 would never trigger; 0.5 is used for such data, 10 otherwise.
+    """
+    brake = np.asarray(brake, dtype=float)
+    return 0.5 if np.nanmax(brake, initial=0) <= 1 else 10
+
+
 class DriverPerformanceAnalyzer:
     """
     Analyze driver telemetry for advanced performance metrics.
+
+    Per-corner lookups use binary search on the Distance column, which is
+    therefore expected to be monotonically non-decreasing (as produced by
+    FastF1 for a single lap). Telemetry is held in the compact telemetry
+    schema dtypes. Braking is Brake above brake_threshold, chosen from the
+    channel's scale by default as in batch_metrics and incremental_metrics.
     """
-    def __init__(self, telemetry: pd.DataFrame, laps: pd.DataFrame = None):
+    def __init__(self, telemetry: pd.DataFrame, laps: pd.DataFrame = None, brake_threshold=None):
         """
         Args:
             telemetry: DataFrame with columns ['Time', 'Distance', 'Speed', 'Throttle', 'Brake', 'RPM', 'nGear', 'DRS', 'X', 'Y', 'Z']
-            laps: Optional DataFrame of lap data for multi-lap analysis
+            laps: Optional telemetry of several laps for multi-lap analysis, as a
+                StackedTelemetry or a list of per-lap telemetry DataFrames
+            brake_threshold: Brake value above which a sample counts as braking
+                (default: default_brake_threshold() of the Brake channel)
         """
-        self.telemetry = telemetry
+        self.telemetry = apply_telemetry_schema(telemetry)
         self.laps = laps
+        if brake_threshold is None:
+            brake = self.telemetry['Brake'] if 'Brake' in self.telemetry else []
+            brake_threshold = default_brake_threshold(brake)
+        self.brake_threshold = brake_threshold
 
     # --- Braking Metrics ---
-    def braking_zones(self, threshold=10):
-        """Return list of (start_idx, end_idx) for each braking zone (brake > threshold)."""
-        brake = self.telemetry['Brake'] > threshold
-        zones = []
-        in_zone = False
-        for i, b in enumerate(brake):
-            if b and not in_zone:
-                start = i
-                in_zone = True
-            elif not b and in_zone:
-                end = i-1
-                zones.append((start, end))
-                in_zone = False
-        if in_zone:
-            zones.append((start, len(brake)-1))
-        return zones
+    def braking_zones(self, threshold=None):
+        """Return list of (start_idx, end_idx) for each braking zone (brake > threshold, default self.brake_threshold)."""
+        starts, ends = self._zone_bounds(threshold)
+        return list(zip(starts.tolist(), ends.tolist()))
+
+    def _zone_bounds(self, threshold=None):
+        """Return arrays of zone start and (inclusive) end indices via run-length edge detection."""
+        threshold = self.brake_threshold if threshold is None else threshold
+        braking = (self.telemetry['Brake'].to_numpy() > threshold).astype(np.int8)
+        edges = np.diff(np.concatenate(([0], braking, [0])))
+        return np.flatnonzero(edges == 1), np.flatnonzero(edges == -1) - 1
+
+    def _nearest_indices(self, targets):
+        """Return index of the sample nearest in distance to each target (ties go to the earlier sample)."""
+        return nearest_indices(self.telemetry['Distance'].to_numpy(dtype=float), targets)
 
     def brake_application_points(self, apex_distances):
         """Return distance before apex where brake is first applied for each corner (requires apex_distances)."""
-        points = []
-        for apex in apex_distances:
-            before_apex = self.telemetry[self.telemetry['Distance'] < apex]
-            brake_on = before_apex[before_apex['Brake'] > 10]
-            if not brake_on.empty:
-                points.append(apex - brake_on['Distance'].iloc[-1])
-            else:
-                points.append(np.nan)
-        return points
+        dist = self.telemetry['Distance'].to_numpy(dtype=float)
+        apexes = np.asarray(apex_distances, dtype=float)
+        brake_idx = np.flatnonzero(self.telemetry['Brake'].to_numpy() > self.brake_threshold)
+        # Last braking sample strictly before each apex
+        before = np.searchsorted(dist, apexes, side='left')
+        j = np.searchsorted(brake_idx, before, side='left') - 1
+        found = j >= 0
+        points = np.full(len(apexes), np.nan)
+        points[found] = apexes[found] - dist[brake_idx[j[found]]]
+        return points.tolist()
 
     def max_brake_pressure_per_zone(self):
         """Return max brake value for each braking zone."""
-        zones = self.braking_zones()
-        return [self.telemetry['Brake'].iloc[start:end+1].max() for start, end in zones]
+        starts, ends = self._zone_bounds()
+        return _segment_reduce(np.fmax, self.telemetry['Brake'].to_numpy(dtype=float), starts, ends + 1).tolist()
+
+    def brake_consistency(self, metric='brake_point'):
+        """
+        Return the lap-to-lap std of a braking zone metric, averaged over zones.
+
+        Braking zones are matched across the per-lap telemetry in self.laps by
+        distance (see brake_analysis.MultiLapBrakeAnalyzer). metric is
+        'brake_point' (m, the default), 'duration' (s) or 'peak_pressure'; the
+        latter is always 0 on FastF1's on/off Brake channel. NaN without laps.
 
-    def brake_consistency(self):
-        """Return std deviation of max brake per zone across laps (if laps provided)."""
-        if self.laps is None:
+        Raises:
+            ValueError: If self.laps is a lap table rather than per-lap telemetry
+        """
+        if isinstance(self.laps, pd.DataFrame):
+            raise ValueError("brake_consistency needs per-lap telemetry (a StackedTelemetry or a list of "
+                             "telemetry DataFrames), not a lap table")
+        if self.laps is None or not len(self.laps):
             return np.nan
-        max_pressures = [self.max_brake_pressure_per_zone() for _ in self.laps]
-        return np.std([np.mean(m) for m in max_pressures])
+        # Imported here: brake_analysis depends on batch_metrics, which imports this module
+        from .brake_analysis import MultiLapBrakeAnalyzer
+        return MultiLapBrakeAnalyzer(self.laps).consistency(metric)
 
     def trail_braking_profile(self):
         """Return correlation between brake and steering (if steering data present)."""
@@ -65,15 +125,16 @@ class DriverPerformanceAnalyzer:
     # --- Throttle Metrics ---
     def throttle_pickup_after_apex(self, apex_distances):
         """Return distance after apex where throttle > 10% resumes for each corner."""
-        points = []
-        for apex in apex_distances:
-            after_apex = self.telemetry[self.telemetry['Distance'] > apex]
-            throttle_on = after_apex[after_apex['Throttle'] > 10]
-            if not throttle_on.empty:
-                points.append(throttle_on['Distance'].iloc[0] - apex)
-            else:
-                points.append(np.nan)
-        return points
+        dist = self.telemetry['Distance'].to_numpy(dtype=float)
+        apexes = np.asarray(apex_distances, dtype=float)
+        throttle_idx = np.flatnonzero(self.telemetry['Throttle'].to_numpy() > 10)
+        # First throttle sample strictly after each apex
+        after = np.searchsorted(dist, apexes, side='right')
+        j = np.searchsorted(throttle_idx, after, side='left')
+        found = j < len(throttle_idx)
+        points = np.full(len(apexes), np.nan)
+        points[found] = dist[throttle_idx[j[found]]] - apexes[found]
+        return points.tolist()
 
     def full_throttle_percentage(self):
         """Return percent of lap spent at >95% throttle."""
@@ -91,19 +152,53 @@ class DriverPerformanceAnalyzer:
     # --- Corner Performance ---
     def min_speed_per_corner(self, apex_distances, window=10):
         """Return minimum speed in a window around each apex."""
-        min_speeds = []
-        for apex in apex_distances:
-            mask = (self.telemetry['Distance'] > apex - window) & (self.telemetry['Distance'] < apex + window)
-            min_speeds.append(self.telemetry.loc[mask, 'Speed'].min())
-        return min_speeds
+        dist = self.telemetry['Distance'].to_numpy(dtype=float)
+        apexes = np.asarray(apex_distances, dtype=float)
+        lo = np.searchsorted(dist, apexes - window, side='right')
+        hi = np.searchsorted(dist, apexes + window, side='left')
+        return _segment_reduce(np.fmin, self.telemetry['Speed'].to_numpy(dtype=float), lo, hi).tolist()
+
+    def speed_minima(self, min_drop=15.0, min_separation=100.0, smooth=5):
+        """
+        Return apex distances of corners detected as local minima of (smoothed) speed.
+
+        A minimum counts as a corner if speed rises by at least min_drop (km/h) on
+        both sides before the neighbouring minima; of two corners closer than
+        min_separation (m), the slower one is kept.
+        """
+        dist = self.telemetry['Distance'].to_numpy(dtype=float)
+        speed = self.telemetry['Speed'].to_numpy(dtype=float)
+        n = len(speed)
+        if n < 3:
+            return []
+        if 1 < smooth <= n:
+            padded = np.pad(speed, ((smooth - 1) // 2, smooth // 2), mode='edge')
+            speed = np.convolve(padded, np.ones(smooth) / smooth, mode='valid')
+        # Slope signs with flat runs taking the previous slope, so plateaus count once
+        slope = np.sign(np.diff(speed))
+        filled = slope[np.maximum.accumulate(np.where(slope != 0, np.arange(len(slope)), 0))]
+        minima = np.flatnonzero((filled[:-1] < 0) & (filled[1:] > 0)) + 1
+        if not len(minima):
+            return []
+        # Highest speed between each minimum and its neighbours (or the lap ends)
+        before = _segment_reduce(np.fmax, speed, np.concatenate(([0], minima[:-1])), minima + 1)
+        after = _segment_reduce(np.fmax, speed, minima, np.concatenate((minima[1:] + 1, [n])))
+        minima = minima[np.fmin(before, after) - speed[minima] >= min_drop]
+        if len(minima) > 1:
+            close = np.flatnonzero(np.diff(dist[minima]) < min_separation)
+            faster = np.where(speed[minima[close]] > speed[minima[close + 1]], close, close + 1)
+            minima = np.delete(minima, faster)
+        return dist[minima].tolist()
 
     def corner_entry_speed(self, apex_distances, entry_offset=50):
         """Return speed 50m before each apex."""
-        return [self.telemetry.iloc[(self.telemetry['Distance']-apex+entry_offset).abs().argsort()[:1]]['Speed'].values[0] for apex in apex_distances]
+        idx = self._nearest_indices(np.asarray(apex_distances, dtype=float) - entry_offset)
+        return self.telemetry['Speed'].to_numpy()[idx].tolist()
 
     def corner_exit_speed(self, apex_distances, exit_offset=50):
         """Return speed 50m after each apex."""
-        return [self.telemetry.iloc[(self.telemetry['Distance']-apex-exit_offset).abs().argsort()[:1]]['Speed'].values[0] for apex in apex_distances]
+        idx = self._nearest_indices(np.asarray(apex_distances, dtype=float) + exit_offset)
+        return self.telemetry['Speed'].to_numpy()[idx].tolist()
 
     def time_lost_in_corners(self, straight_mask):
         """Return time spent in corners vs straights (requires boolean mask for straights)."""
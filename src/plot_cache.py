@@ -0,0 +1,117 @@
+"""
+F1 Plot Cache Module
+
+This module provides the PlotCache class, a content-addressed, size-bounded
+cache of rendered plot images.
+
+Plots are named after a hash of everything that determines their content
+(session, drivers, lap selector, plot type and render options), so identical
+analysis requests reuse the existing PNG instead of re-rendering it. Every
+key includes PLOT_VERSION: the images are served as immutable, so bump it
+whenever a change to the plotting code or the render profiles changes the
+output, and clients fetch the new images under new names. The directory is trimmed to a byte budget by evicting the least recently used
+files, so static/plots no longer grows without bound.
+"""
+
+from pathlib import Path
+from threading import Lock
+from typing import Optional, Union
+import hashlib
+import json
+import logging
+import os
+import uuid
+
+logger = logging.getLogger(__name__)
+
+PLOT_VERSION = 1
+
+
+class PlotCache:
+    """
+    Content-addressed cache of rendered plots in a directory.
+
+    Attributes:
+        directory (Path): Directory holding the cached images
+        max_bytes (int): Total size budget for images in the directory
+        suffix (str): File extension of cached images
+
+    Example Usage:
+        cache = PlotCache('static/plots')
+        key = cache.key_for(session='2024:monaco:Q', driver='VER', plot_type='trace')
+        path = cache.lookup(key)
+        if path is None:
+            tmp = cache.temp_path(key)
+            render(tmp)
+            path = cache.publish(key, tmp)
+    """
+
+    def __init__(self, directory: Union[str, Path] = 'static/plots', max_bytes: int = 256 * 1024 * 1024,
+                 suffix: str = '.png'):
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+        self.suffix = suffix
+        self._lock = Lock()
+
+    @staticmethod
+    def key_for(**parts) -> str:
+        """Return a stable content hash for the given render parameters (and PLOT_VERSION)."""
+        canonical = json.dumps(dict(parts, version=PLOT_VERSION), sort_keys=True, default=str, separators=(',', ':'))
+        return hashlib.sha256(canonical.encode('utf-8')).hexdigest()[:32]
+
+    def path_for(self, key: str) -> Path:
+        """Return the path a cached image for key lives at."""
+        return self.directory / f"{key}{self.suffix}"
+
+    def lookup(self, key: str) -> Optional[Path]:
+        """Return the cached image for key (marking it recently used), or None on a miss."""
+        path = self.path_for(key)
+        try:
+            os.utime(path)
+        except FileNotFoundError:
+            return None
+        return path
+
+    def temp_path(self, key: str) -> Path:
+        """Return a unique temporary path to render into before publish()."""
+        return self.directory / f".{key}.{uuid.uuid4().hex[:8]}.tmp{self.suffix}"
+
+    def publish(self, key: str, temp_path: Union[str, Path]) -> Path:
+        """Atomically move a rendered file into the cache and enforce the size budget."""
+        path = self.path_for(key)
+        os.replace(temp_path, path)
+        self.evict()
+        return path
+
+    def evict(self) -> int:
+        """
+        Delete least recently used images until the directory fits max_bytes.
+
+        Returns:
+            int: Number of files removed
+        """
+        with self._lock:
+            entries = []
+            for path in self.directory.glob(f"*{self.suffix}"):
+                if path.name.startswith('.'):
+                    continue
+                try:
+                    stat = path.stat()
+                except FileNotFoundError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, path))
+            total = sum(size for _, size, _ in entries)
+            removed = 0
+            for _, size, path in sorted(entries):
+                if total <= self.max_bytes:
+                    break
+                try:
+                    path.unlink()
+                    removed += 1
+                    total -= size
+                except FileNotFoundError:
+                    pass
+            if removed:
+                logger.info(f"Evicted {removed} cached plots from {self.directory}")
+            return removed
@@ -0,0 +1,180 @@
+"""
+F1 Plot Payloads Module
+
+Numeric plot payloads for client-side rendering in the web dashboard.
+
+Instead of rasterizing a PNG on the server, build_payload() returns the
+series that plot_throttle_brake_trace, plot_driver_comparison,
+plot_speed_delta and plot_colored_track_map would draw, downsampled with
+shape-preserving LTTB (see downsampling.py). Series are encoded as base64
+little-endian float32 arrays, which the browser decodes straight into
+Float32Arrays and draws on a canvas.
+
+Payload layout:
+    {
+        'plot_type': 'trace' | 'compare' | 'delta' | 'trackmap',
+        'title': str,
+        # line plots (trace/compare/delta): stacked panels sharing the x axis
+        'x_label': str,
+        'panels': [{'label': str, 'zero_line': bool,
+                    'series': [{'name': str, 'color': str, 'x': array, 'y': array}]}],
+        'vlines': [{'x': float, 'label': str}],
+        # trackmap
+        'x': array, 'y': array, 'c': array, 'color_by': str, 'outline': {'x': array, 'y': array}
+    }
+where every array is {'dtype': 'float32', 'length': int, 'data': base64 str}.
+"""
+
+from typing import Any, Dict, Optional
+import base64
+
+import numpy as np
+import pandas as pd
+
+from .downsampling import downsample_indices, lttb_indices
+from .resampling import channel_values, distance_grid, resample_laps
+
+INTERACTIVE_PLOT_TYPES = ['trace', 'compare', 'delta', 'trackmap']
+DEFAULT_MAX_POINTS = 1000
+
+DRIVER_COLORS = ['#1f77b4', '#d62728']
+
+
+def encode_array(values) -> Dict[str, Any]:
+    """Encode a numeric array as base64 little-endian float32 (NaN for missing values)."""
+    data = np.ascontiguousarray(np.asarray(values, dtype='<f4'))
+    return {'dtype': 'float32', 'length': int(data.size), 'data': base64.b64encode(data.tobytes()).decode('ascii')}
+
+
+def decode_array(encoded: Dict[str, Any]) -> np.ndarray:
+    """Decode an array produced by encode_array()."""
+    return np.frombuffer(base64.b64decode(encoded['data']), dtype='<f4')
+
+
+def decimate_indices(n: int, max_points: int) -> np.ndarray:
+    """Return at most max_points evenly strided sample indices, always keeping the first and last."""
+    if n <= max_points or max_points < 2:
+        return np.arange(n)
+    return np.unique(np.linspace(0, n - 1, max_points).round().astype(np.intp))
+
+
+def _channel(telemetry: pd.DataFrame, col: str, idx: np.ndarray) -> Dict[str, Any]:
+    return encode_array(channel_values(telemetry, col)[idx])
+
+
+def _line_series(telemetry: pd.DataFrame, col: str, name: str, color: str, max_points: int) -> Dict[str, Any]:
+    x = channel_values(telemetry, 'Distance')
+    y = channel_values(telemetry, col)
+    idx = lttb_indices(x, y, max_points)
+    return {'name': name, 'color': color, 'x': encode_array(x[idx]), 'y': encode_array(y[idx])}
+
+
+def trace_payload(telemetry: pd.DataFrame, lap_info: Dict[str, Any], driver: str,
+                  max_points: int = DEFAULT_MAX_POINTS) -> Dict[str, Any]:
+    """Payload equivalent of plot_throttle_brake_trace()."""
+    panels = []
+    for col, label, color in [('Speed', 'Speed (km/h)', '#1f77b4'), ('Throttle', 'Throttle (%)', '#2ca02c'),
+                              ('Brake', 'Brake (%)', '#d62728')]:
+        panels.append({'label': label, 'zero_line': False,
+                       'series': [_line_series(telemetry, col, driver, color, max_points)]})
+    vlines = [{'x': float(lap_info[key]), 'label': f'S{i + 1}'}
+              for i, key in enumerate(['sector1_end', 'sector2_end']) if key in lap_info]
+    return {
+        'plot_type': 'trace',
+        'title': f"{driver} - Lap {lap_info.get('lap_number', '?')} ({lap_info.get('lap_time', '?')})",
+        'x_label': 'Distance (m)',
+        'panels': panels,
+        'vlines': vlines,
+    }
+
+
+def comparison_payload(telemetry1: pd.DataFrame, telemetry2: pd.DataFrame, driver1: str, driver2: str,
+                       max_points: int = DEFAULT_MAX_POINTS) -> Dict[str, Any]:
+    """Payload equivalent of plot_driver_comparison()."""
+    panels = []
+    for col, label in [('Speed', 'Speed (km/h)'), ('Throttle', 'Throttle (%)'), ('Brake', 'Brake (%)')]:
+        panels.append({'label': label, 'zero_line': False, 'series': [
+            _line_series(telemetry1, col, driver1, DRIVER_COLORS[0], max_points),
+            _line_series(telemetry2, col, driver2, DRIVER_COLORS[1], max_points),
+        ]})
+    return {
+        'plot_type': 'compare',
+        'title': f"{driver1} vs {driver2} - Telemetry Comparison",
+        'x_label': 'Distance (m)',
+        'panels': panels,
+        'vlines': [],
+    }
+
+
+def delta_payload(telemetry1: pd.DataFrame, telemetry2: pd.DataFrame, driver1: str, driver2: str,
+                  max_points: int = DEFAULT_MAX_POINTS, lap_keys=None) -> Dict[str, Any]:
+    """Payload equivalent of plot_speed_delta() (speed and cumulative time delta over distance)."""
+    common_dist = distance_grid([telemetry1, telemetry2], max_points)
+    laps = resample_laps([telemetry1, telemetry2], common_dist, columns=['Speed', 'Time'], keys=lap_keys)
+    speed_delta = -laps.delta('Speed')[1]
+    time_delta = -laps.delta('Time')[1]
+    time_delta -= time_delta[0]  # Normalize to zero at start
+    x = encode_array(common_dist)
+    return {
+        'plot_type': 'delta',
+        'title': f"{driver1} vs {driver2} - Speed & Time Delta",
+        'x_label': 'Distance (m)',
+        'panels': [
+            {'label': f'Speed Δ ({driver1} - {driver2}) (km/h)', 'zero_line': True,
+             'series': [{'name': 'Speed Δ', 'color': 'purple', 'x': x, 'y': encode_array(speed_delta)}]},
+            {'label': 'Cumulative Time Δ (s)', 'zero_line': True,
+             'series': [{'name': 'Time Δ', 'color': 'orange', 'x': x, 'y': encode_array(time_delta)}]},
+        ],
+        'vlines': [],
+    }
+
+
+def track_map_payload(telemetry: pd.DataFrame, color_by: str, driver: str, track_outline: Optional[np.ndarray] = None,
+                      max_points: int = DEFAULT_MAX_POINTS) -> Dict[str, Any]:
+    """Payload equivalent of plot_colored_track_map()."""
+    if color_by not in telemetry:
+        raise ValueError(f"Telemetry has no '{color_by}' channel to color the track by")
+    idx = downsample_indices(channel_values(telemetry, 'Distance'),
+                             [channel_values(telemetry, col) for col in ('X', 'Y', color_by)], max_points)
+    payload = {
+        'plot_type': 'trackmap',
+        'title': f'Track Map - {driver} ({color_by})',
+        'color_by': color_by,
+        'x': _channel(telemetry, 'X', idx),
+        'y': _channel(telemetry, 'Y', idx),
+        'c': _channel(telemetry, color_by, idx),
+        'outline': None,
+    }
+    if track_outline is not None and len(track_outline):
+        outline = np.asarray(track_outline, dtype=float)
+        keep = decimate_indices(len(outline), max_points)
+        payload['outline'] = {'x': encode_array(outline[keep, 0]), 'y': encode_array(outline[keep, 1])}
+    return payload
+
+
+def build_payload(spec: Dict[str, Any], max_points: int = DEFAULT_MAX_POINTS) -> Dict[str, Any]:
+    """
+    Build the client-side payload for a render spec (see analysis.render_plot).
+
+    Args:
+        spec: render spec; save_path and profile are ignored. An optional 'lap_keys'
+            pair lets the delta payload reuse cached resampled laps
+        max_points: Maximum samples per series
+
+    Returns:
+        dict: JSON-safe payload (see module docstring)
+    """
+    plot_type = spec['plot_type']
+    telemetry = spec['telemetry']
+    driver = spec['driver']
+    if plot_type == 'trace':
+        return trace_payload(telemetry, spec['lap_info'], driver, max_points)
+    if plot_type == 'compare':
+        return comparison_payload(telemetry, spec['telemetry2'], driver, spec['compare_driver'], max_points)
+    if plot_type == 'delta':
+        return delta_payload(telemetry, spec['telemetry2'], driver, spec['compare_driver'], max_points,
+                             spec.get('lap_keys'))
+    if plot_type == 'trackmap':
+        return track_map_payload(telemetry, spec.get('color_by', 'nGear'), driver, spec.get('track_outline'),
+                                 max_points)
+    raise ValueError(f'Plot type {plot_type} has no interactive payload (supported: {INTERACTIVE_PLOT_TYPES})')
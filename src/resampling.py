@@ -0,0 +1,259 @@
+"""
+F1 Lap Resampling Module
+
+Distance-aligned resampling of lap telemetry onto a shared distance grid.
+
+Laps are sampled at irregular distances, so comparing two laps point by point
+needs every channel interpolated onto common distances first. This module
+does that once per lap for all channels together: the bracketing samples and
+weights are found with a single searchsorted over the grid, and then applied
+to an (n_samples x channels) matrix in one vectorized step. Any N laps
+resampled onto the same grid form a dense (N x grid x channels) array
+(ResampledLaps) that delta, comparison and metric code can index directly.
+
+LapResampler keeps recently resampled laps in a bounded LRU cache keyed by
+(lap key, grid, channels), so the same lap is not re-interpolated for every
+plot or payload that compares it.
+
+Example Usage:
+    grid = distance_grid([telemetry1, telemetry2])
+    laps = resample_laps([telemetry1, telemetry2], grid, columns=['Speed', 'Time'])
+    speed_delta = laps.delta('Speed')[1]   # lap 1 minus lap 0 at every grid point
+"""
+
+from collections import OrderedDict
+from threading import Lock
+from typing import Hashable, List, Optional, Sequence
+import hashlib
+
+import numpy as np
+import pandas as pd
+
+DEFAULT_GRID_POINTS = 1000
+
+RESAMPLE_COLUMNS = ['Time', 'Speed', 'Throttle', 'Brake', 'RPM', 'nGear', 'DRS', 'X', 'Y', 'Z']
+
+# Discrete channels are held at the previous sample instead of interpolated
+STEP_COLUMNS = ['nGear', 'DRS']
+
+
+def channel_values(frame: pd.DataFrame, col: str) -> np.ndarray:
+    """
+    Return a telemetry channel as a float array.
+
+    Time-like channels (timedelta or datetime) are converted to seconds from the
+    first sample; a missing channel gives all-NaN values.
+    """
+    if col not in frame.columns:
+        return np.full(len(frame), np.nan)
+    values = frame[col]
+    if pd.api.types.is_timedelta64_dtype(values):
+        seconds = values.dt.total_seconds().to_numpy()
+        return seconds - seconds[0] if len(seconds) else seconds
+    if pd.api.types.is_datetime64_any_dtype(values):
+        return (values - values.iloc[0]).dt.total_seconds().to_numpy() if len(values) else np.empty(0)
+    return pd.to_numeric(values, errors='coerce').to_numpy(dtype=float)
+
+
+def nearest_indices(distance, targets) -> np.ndarray:
+    """
+    Return the index of the sample nearest to each target distance.
+
+    Args:
+        distance: Monotonically non-decreasing sample distances
+        targets: Distances to look up
+
+    Returns:
+        np.ndarray: One index per target (ties go to the earlier sample)
+    """
+    dist = np.asarray(distance, dtype=float)
+    targets = np.asarray(targets, dtype=float)
+    if len(dist) < 2:
+        return np.zeros(len(targets), dtype=np.intp)
+    right = np.searchsorted(dist, targets).clip(1, len(dist) - 1)
+    left = right - 1
+    use_left = np.abs(targets - dist[left]) <= np.abs(dist[right] - targets)
+    return np.where(use_left, left, right)
+
+
+def distance_grid(telemetries: Sequence[pd.DataFrame], n_points: int = DEFAULT_GRID_POINTS) -> np.ndarray:
+    """
+    Return n_points evenly spaced distances over the range covered by every lap.
+
+    Raises:
+        ValueError: If the laps have no distance range in common
+    """
+    starts = [np.nanmin(channel_values(t, 'Distance')) for t in telemetries]
+    stops = [np.nanmax(channel_values(t, 'Distance')) for t in telemetries]
+    start, stop = max(starts), min(stops)
+    if not stop > start:
+        raise ValueError("Laps have no common distance range to resample onto")
+    return np.linspace(start, stop, n_points)
+
+
+def resample(telemetry: pd.DataFrame, grid, columns: Optional[List[str]] = None) -> np.ndarray:
+    """
+    Resample every channel of a lap onto a distance grid in one pass.
+
+    Continuous channels are linearly interpolated (like np.interp, including
+    clamping to the first/last sample outside the lap); STEP_COLUMNS keep the
+    value of the previous sample.
+
+    Args:
+        telemetry: Lap telemetry with a monotonic Distance column
+        grid: Target distances
+        columns: Channels to resample (default: RESAMPLE_COLUMNS present in the frame)
+
+    Returns:
+        np.ndarray: Array of shape (len(grid), len(columns))
+    """
+    grid = np.asarray(grid, dtype=float)
+    if columns is None:
+        columns = [c for c in RESAMPLE_COLUMNS if c in telemetry.columns]
+    dist = channel_values(telemetry, 'Distance')
+    values = np.column_stack([channel_values(telemetry, c) for c in columns]) if columns else np.empty((len(dist), 0))
+    if len(dist) == 0:
+        return np.full((len(grid), len(columns)), np.nan)
+    if len(dist) == 1:
+        return np.repeat(values, len(grid), axis=0)
+
+    left = (np.searchsorted(dist, grid, side='right') - 1).clip(0, len(dist) - 2)
+    span = dist[left + 1] - dist[left]
+    with np.errstate(invalid='ignore', divide='ignore'):
+        weight = np.where(span > 0, (grid - dist[left]) / span, 0.0).clip(0.0, 1.0)
+    weights = np.repeat(weight[:, None], len(columns), axis=1)
+    step = np.array([c in STEP_COLUMNS for c in columns], dtype=bool)
+    weights[:, step] = weights[:, step] >= 1.0
+    lo, hi = values[left], values[left + 1]
+    return lo + weights * (hi - lo)
+
+
+class ResampledLaps:
+    """
+    Several laps resampled onto one distance grid.
+
+    Attributes:
+        grid (np.ndarray): Shared distances, shape (G,)
+        columns (list): Channel names, in the order of the last axis of values
+        values (np.ndarray): Resampled channels, shape (N laps, G, C)
+        keys (list): Optional identifier per lap
+    """
+
+    def __init__(self, grid: np.ndarray, columns: List[str], values: np.ndarray, keys: Optional[List[Hashable]] = None):
+        self.grid = grid
+        self.columns = list(columns)
+        self.values = values
+        self.keys = list(keys) if keys is not None else [None] * len(values)
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def channel(self, name: str) -> np.ndarray:
+        """Return one channel for every lap, shape (N, G)."""
+        return self.values[:, :, self.columns.index(name)]
+
+    def delta(self, name: str, reference: int = 0) -> np.ndarray:
+        """Return channel name of every lap minus that of the reference lap, shape (N, G)."""
+        values = self.channel(name)
+        return values - values[reference]
+
+
+class LapResampler:
+    """
+    Bounded LRU cache of laps resampled onto distance grids.
+
+    Attributes:
+        max_entries (int): Resampled laps kept before the least recently used are dropped
+
+    Example Usage:
+        resampler = LapResampler(max_entries=256)
+        laps = resampler.stack([tel1, tel2], grid, keys=[lap_store_key(lap1), lap_store_key(lap2)])
+    """
+
+    def __init__(self, max_entries: int = 256):
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._lock = Lock()
+
+    @staticmethod
+    def _grid_id(grid: np.ndarray) -> str:
+        return hashlib.sha1(np.ascontiguousarray(grid, dtype=float).tobytes()).hexdigest()
+
+    def resample(self, telemetry: pd.DataFrame, grid, columns: Optional[List[str]] = None,
+                 key: Optional[Hashable] = None) -> np.ndarray:
+        """
+        Resample a lap onto grid, reusing a cached result for the same key.
+
+        Laps without a key (None) are resampled but not cached.
+
+        Returns:
+            np.ndarray: Read-only array of shape (len(grid), len(columns))
+        """
+        grid = np.asarray(grid, dtype=float)
+        if columns is None:
+            columns = [c for c in RESAMPLE_COLUMNS if c in telemetry.columns]
+        if key is None:
+            return resample(telemetry, grid, columns)
+        cache_key = (key, self._grid_id(grid), tuple(columns))
+        with self._lock:
+            cached = self._entries.get(cache_key)
+            if cached is not None:
+                self._entries.move_to_end(cache_key)
+                return cached
+        values = resample(telemetry, grid, columns)
+        values.setflags(write=False)
+        with self._lock:
+            self._entries[cache_key] = values
+            self._entries.move_to_end(cache_key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return values
+
+    def stack(self, telemetries: Sequence[pd.DataFrame], grid, columns: Optional[List[str]] = None,
+              keys: Optional[Sequence[Optional[Hashable]]] = None) -> ResampledLaps:
+        """Resample N laps onto the same grid and stack them into a ResampledLaps."""
+        grid = np.asarray(grid, dtype=float)
+        if columns is None:
+            columns = [c for c in RESAMPLE_COLUMNS if telemetries and c in telemetries[0].columns]
+        keys = list(keys) if keys is not None else [None] * len(telemetries)
+        if len(keys) != len(telemetries):
+            raise ValueError("keys must have one entry per lap")
+        if telemetries:
+            values = np.stack([self.resample(t, grid, columns, key) for t, key in zip(telemetries, keys)])
+        else:
+            values = np.empty((0, len(grid), len(columns)))
+        return ResampledLaps(grid, columns, values, keys)
+
+    def clear(self) -> None:
+        """Drop all cached laps."""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+
+default_resampler = LapResampler()
+
+
+def resample_laps(telemetries: Sequence[pd.DataFrame], grid=None, columns: Optional[List[str]] = None,
+                  keys: Optional[Sequence[Optional[Hashable]]] = None, n_points: int = DEFAULT_GRID_POINTS,
+                  resampler: Optional[LapResampler] = None) -> ResampledLaps:
+    """
+    Resample laps onto a shared distance grid (the process-wide cache is used for keyed laps).
+
+    Args:
+        telemetries: Lap telemetry frames
+        grid: Target distances (default: distance_grid(telemetries, n_points))
+        columns: Channels to resample (default: RESAMPLE_COLUMNS present in the first lap)
+        keys: Optional cache key per lap (e.g. telemetry_store.lap_store_key(lap))
+        n_points: Grid size when grid is not given
+        resampler: LapResampler to use (default: module-level default_resampler)
+
+    Returns:
+        ResampledLaps: values of shape (len(telemetries), len(grid), len(columns))
+    """
+    if grid is None:
+        grid = distance_grid(telemetries, n_points)
+    return (resampler or default_resampler).stack(telemetries, grid, columns, keys)
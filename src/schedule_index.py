@@ -0,0 +1,229 @@
+"""
+F1 Schedule Index Module
+
+This module provides the ScheduleIndex class, an in-memory and on-disk index
+of the race calendar per season.
+
+fastf1.get_event_schedule() builds a pandas frame (and may hit the network)
+on every call. The index fetches each season once and stores one compact
+record per race weekend: round, event name, location, country and date. The
+records are persisted to a JSON file so they survive restarts, and refreshed
+when older than the TTL. If a refresh fails (for example when offline), the
+stale season is served instead. For every season, the index also
+precomputes the serialized /api/tracks response and its ETag, so the endpoint
+only returns bytes.
+
+Lookups accept a round number, an event name, a location or country, or a
+misspelled/partial version of any of those (difflib fuzzy matching).
+resolve_race() turns such a track string into the round number used to load
+the session.
+
+Example Usage:
+    index = ScheduleIndex('cache/schedule_index.json', ttl=24 * 3600)
+    index.tracks(2024)                # [{'round': 1, 'name': 'Bahrain Grand Prix', ...}, ...]
+    index.find(2024, 'silverstne')    # the British Grand Prix record
+    index.resolve_race(2024, 'monza') # 16
+    body, etag = index.tracks_json(2024)
+"""
+
+from pathlib import Path
+from threading import Lock
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+import difflib
+import hashlib
+import json
+import logging
+import os
+import time
+import uuid
+
+import fastf1
+import numpy as np
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+INDEX_VERSION = 2
+DEFAULT_TTL = 24 * 3600
+
+
+def schedule_records(schedule: pd.DataFrame) -> List[Dict[str, Any]]:
+    """
+    Convert a FastF1 event schedule into track records, sorted by round.
+
+    Testing events and rounds <= 0 are skipped. Columns are read as whole
+    arrays rather than row by row.
+
+    Returns:
+        list: {'round', 'name', 'location', 'country', 'date'} per event
+    """
+    n = len(schedule)
+
+    def column(*names, default=''):
+        for name in names:
+            if name in schedule.columns:
+                return schedule[name].to_numpy()
+        return np.full(n, default, dtype=object)
+
+    rounds = pd.to_numeric(pd.Series(column('RoundNumber', 'Round', default=0)), errors='coerce').fillna(0)
+    rounds = rounds.to_numpy(dtype=int)
+    formats = pd.Series(column('EventFormat')).astype(str).str.lower().to_numpy()
+    keep = (rounds > 0) & (formats != 'testing')
+    names = column('EventName', 'Event')
+    locations = column('Location', 'Country')
+    countries = column('Country')
+    # Dates keep the str(pd.Timestamp) format ("2024-03-02 00:00:00"); raw numpy
+    # datetime64 values would print with nanoseconds
+    if 'EventDate' in schedule.columns:
+        dates = [str(date) for date in pd.to_datetime(schedule['EventDate'].to_numpy()[keep])]
+    else:
+        dates = [''] * int(keep.sum())
+    records = [
+        {'round': int(r), 'name': str(name), 'location': str(location), 'country': str(country), 'date': date}
+        for r, name, location, country, date in zip(rounds[keep], names[keep], locations[keep], countries[keep],
+                                                   dates)
+    ]
+    records.sort(key=lambda record: record['round'])
+    return records
+
+
+class ScheduleIndex:
+    """
+    TTL-refreshed, persisted index of the event schedule per season.
+
+    Attributes:
+        path (Path): JSON file the index is persisted to (None to keep it in memory only)
+        ttl (float): Seconds before a season is fetched again
+
+    Example Usage:
+        index = ScheduleIndex('cache/schedule_index.json')
+        record = index.find(2024, 8)
+    """
+
+    def __init__(self,
+                 path: Optional[Union[str, Path]] = 'cache/schedule_index.json',
+                 ttl: float = DEFAULT_TTL,
+                 fetch: Optional[Callable[[int], pd.DataFrame]] = None):
+        """
+        Args:
+            path: JSON file to persist the index to
+            ttl: Seconds before a season is fetched again
+            fetch: Function returning the schedule frame of a year
+                (default: fastf1.get_event_schedule)
+        """
+        self.path = Path(path) if path is not None else None
+        self.ttl = ttl
+        self._fetch = fetch or fastf1.get_event_schedule
+        self._lock = Lock()
+        self._seasons: Dict[int, Dict[str, Any]] = {}
+        self._blobs: Dict[int, tuple] = {}  # year -> (body, etag, season it was built from)
+        self._load()
+
+    def _load(self) -> None:
+        if self.path is None or not self.path.is_file():
+            return
+        try:
+            data = json.loads(self.path.read_text())
+            if data.get('version') == INDEX_VERSION:
+                self._seasons = {int(year): season for year, season in data['seasons'].items()}
+        except (OSError, ValueError, KeyError) as e:
+            logger.warning(f"Ignoring unreadable schedule index {self.path}: {e}")
+
+    def _save_locked(self) -> None:
+        if self.path is None:
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.path.with_name(f".{self.path.name}.{uuid.uuid4().hex[:8]}.tmp")
+        try:
+            tmp.write_text(json.dumps({'version': INDEX_VERSION,
+                                       'seasons': {str(year): season for year, season in self._seasons.items()}}))
+            os.replace(tmp, self.path)
+        except OSError as e:
+            logger.warning(f"Could not persist schedule index to {self.path}: {e}")
+        finally:
+            if tmp.exists():
+                tmp.unlink()
+
+    def _season(self, year: int) -> Dict[str, Any]:
+        year = int(year)
+        with self._lock:
+            season = self._seasons.get(year)
+            if season is not None and time.time() - season['fetched_at'] < self.ttl:
+                return season
+        try:
+            records = schedule_records(self._fetch(year))
+        except Exception as e:
+            if season is not None:
+                logger.warning(f"Schedule refresh for {year} failed, serving cached copy: {e}")
+                return season
+            raise ValueError(f"Could not load the {year} event schedule") from e
+        season = {'fetched_at': time.time(), 'tracks': records}
+        with self._lock:
+            self._seasons[year] = season
+            self._blobs.pop(year, None)
+            self._save_locked()
+        logger.info(f"Indexed {len(records)} events for {year}")
+        return season
+
+    def tracks(self, year: int) -> List[Dict[str, Any]]:
+        """
+        Return the track records of a season, sorted by round.
+
+        Raises:
+            ValueError: If the schedule cannot be loaded and no cached copy exists
+        """
+        return self._season(year)['tracks']
+
+    def tracks_json(self, year: int) -> Tuple[bytes, str]:
+        """
+        Return the serialized /api/tracks response of a season and its ETag.
+
+        The body is serialized once per refresh; the ETag is a hash of the body.
+        """
+        season = self._season(year)
+        with self._lock:
+            blob = self._blobs.get(int(year))
+            if blob is None or blob[2] is not season:
+                body = json.dumps({'success': True, 'tracks': season['tracks']}).encode('utf-8')
+                blob = (body, hashlib.sha1(body).hexdigest(), season)
+                self._blobs[int(year)] = blob
+        return blob[0], blob[1]
+
+    def find(self, year: int, query: Union[int, str]) -> Optional[Dict[str, Any]]:
+        """
+        Look up an event by round number, event name, location or country.
+
+        Matching is tried in order: round number, exact (case-insensitive)
+        name/location/country, substring, then the closest fuzzy match.
+
+        Returns:
+            dict or None: Track record, or None if nothing matches
+        """
+        records = self.tracks(year)
+        text = str(query).strip().lower()
+        if text.isdigit():
+            return next((r for r in records if r['round'] == int(text)), None)
+        fields = ('name', 'location', 'country')
+        for record in records:
+            if any(record[f].lower() == text for f in fields):
+                return record
+        for record in records:
+            if any(text in record[f].lower() for f in fields):
+                return record
+        candidates = {record[f].lower(): record for record in records for f in fields}
+        match = difflib.get_close_matches(text, list(candidates), n=1, cutoff=0.6)
+        return candidates[match[0]] if match else None
+
+    def resolve_race(self, year: int, track: Union[int, str]) -> Union[int, str]:
+        """
+        Return the round number of the event a track string names (see find()).
+
+        The track is returned unchanged if nothing matches or the schedule
+        cannot be loaded, so FastF1 can still try its own event lookup.
+        """
+        try:
+            record = self.find(year, track)
+        except ValueError as e:
+            logger.warning(f"Could not resolve track {track!r} for {year}: {e}")
+            return track
+        return record['round'] if record is not None else track
@@ -0,0 +1,121 @@
+"""
+F1 Session Index Module
+
+This module provides the SessionIndex class, a per-session index of the lap
+table built once when a session is loaded.
+
+Picking a lap with session.laps.pick_drivers([...]).pick_fastest() filters
+the whole lap table on every call, and validating a driver code rebuilt and
+lower-cased the sorted driver list. A comparison request does both twice.
+The index groups the lap table's row positions by driver in one pass. It also
+resolves the fastest, first and last lap of every driver up front, so lap
+selection and driver validation become dictionary lookups.
+
+The fastest-lap pointer follows Laps.pick_fastest(): only laps marked
+IsPersonalBest are considered, and ties go to the first lap clocked.
+
+Example Usage:
+    index = SessionIndex(session.laps)
+    index.has_driver('ver')             # True
+    lap = index.lap('VER', 'fastest')   # same row as pick_drivers(['VER']).pick_fastest()
+"""
+
+from typing import Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+
+LAP_TYPES = ('fastest', 'first', 'last')
+
+
+class SessionIndex:
+    """
+    Driver -> lap lookups for one session's lap table.
+
+    Attributes:
+        laps (Laps): The indexed lap table (session.laps)
+        drivers (list): Sorted driver codes
+        driver_set (frozenset): Upper-cased driver codes, for validation
+
+    Example Usage:
+        index = SessionIndex(session.laps)
+        lap = index.lap('HAM', lap_number=12)
+    """
+
+    def __init__(self, laps: pd.DataFrame):
+        self.laps = laps
+        n = len(laps)
+        codes = laps['Driver'].astype(str).str.upper().to_numpy() if n else np.empty(0, dtype=object)
+        unique, inverse = np.unique(codes, return_inverse=True)
+        order = np.argsort(inverse, kind='stable')
+        bounds = np.cumsum(np.bincount(inverse, minlength=len(unique)))[:-1]
+        self._rows: Dict[str, np.ndarray] = dict(zip(unique.tolist(), np.split(order, bounds)))
+        self.drivers: List[str] = sorted(laps['Driver'].unique()) if n else []
+        self.driver_set = frozenset(self._rows)
+
+        self._first = {code: int(rows[0]) for code, rows in self._rows.items()}
+        self._last = {code: int(rows[-1]) for code, rows in self._rows.items()}
+        self._fastest = self._fastest_rows(laps, codes, inverse, len(unique))
+        self._lap_numbers: Dict[str, Dict[int, int]] = {}
+        if n and 'LapNumber' in laps.columns:
+            numbers = pd.to_numeric(laps['LapNumber'], errors='coerce').to_numpy()
+            for code, rows in self._rows.items():
+                lap_map = {}
+                for row, number in zip(rows.tolist(), numbers[rows].tolist()):
+                    if number == number:  # not NaN
+                        lap_map.setdefault(int(number), row)
+                self._lap_numbers[code] = lap_map
+
+    @staticmethod
+    def _fastest_rows(laps: pd.DataFrame, codes: np.ndarray, inverse: np.ndarray,
+                      n_drivers: int) -> Dict[str, int]:
+        """Row of each driver's fastest personal-best lap (first clocked on ties)."""
+        if not len(laps) or 'LapTime' not in laps.columns or 'IsPersonalBest' not in laps.columns:
+            return {}
+        lap_time = laps['LapTime']
+        seconds = (lap_time.dt.total_seconds() if pd.api.types.is_timedelta64_dtype(lap_time)
+                   else pd.to_numeric(lap_time, errors='coerce')).to_numpy(dtype=float)
+        valid = (laps['IsPersonalBest'] == True).to_numpy() & ~np.isnan(seconds)  # noqa: E712
+        rows = np.flatnonzero(valid)
+        if not len(rows):
+            return {}
+        # Sort candidates by driver, then lap time, then position; the first row per driver wins
+        ordered = rows[np.lexsort((rows, seconds[rows], inverse[rows]))]
+        first = np.ones(len(ordered), dtype=bool)
+        first[1:] = inverse[ordered][1:] != inverse[ordered][:-1]
+        return {codes[row]: int(row) for row in ordered[first]}
+
+    def has_driver(self, driver_code: str) -> bool:
+        """Return True if the driver has laps in the session (case-insensitive)."""
+        return str(driver_code).upper() in self.driver_set
+
+    def driver_laps(self, driver_code: str) -> pd.DataFrame:
+        """Return all laps of a driver (like laps.pick_drivers([driver_code]))."""
+        rows = self._rows.get(str(driver_code).upper())
+        return self.laps.iloc[rows] if rows is not None else self.laps.iloc[:0]
+
+    def lap_position(self, driver_code: str, lap_type: str = 'fastest',
+                     lap_number: Optional[int] = None) -> Optional[int]:
+        """
+        Return the row position of a driver's lap in the lap table, or None.
+
+        Args:
+            driver_code: Three-letter driver code (case-insensitive)
+            lap_type: 'fastest', 'first' or 'last'
+            lap_number: Specific lap number (overrides lap_type)
+        """
+        code = str(driver_code).upper()
+        if lap_number is not None:
+            return self._lap_numbers.get(code, {}).get(int(lap_number))
+        if lap_type == 'fastest':
+            return self._fastest.get(code)
+        if lap_type == 'first':
+            return self._first.get(code)
+        if lap_type == 'last':
+            return self._last.get(code)
+        return None
+
+    def lap(self, driver_code: str, lap_type: str = 'fastest', lap_number: Optional[int] = None):
+        """Return a driver's lap (a Lap row of the lap table), or None if there is no such lap."""
+        position = self.lap_position(driver_code, lap_type, lap_number)
+        return self.laps.iloc[position] if position is not None else None
@@ -0,0 +1,206 @@
+"""
+F1 Session Pool Module
+
+This module provides the SessionPool class, an in-memory LRU pool of loaded
+FastF1 sessions keyed by (year, event, session_type).
+
+The web application serves many users at once, each potentially looking at a
+different Grand Prix. Holding a single "current" session means every request
+for another event evicts the previous one and forces a full session.load().
+The pool keeps several sessions warm and evicts the least recently used ones
+when either the session count or the estimated memory budget is exceeded.
+
+Loads are coalesced per key: concurrent requests for a session that is
+already being loaded wait for that single load instead of parsing it again,
+while loads for different sessions proceed in parallel.
+"""
+
+from collections import OrderedDict
+from concurrent.futures import Future
+from threading import Lock
+from typing import Any, Callable, Optional, Tuple, Union
+import logging
+
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+SessionKey = Tuple[int, str, str]
+
+
+def make_session_key(year: Union[int, str], race: Union[int, str], session_type: str) -> SessionKey:
+    """
+    Build a normalized pool key for a session.
+
+    Args:
+        year: Season year (e.g., 2024)
+        race: Race name or round number
+        session_type: Session identifier ('FP1', 'Q', 'R', ...)
+
+    Returns:
+        SessionKey: (year, lower-cased event, upper-cased session type)
+    """
+    return (int(year), str(race).strip().lower(), str(session_type).strip().upper())
+
+
+def format_session_key(key: SessionKey) -> str:
+    """Return the string form of a session key used by the web API (e.g. '2024:monaco:Q')."""
+    return f"{key[0]}:{key[1]}:{key[2]}"
+
+
+def parse_session_key(value: str) -> SessionKey:
+    """
+    Parse the string form produced by format_session_key().
+
+    Raises:
+        ValueError: If the string is not a valid session key
+    """
+    parts = str(value).split(':')
+    if len(parts) != 3:
+        raise ValueError(f"Invalid session key: {value!r}")
+    try:
+        return make_session_key(*parts)
+    except (TypeError, ValueError) as e:
+        raise ValueError(f"Invalid session key: {value!r}") from e
+
+
+def estimate_session_bytes(session: Any) -> int:
+    """
+    Estimate the in-memory footprint of a loaded FastF1 session.
+
+    Sums the lap table plus the per-driver car and position telemetry frames.
+    Attributes that are missing or not loaded are ignored.
+    """
+    total = 0
+    for attr in ('laps', 'results', 'weather_data'):
+        try:
+            frame = getattr(session, attr, None)
+        except Exception:
+            frame = None
+        if isinstance(frame, pd.DataFrame):
+            total += int(frame.memory_usage(index=True, deep=True).sum())
+    for attr in ('car_data', 'pos_data'):
+        try:
+            frames = getattr(session, attr, None)
+        except Exception:
+            frames = None
+        if isinstance(frames, dict):
+            for frame in frames.values():
+                if isinstance(frame, pd.DataFrame):
+                    total += int(frame.memory_usage(index=True, deep=False).sum())
+    return total
+
+
+class SessionPool:
+    """
+    Thread-safe LRU pool of loaded F1 sessions.
+
+    Attributes:
+        max_sessions (int): Maximum number of sessions kept in memory
+        max_bytes (int): Memory budget across all pooled sessions (estimated)
+
+    Example Usage:
+        pool = SessionPool(max_sessions=4)
+        key = make_session_key(2024, 'Monaco', 'Q')
+        session = pool.get_or_load(key, lambda: loader_fn(2024, 'Monaco', 'Q'))
+    """
+
+    def __init__(self, max_sessions: int = 4, max_bytes: int = 2 * 1024 ** 3):
+        if max_sessions < 1:
+            raise ValueError("max_sessions must be at least 1")
+        self.max_sessions = max_sessions
+        self.max_bytes = max_bytes
+        self._entries = OrderedDict()  # key -> (session, size_bytes)
+        self._inflight = {}  # key -> Future for loads in progress
+        self._lock = Lock()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    def __contains__(self, key: SessionKey) -> bool:
+        with self._lock:
+            return key in self._entries
+
+    def keys(self) -> list:
+        """Return pooled keys ordered from least to most recently used."""
+        with self._lock:
+            return list(self._entries.keys())
+
+    @property
+    def total_bytes(self) -> int:
+        """Estimated memory held by all pooled sessions."""
+        with self._lock:
+            return sum(size for _, size in self._entries.values())
+
+    def get(self, key: SessionKey) -> Optional[Any]:
+        """Return the pooled session for key (marking it recently used), or None."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            self._entries.move_to_end(key)
+            return entry[0]
+
+    def put(self, key: SessionKey, session: Any) -> None:
+        """Add or replace a session and evict least recently used entries over budget."""
+        size = estimate_session_bytes(session)
+        with self._lock:
+            self._entries[key] = (session, size)
+            self._entries.move_to_end(key)
+            self._evict_locked()
+
+    def remove(self, key: SessionKey) -> None:
+        """Drop a session from the pool if present."""
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        """Drop all pooled sessions."""
+        with self._lock:
+            self._entries.clear()
+
+    def get_or_load(self, key: SessionKey, load_fn: Callable[[], Any]) -> Any:
+        """
+        Return the pooled session for key, loading and pooling it on a miss.
+
+        Only one load runs per key at a time; concurrent callers for the same
+        key block until it finishes and share its result (or its exception).
+        The pool lock is not held while loading, so other keys are unaffected.
+
+        Args:
+            key: Session key from make_session_key()
+            load_fn: Zero-argument callable returning a loaded session
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                return entry[0]
+            future = self._inflight.get(key)
+            owner = future is None
+            if owner:
+                future = Future()
+                self._inflight[key] = future
+        if not owner:
+            return future.result()
+        try:
+            session = load_fn()
+        except BaseException as e:
+            with self._lock:
+                self._inflight.pop(key, None)
+            future.set_exception(e)
+            raise
+        self.put(key, session)
+        with self._lock:
+            self._inflight.pop(key, None)
+        future.set_result(session)
+        return session
+
+    def _evict_locked(self) -> None:
+        # Always keep the most recently used session, even if it alone exceeds the budget
+        total = sum(size for _, size in self._entries.values())
+        while len(self._entries) > 1 and (len(self._entries) > self.max_sessions or total > self.max_bytes):
+            evicted_key, (_, size) = self._entries.popitem(last=False)
+            total -= size
+            logger.info(f"Evicted session {format_session_key(evicted_key)} from pool ({size} bytes)")
@@ -0,0 +1,250 @@
+"""
+F1 Session Summary Module
+
+This module provides the SessionSummaryStore class, an on-disk cache of the
+lightweight, derived data of a session: its lap table, driver list, lap count
+and session info.
+
+Listing the drivers of a session normally requires a full session.load()
+(timing, car and position data for every driver), which takes seconds even
+from a warm FastF1 cache. The summary store keeps the few kilobytes the
+dashboard needs to populate its selectors, so a warmed session (see warmup.py)
+can be opened without loading it at all.
+
+The lap table is stored once per session as column-wise JSON (timedeltas and
+datetimes as integer nanoseconds, so lap boundaries round-trip exactly). A
+summary stored under a second key (e.g. the event name as well as the round
+number) links to that table through its 'laps_key' instead of a copy.
+StoredSession wraps a stored lap table as a stand-in for the loaded session:
+laps can be selected and their stored telemetry read without loading the
+session, which is loaded only once something else (car data for a lap not in
+the telemetry store, circuit info, ...) is needed.
+
+Layout:
+    <root>/v<version>/<year>/<event or round>/<session type>/summary.json
+    <root>/v<version>/<year>/<event or round>/<session type>/laps.json
+"""
+
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional
+import json
+import logging
+import os
+import uuid
+
+import fastf1
+import numpy as np
+import pandas as pd
+
+from .session_pool import SessionKey, make_session_key
+from .telemetry_store import _slug
+
+logger = logging.getLogger(__name__)
+
+SUMMARY_VERSION = 2
+
+_NAT = np.iinfo(np.int64).min  # NaT as int64 nanoseconds
+
+
+def _write_atomic(path: Path, write) -> None:
+    tmp = path.with_name(f".{path.name}.{uuid.uuid4().hex[:8]}.tmp")
+    try:
+        write(tmp)
+        os.replace(tmp, path)
+    finally:
+        if tmp.exists():
+            tmp.unlink()
+
+
+def _json_scalar(value: Any) -> Any:
+    if isinstance(value, np.generic):
+        value = value.item()
+    if value is None or (isinstance(value, float) and np.isnan(value)) or value is pd.NaT:
+        return None
+    if isinstance(value, (pd.Timestamp, pd.Timedelta)):
+        return str(value)
+    return value
+
+
+def laps_to_json(laps: pd.DataFrame) -> Dict[str, Any]:
+    """
+    Encode a lap table as JSON-ready columns.
+
+    Returns:
+        dict: {'columns': [...], 'dtypes': {column: dtype}, 'data': {column: [...]}};
+            timedelta and datetime columns hold integer nanoseconds (None for NaT)
+    """
+    data, dtypes = {}, {}
+    for col in laps.columns:
+        series = laps[col]
+        dtypes[col] = str(series.dtype)
+        if pd.api.types.is_timedelta64_dtype(series) or pd.api.types.is_datetime64_any_dtype(series):
+            if getattr(series.dtype, 'tz', None) is not None:
+                series = series.dt.tz_convert('UTC').dt.tz_localize(None)
+            kind = 'timedelta64[ns]' if pd.api.types.is_timedelta64_dtype(series) else 'datetime64[ns]'
+            nanos = series.astype(kind).to_numpy().view(np.int64)
+            data[col] = [None if n == _NAT else n for n in nanos.tolist()]
+        else:
+            data[col] = [_json_scalar(value) for value in series.tolist()]
+    return {'columns': [str(col) for col in laps.columns], 'dtypes': dtypes, 'data': data}
+
+
+def laps_from_json(encoded: Dict[str, Any]) -> pd.DataFrame:
+    """Decode a lap table written by laps_to_json()."""
+    columns = {}
+    for col in encoded['columns']:
+        values, dtype = encoded['data'][col], encoded['dtypes'][col]
+        if dtype.startswith(('timedelta64', 'datetime64')):
+            nanos = np.array([_NAT if n is None else n for n in values], dtype=np.int64)
+            series = pd.Series(nanos.view('timedelta64[ns]' if dtype.startswith('timedelta64') else 'datetime64[ns]'))
+            tz = getattr(pd.api.types.pandas_dtype(dtype), 'tz', None)
+            columns[col] = series.dt.tz_localize('UTC').dt.tz_convert(tz) if tz is not None else series
+        else:
+            series = pd.Series(values, dtype=object if dtype == 'object' else None)
+            try:
+                series = series.astype(dtype)
+            except (TypeError, ValueError):
+                pass  # e.g. an int column that now holds None
+            columns[col] = series
+    return pd.DataFrame(columns, columns=encoded['columns'])
+
+
+class StoredEvent(dict):
+    """Event fields of a stored session (EventName, Location, Country, RoundNumber) plus its year."""
+
+    def __init__(self, fields: Dict[str, Any], year: int):
+        super().__init__(fields)
+        self.year = year
+
+
+class StoredSession:
+    """
+    A warmed session's stored lap table, standing in for the loaded session.
+
+    event, name, date and laps are read from the store. Any other attribute
+    (car_data, pos_data, get_circuit_info, ...) is read from the real
+    session, which is obtained through load (normally the session pool) on
+    first use. Laps therefore work with Lap.get_telemetry() and
+    lap_store_key() like those of the loaded session.
+
+    Attributes:
+        key (SessionKey): Key the session was requested under
+        event (StoredEvent): Event fields and year
+        name (str): Session name (e.g. 'Qualifying')
+        date (pd.Timestamp or None): Session date
+        laps (fastf1.core.Laps): Stored lap table bound to this session
+
+    Example Usage:
+        session = StoredSession(key, summary, laps, load=lambda: loader.get_session(*key))
+        lap = SessionIndex(session.laps).lap('VER', 'fastest')
+    """
+
+    def __init__(self, key: SessionKey, summary: Dict[str, Any], laps: pd.DataFrame,
+                 load: Callable[[], Any]):
+        info = summary.get('session_info') or {}
+        event = summary['event']
+        self.key = key
+        self.event = StoredEvent({k: v for k, v in event.items() if k != 'year'}, int(event['year']))
+        self.name = info.get('session_type')
+        self.date = pd.Timestamp(info['date']) if info.get('date') else None
+        self.laps = fastf1.core.Laps(laps, session=self)
+        self._load = load
+
+    def __getattr__(self, name: str) -> Any:
+        # Only called for attributes not stored above
+        if name.startswith('__') or name == '_load':
+            raise AttributeError(name)
+        logger.info(f"Loading {self.key} for {name}")
+        return getattr(self._load(), name)
+
+
+class SessionSummaryStore:
+    """
+    On-disk store of session summaries (lap table, drivers, lap count, session info).
+
+    Attributes:
+        root (Path): Root directory of the store
+
+    Example Usage:
+        store = SessionSummaryStore('cache/sessions')
+        key = make_session_key(2024, 'Monaco Grand Prix', 'Q')
+        store.save_laps(key, session.laps)
+        store.save(key, dict(summary, laps_key=list(key)))
+        laps = store.load_laps(make_session_key(2024, 'monaco grand prix', 'Q'))
+    """
+
+    def __init__(self, root: str = 'cache/sessions'):
+        self.root = Path(root)
+        self.root.mkdir(parents=True, exist_ok=True)
+
+    def path_for(self, key: SessionKey) -> Path:
+        """Return the directory holding the summary for a session key."""
+        year, race, session_type = key
+        return self.root / f"v{SUMMARY_VERSION}" / str(year) / _slug(race) / _slug(session_type)
+
+    def contains(self, key: SessionKey) -> bool:
+        """Return True if a summary is stored for the session."""
+        return (self.path_for(key) / 'summary.json').is_file()
+
+    def load(self, key: SessionKey) -> Optional[Dict[str, Any]]:
+        """
+        Load a stored summary.
+
+        Returns:
+            dict or None: {'session_info': dict, 'event': dict, 'drivers': list,
+                'n_laps': int, 'laps_key': [year, race, session type] of the lap table}
+        """
+        path = self.path_for(key) / 'summary.json'
+        try:
+            return json.loads(path.read_text())
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable session summary {path}: {e}")
+            return None
+
+    def load_laps(self, key: SessionKey) -> Optional[pd.DataFrame]:
+        """
+        Load the stored lap table of a session (following the summary's laps_key).
+
+        Returns:
+            pd.DataFrame or None if no lap table is stored for the session
+        """
+        summary = self.load(key)
+        if summary is None:
+            return None
+        laps_key = make_session_key(*summary['laps_key']) if summary.get('laps_key') else key
+        path = self.path_for(laps_key) / 'laps.json'
+        try:
+            return laps_from_json(json.loads(path.read_text()))
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            logger.warning(f"Ignoring unreadable lap table {path}: {e}")
+            return None
+
+    def save_laps(self, key: SessionKey, laps: pd.DataFrame) -> Path:
+        """Persist the lap table of a session under a key (see laps_to_json())."""
+        path = self.path_for(key)
+        path.mkdir(parents=True, exist_ok=True)
+        text = json.dumps(laps_to_json(pd.DataFrame(laps)))
+        _write_atomic(path / 'laps.json', lambda tmp: tmp.write_text(text))
+        return path / 'laps.json'
+
+    def save(self, key: SessionKey, summary: Dict[str, Any]) -> Path:
+        """
+        Persist a session summary.
+
+        The file is written under a temporary name and renamed into place, so
+        readers never see a partial entry. Write the lap table (save_laps())
+        before the summaries that link to it.
+
+        Returns:
+            Path: Directory of the stored entry
+        """
+        path = self.path_for(key)
+        path.mkdir(parents=True, exist_ok=True)
+        text = json.dumps(summary, default=str)
+        _write_atomic(path / 'summary.json', lambda tmp: tmp.write_text(text))
+        logger.info(f"Stored session summary for {key} in {path}")
+        return path
@@ -0,0 +1,205 @@
+"""
+F1 Stint Analysis Module
+
+Per-lap telemetry metrics for every lap of a driver (or session), aggregated
+per stint and tyre compound.
+
+Telemetry for all laps is extracted concurrently (F1DataLoader.get_telemetry_many,
+served from the telemetry store when warm), stacked, and measured in one
+vectorized pass with the DriverPerformanceAnalyzer metrics of batch_metrics.
+Each stint is then summarized with:
+
+- degradation_slope: lap time change per lap of tyre life (s/lap), least
+  squares over the stint's representative laps
+- braking_consistency: standard deviation of the per-lap braking distance (m)
+- smoothness_drift: change of throttle_smoothness per lap of tyre life
+
+Representative laps exclude in/out laps and laps slower than
+QUICKLAP_THRESHOLD x the stint median (traffic, yellow flags), as in
+FastF1's pick_quicklaps(). They are flagged once, in the per-lap table's
+representative column, which the summary and the report plot both use.
+
+write_stint_report() saves CSV tables and a PNG overview without opening a
+window, so the analysis runs in batch jobs.
+
+Example Usage:
+    laps = session.laps.pick_drivers(['VER'])
+    lap_metrics = stint_lap_metrics(loader, laps)
+    stints = summarize_stints(lap_metrics)
+    write_stint_report(lap_metrics, stints, 'outputs/stints', 'ver_monza_r')
+"""
+
+from pathlib import Path
+from typing import Any, Dict, Optional
+import logging
+
+import numpy as np
+import pandas as pd
+
+from .batch_metrics import StackedTelemetry, batch_braking_zones, compute_batch_metrics
+from .visualization import plot_stint_report
+
+logger = logging.getLogger(__name__)
+
+QUICKLAP_THRESHOLD = 1.07
+
+STINT_KEYS = ['Driver', 'Stint', 'Compound']
+
+
+def lap_table(laps: pd.DataFrame, threshold: float = QUICKLAP_THRESHOLD) -> pd.DataFrame:
+    """
+    Return the timing columns of a lap table used for stint analysis.
+
+    Args:
+        laps: FastF1 Laps frame
+        threshold: Laps slower than threshold x the stint median lap time are
+            not representative
+
+    Returns:
+        pd.DataFrame: Driver, LapNumber, lap_time (s), Stint, Compound,
+            TyreLife, pit_lap (in or out lap) and representative
+    """
+    n = len(laps)
+
+    def column(name, default=np.nan):
+        return laps[name].to_numpy() if name in laps.columns else np.full(n, default, dtype=object)
+
+    lap_time = laps['LapTime'] if 'LapTime' in laps.columns else pd.Series(pd.NaT, index=laps.index)
+    pit_in = pd.notna(column('PitInTime', None))
+    pit_out = pd.notna(column('PitOutTime', None))
+    table = pd.DataFrame({
+        'Driver': column('Driver'),
+        'LapNumber': pd.to_numeric(pd.Series(column('LapNumber')), errors='coerce').to_numpy(),
+        'lap_time': pd.to_timedelta(lap_time).dt.total_seconds().to_numpy(),
+        'Stint': pd.to_numeric(pd.Series(column('Stint')), errors='coerce').fillna(1).to_numpy(dtype=int),
+        'Compound': pd.Series(column('Compound', 'UNKNOWN')).fillna('UNKNOWN').astype(str).to_numpy(),
+        'TyreLife': pd.to_numeric(pd.Series(column('TyreLife')), errors='coerce').to_numpy(),
+        'pit_lap': pit_in | pit_out,
+    })
+    # Without tyre life data, count laps within the stint instead
+    missing = np.isnan(table['TyreLife'].to_numpy(dtype=float))
+    if missing.any():
+        position = table.groupby(['Driver', 'Stint']).cumcount().to_numpy() + 1
+        table.loc[missing, 'TyreLife'] = position[missing]
+    median = table.groupby(STINT_KEYS)['lap_time'].transform('median')
+    table['representative'] = ~table['pit_lap'] & (table['lap_time'] <= threshold * median)
+    return table
+
+
+def stint_lap_metrics(loader: Any,
+                      laps: pd.DataFrame,
+                      max_workers: Optional[int] = None,
+                      threshold: float = QUICKLAP_THRESHOLD) -> pd.DataFrame:
+    """
+    Extract telemetry for every lap concurrently and compute per-lap metrics.
+
+    Args:
+        loader: F1DataLoader used to extract (or read stored) telemetry
+        laps: FastF1 Laps frame (e.g. session.laps.pick_drivers(['VER']))
+        max_workers: Maximum concurrent telemetry extractions
+        threshold: Representative lap threshold (see lap_table())
+
+    Returns:
+        pd.DataFrame: lap_table() columns joined with the batch metrics
+            (see compute_batch_metrics) and braking_distance (m per lap);
+            laps without telemetry keep NaN metrics
+    """
+    table = lap_table(laps, threshold)
+    rows = laps.iterlaps() if hasattr(laps, 'iterlaps') else laps.iterrows()
+    lap_list = [lap for _, lap in rows]
+    telemetries = loader.get_telemetry_many(lap_list, max_workers=max_workers, skip_errors=True)
+    frames = [((lap['Driver'], int(lap['LapNumber'])), telemetry)
+              for lap, telemetry in zip(lap_list, telemetries) if telemetry is not None]
+    logger.info(f"Computing stint metrics for {len(frames)} of {len(lap_list)} laps")
+    if not frames:
+        return table
+    stacked = StackedTelemetry.from_frames(frames)
+    metrics = compute_batch_metrics(stacked)
+    zones = batch_braking_zones(stacked)
+    braking = (zones['end_distance'] - zones['start_distance']).groupby(zones['lap_index']).sum()
+    metrics['braking_distance'] = braking.reindex(np.arange(len(stacked)), fill_value=0.0).to_numpy()
+    return table.merge(metrics.drop(columns='samples'), on=['Driver', 'LapNumber'], how='left')
+
+
+def _group_slope(x: pd.Series, y: pd.Series, groups: list) -> pd.Series:
+    """Least-squares slope of y on x per group, from grouped sums (NaN pairs ignored)."""
+    valid = x.notna() & y.notna()
+    frame = pd.DataFrame({'x': x.where(valid), 'y': y.where(valid)})
+    frame['n'] = valid.astype(float)
+    frame['xy'] = frame['x'] * frame['y']
+    frame['xx'] = frame['x'] ** 2
+    sums = frame.groupby(groups).sum(min_count=1)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        denominator = sums['n'] * sums['xx'] - sums['x'] ** 2
+        slope = (sums['n'] * sums['xy'] - sums['x'] * sums['y']) / denominator
+    return slope.where((sums['n'] >= 2) & (denominator > 0))
+
+
+def summarize_stints(lap_metrics: pd.DataFrame) -> pd.DataFrame:
+    """
+    Aggregate per-lap metrics per driver, stint and compound.
+
+    Fits and aggregates use the laps flagged in the representative column.
+
+    Args:
+        lap_metrics: Output of stint_lap_metrics()
+
+    Returns:
+        pd.DataFrame: One row per stint with Driver, Stint, Compound, laps,
+            representative_laps, first_lap, last_lap, median_lap_time,
+            degradation_slope (s/lap), braking_consistency (m),
+            throttle_smoothness, smoothness_drift (per lap) and
+            full_throttle_percentage
+    """
+    rep = lap_metrics[lap_metrics['representative'].astype(bool)]
+    groups = lap_metrics.groupby(STINT_KEYS)
+    summary = pd.DataFrame({
+        'laps': groups.size(),
+        'first_lap': groups['LapNumber'].min(),
+        'last_lap': groups['LapNumber'].max(),
+    })
+    rep_groups = rep.groupby(STINT_KEYS)
+    summary['representative_laps'] = rep_groups.size()
+    summary['median_lap_time'] = rep_groups['lap_time'].median()
+    summary['degradation_slope'] = _group_slope(rep['TyreLife'], rep['lap_time'], [rep[k] for k in STINT_KEYS])
+    for col, agg in [('braking_distance', 'std'), ('throttle_smoothness', 'mean'),
+                     ('full_throttle_percentage', 'mean')]:
+        summary[col] = rep_groups[col].agg(agg) if col in rep.columns else np.nan
+    summary = summary.rename(columns={'braking_distance': 'braking_consistency'})
+    if 'throttle_smoothness' in rep.columns:
+        summary['smoothness_drift'] = _group_slope(rep['TyreLife'], rep['throttle_smoothness'],
+                                                   [rep[k] for k in STINT_KEYS])
+    else:
+        summary['smoothness_drift'] = np.nan
+    summary['representative_laps'] = summary['representative_laps'].fillna(0).astype(int)
+    summary = summary.reset_index().sort_values(['Driver', 'Stint'], kind='stable').reset_index(drop=True)
+    return summary[STINT_KEYS + ['laps', 'representative_laps', 'first_lap', 'last_lap', 'median_lap_time',
+                                 'degradation_slope', 'braking_consistency', 'throttle_smoothness',
+                                 'smoothness_drift', 'full_throttle_percentage']]
+
+
+def write_stint_report(lap_metrics: pd.DataFrame,
+                       stints: pd.DataFrame,
+                       output_dir: str,
+                       name: str,
+                       title: Optional[str] = None,
+                       profile: str = 'print') -> Dict[str, Path]:
+    """
+    Write a headless stint report: per-lap and per-stint CSV tables and a PNG overview.
+
+    Returns:
+        dict: Paths of the written 'laps', 'stints' and 'plot' files
+    """
+    output_path = Path(output_dir)
+    output_path.mkdir(parents=True, exist_ok=True)
+    paths = {
+        'laps': output_path / f'{name}_laps.csv',
+        'stints': output_path / f'{name}_stints.csv',
+        'plot': output_path / f'{name}_stints.png',
+    }
+    lap_metrics.to_csv(paths['laps'], index=False)
+    stints.to_csv(paths['stints'], index=False)
+    plot_stint_report(lap_metrics, stints, title=title or f'Stint Analysis - {name}', save_path=str(paths['plot']),
+                      profile=profile)
+    logger.info(f"Wrote stint report to {output_path}")
+    return paths
@@ -0,0 +1,72 @@
+"""
+F1 Telemetry Schema Module
+
+Column set and compact dtypes for cleaned lap telemetry.
+
+Raw FastF1 telemetry coerced with pd.to_numeric comes out as float64 for every
+channel, although gear and DRS are small integers and the continuous channels
+do not need double precision. TELEMETRY_DTYPES is the schema used wherever
+cleaned telemetry is produced or held (the loader, the telemetry store, the
+stacked session arrays, exports and the analyzer):
+
+- nGear, DRS: int8 (gear 0-8, DRS status 0-14)
+- Distance, Speed, Throttle, Brake, RPM, X, Y, Z: float32 (about 7 significant
+  digits: millimetres over a lap distance, well below the position resolution)
+- Time: unchanged (timedelta64)
+
+This cuts numeric channel memory from 8 to at most 4 bytes per value.
+"""
+
+from typing import Dict
+
+import numpy as np
+import pandas as pd
+
+# Channels returned by F1DataLoader.get_telemetry(), in order
+TELEMETRY_COLUMNS = ['Time', 'Distance', 'Speed', 'Throttle', 'Brake', 'RPM', 'nGear', 'DRS', 'X', 'Y', 'Z']
+
+TELEMETRY_DTYPES: Dict[str, np.dtype] = {
+    'Distance': np.dtype('float32'),
+    'Speed': np.dtype('float32'),
+    'Throttle': np.dtype('float32'),
+    'Brake': np.dtype('float32'),
+    'RPM': np.dtype('float32'),
+    'nGear': np.dtype('int8'),
+    'DRS': np.dtype('int8'),
+    'X': np.dtype('float32'),
+    'Y': np.dtype('float32'),
+    'Z': np.dtype('float32'),
+}
+
+
+def schema_dtype(col: str, values) -> np.dtype:
+    """
+    Return the compact dtype for a channel's values, or None to leave them as they are.
+
+    Non-numeric data and channels outside the schema are left alone; integer
+    channels that contain NaN fall back to float32.
+    """
+    dtype = TELEMETRY_DTYPES.get(col)
+    values_dtype = getattr(values, 'dtype', None)
+    if dtype is None or values_dtype is None:
+        return None
+    if not (pd.api.types.is_numeric_dtype(values_dtype) or pd.api.types.is_bool_dtype(values_dtype)):
+        return None
+    if dtype.kind == 'i' and values_dtype.kind == 'f' and np.isnan(np.asarray(values)).any():
+        return np.dtype('float32')
+    return dtype
+
+
+def apply_telemetry_schema(telemetry: pd.DataFrame) -> pd.DataFrame:
+    """
+    Cast the schema channels of a telemetry frame to their compact dtypes.
+
+    Returns the frame itself when nothing needs casting, otherwise a new frame
+    (the input is not modified).
+    """
+    casts = {}
+    for col in telemetry.columns:
+        dtype = schema_dtype(col, telemetry[col])
+        if dtype is not None and telemetry[col].dtype != dtype:
+            casts[col] = dtype
+    return telemetry.astype(casts) if casts else telemetry
@@ -0,0 +1,150 @@
+"""
+F1 Telemetry Store Module
+
+This module provides the TelemetryStore class, an on-disk columnar cache of
+cleaned per-lap telemetry frames (the output of F1DataLoader.get_telemetry()).
+
+FastF1's own cache stores raw API responses, so every lap.get_telemetry() call
+still merges car and position data and re-cleans the result. The store keeps
+the already-cleaned frame per (session, driver, lap) with one NumPy .npy file
+per column, so later calls read a few small binary files (which can be
+memory-mapped) instead of touching fastf1 at all. Columns are stored in the
+compact telemetry schema dtypes (version 2; version 1 entries were float64).
+
+Layout:
+    <root>/v<version>/<year>/<event>/<session>/<driver>_<lap>/<column>.npy
+"""
+
+from pathlib import Path
+from typing import Any, Iterable, Optional, Tuple
+import logging
+import os
+import re
+import shutil
+import uuid
+
+import numpy as np
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+LapKey = Tuple[int, str, str, str, int]
+
+STORE_VERSION = 2
+
+
+def _slug(value: Any) -> str:
+    return re.sub(r'[^a-z0-9]+', '_', str(value).lower()).strip('_') or 'unknown'
+
+
+def lap_store_key(lap: Any) -> Optional[LapKey]:
+    """
+    Build the store key for a FastF1 lap, or None if it cannot be identified.
+
+    Args:
+        lap: FastF1 Lap object (must carry its parent session)
+
+    Returns:
+        LapKey: (year, event name, session name, driver code, lap number)
+    """
+    session = getattr(lap, 'session', None)
+    if session is None:
+        return None
+    try:
+        event = session.event
+        year = int(getattr(event, 'year', None) or session.date.year)
+        event_name = event['EventName']
+        driver = str(lap['Driver']).upper()
+        lap_number = lap['LapNumber']
+        if pd.isna(lap_number):
+            return None
+        return (year, str(event_name), str(session.name), driver, int(lap_number))
+    except Exception:
+        return None
+
+
+class TelemetryStore:
+    """
+    Columnar on-disk store for cleaned lap telemetry.
+
+    Attributes:
+        root (Path): Root directory of the store
+
+    Example Usage:
+        store = TelemetryStore('cache/telemetry')
+        key = lap_store_key(lap)
+        telemetry = store.load(key)
+        if telemetry is None:
+            telemetry = clean(lap.get_telemetry())
+            store.save(key, telemetry)
+    """
+
+    def __init__(self, root: str = 'cache/telemetry'):
+        self.root = Path(root)
+        self.root.mkdir(parents=True, exist_ok=True)
+
+    def path_for(self, key: LapKey) -> Path:
+        """Return the directory holding the columns for a lap key."""
+        year, event, session, driver, lap_number = key
+        return (self.root / f"v{STORE_VERSION}" / str(year) / _slug(event) / _slug(session)
+                / f"{_slug(driver)}_{int(lap_number):03d}")
+
+    def contains(self, key: LapKey) -> bool:
+        """Return True if the lap is stored."""
+        return self.path_for(key).is_dir()
+
+    def load(self, key: LapKey, columns: Optional[Iterable[str]] = None, mmap: bool = True) -> Optional[pd.DataFrame]:
+        """
+        Load a stored telemetry frame.
+
+        Args:
+            key: Lap key from lap_store_key()
+            columns: Optional subset of columns to read (default: all, in stored order)
+            mmap: Memory-map the column files instead of reading them eagerly
+
+        Returns:
+            pd.DataFrame or None if the lap is not stored
+        """
+        path = self.path_for(key)
+        if not path.is_dir():
+            return None
+        order_file = path / 'columns.txt'
+        try:
+            stored = order_file.read_text().split()
+            wanted = stored if columns is None else [c for c in columns if c in stored]
+            data = {col: np.load(path / f"{col}.npy", mmap_mode='r' if mmap else None, allow_pickle=False)
+                    for col in wanted}
+        except (OSError, ValueError) as e:
+            logger.warning(f"Discarding unreadable telemetry store entry {path}: {e}")
+            shutil.rmtree(path, ignore_errors=True)
+            return None
+        return pd.DataFrame(data, columns=wanted)
+
+    def save(self, key: LapKey, telemetry: pd.DataFrame) -> Path:
+        """
+        Persist a cleaned telemetry frame.
+
+        Columns are written to a temporary directory that is renamed into place,
+        so concurrent readers never see a partially written entry.
+
+        Returns:
+            Path: Directory of the stored entry
+        """
+        path = self.path_for(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.parent / f".{path.name}.{uuid.uuid4().hex}.tmp"
+        tmp.mkdir()
+        try:
+            for col in telemetry.columns:
+                np.save(tmp / f"{col}.npy", telemetry[col].to_numpy(), allow_pickle=False)
+            (tmp / 'columns.txt').write_text('\n'.join(telemetry.columns))
+            try:
+                os.rename(tmp, path)
+            except OSError:
+                # Another writer stored the same lap first; keep theirs
+                shutil.rmtree(tmp, ignore_errors=True)
+        except Exception:
+            shutil.rmtree(tmp, ignore_errors=True)
+            raise
+        logger.info(f"Stored telemetry for {key[3]} lap {key[4]} in {path}")
+        return path
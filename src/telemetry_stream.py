@@ -0,0 +1,272 @@
+"""
+F1 Telemetry Stream Module
+
+Streaming telemetry sources: telemetry delivered as time-ordered chunks of
+samples rather than as a fully loaded session.
+
+TelemetrySource is the interface a live feed implements: chunks() yields
+DataFrames of consecutive samples in time order. ReplaySource is a local
+stand-in for a live feed. It reads exported lap files and emits them at
+real time times a speed-up factor:
+
+- CSV files written by csv_stream / F1DataLoader.export_to_csv (single lap or
+  multi-lap exports with Driver/LapNumber columns)
+- columnar lap directories written by TelemetryStore (columns.txt + one .npy
+  file per channel)
+
+Files are read in blocks by a producer thread and handed to the consumer
+through a bounded queue. A slow consumer therefore blocks the producer
+(backpressure) instead of letting samples pile up in memory. Each chunk
+carries a ReplayTime column: seconds since the start of the replay,
+continuous across laps and files.
+
+live_updates() feeds a source into an IncrementalAnalyzer and yields one
+JSON-ready update per chunk, for live dashboards (see /api/stream/replay).
+This allows live-style workflows to be exercised and load-tested offline.
+
+Example Usage:
+    with ReplaySource(['outputs/data/ver_monaco.csv'], speedup=10) as source:
+        for update in live_updates(source, window=2000):
+            print(update['replay_time'], update['metrics']['full_throttle_percentage'])
+"""
+
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Union
+import logging
+import queue
+import threading
+import time
+
+import numpy as np
+import pandas as pd
+
+from .incremental_metrics import IncrementalAnalyzer
+
+logger = logging.getLogger(__name__)
+
+READ_ROWS = 5000
+CHUNK_SECONDS = 0.5
+MAX_BUFFERED_CHUNKS = 16
+FALLBACK_SAMPLE_RATE = 10.0  # Hz, for files without a Time column
+
+LIVE_CHANNELS = ['Driver', 'LapNumber', 'Distance', 'Speed', 'Throttle', 'Brake', 'nGear', 'RPM', 'DRS']
+
+_END = object()
+
+
+def is_replayable(path: Union[str, Path]) -> bool:
+    """Return True if path is a file ReplaySource can read (CSV or a columnar lap directory)."""
+    path = Path(path)
+    return (path.is_file() and path.suffix.lower() == '.csv') or (path / 'columns.txt').is_file()
+
+
+def find_replay_files(roots: Iterable[Union[str, Path]]) -> List[Path]:
+    """Return the replayable files directly inside the given directories, sorted by name."""
+    files = []
+    for root in roots:
+        root = Path(root)
+        if root.is_dir():
+            files.extend(path for path in root.iterdir() if is_replayable(path))
+    return sorted(files, key=lambda path: path.name)
+
+
+def read_lap_blocks(path: Union[str, Path], rows: int = READ_ROWS) -> Iterator[pd.DataFrame]:
+    """
+    Yield the samples of an exported lap file in blocks of rows.
+
+    Raises:
+        ValueError: If the file is not a CSV file or a columnar lap directory
+    """
+    path = Path(path)
+    if (path / 'columns.txt').is_file():
+        columns = (path / 'columns.txt').read_text().split()
+        data = {col: np.load(path / f"{col}.npy", mmap_mode='r', allow_pickle=False) for col in columns}
+        n = len(next(iter(data.values()))) if data else 0
+        for start in range(0, n, rows):
+            yield pd.DataFrame({col: np.asarray(values[start:start + rows]) for col, values in data.items()})
+    elif path.is_file() and path.suffix.lower() == '.csv':
+        yield from pd.read_csv(path, chunksize=rows)
+    else:
+        raise ValueError(f"Not a replayable telemetry file: {path}")
+
+
+def _time_seconds(values: pd.Series) -> np.ndarray:
+    """Return a Time channel as seconds (only differences between samples are used)."""
+    if pd.api.types.is_timedelta64_dtype(values):
+        return values.dt.total_seconds().to_numpy()
+    if pd.api.types.is_datetime64_any_dtype(values):
+        return values.to_numpy(dtype='datetime64[ns]').astype(np.int64) / 1e9
+    return pd.to_numeric(values, errors='coerce').to_numpy(dtype=float)
+
+
+class TelemetrySource(ABC):
+    """
+    A feed of telemetry samples in time order.
+
+    Implementations yield chunks (DataFrames of consecutive samples) from
+    chunks() and release their resources in close(). Sources are context
+    managers.
+    """
+
+    @abstractmethod
+    def chunks(self) -> Iterator[pd.DataFrame]:
+        """Yield chunks of samples in time order until the feed ends."""
+
+    def close(self) -> None:
+        """Stop the feed and release its resources."""
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+class ReplaySource(TelemetrySource):
+    """
+    Replays exported lap files as a paced telemetry feed.
+
+    Attributes:
+        paths (list): Files replayed back to back
+        speedup (float): Replay speed relative to real time (inf: as fast as consumed)
+        chunk_seconds (float): Replay time covered by one chunk
+        max_buffered (int): Chunks the producer may read ahead of the consumer
+
+    Example Usage:
+        source = ReplaySource(['outputs/web/ver_monza_r_driver.csv'], speedup=20)
+        for chunk in source.chunks():
+            analyzer.update(chunk)
+    """
+
+    def __init__(self,
+                 paths: Iterable[Union[str, Path]],
+                 speedup: float = 1.0,
+                 chunk_seconds: float = CHUNK_SECONDS,
+                 max_buffered: int = MAX_BUFFERED_CHUNKS,
+                 read_rows: int = READ_ROWS):
+        self.paths = [Path(p) for p in paths]
+        if not self.paths:
+            raise ValueError("No files to replay")
+        for path in self.paths:
+            if not is_replayable(path):
+                raise ValueError(f"Not a replayable telemetry file: {path}")
+        if not speedup > 0:
+            raise ValueError("speedup must be positive")
+        self.speedup = float(speedup)
+        self.chunk_seconds = chunk_seconds
+        self.max_buffered = max_buffered
+        self.read_rows = read_rows
+        self._queue: queue.Queue = queue.Queue(maxsize=max_buffered)
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def _put(self, item: Any) -> bool:
+        """Queue an item, waiting while the queue is full; False if the source was closed."""
+        while not self._stop.is_set():
+            try:
+                self._queue.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def _produce(self) -> None:
+        last_time = np.nan
+        elapsed = 0.0
+        started = time.monotonic()
+        try:
+            for path in self.paths:
+                for block in read_lap_blocks(path, self.read_rows):
+                    if not len(block):
+                        continue
+                    if 'Time' in block.columns:
+                        t = _time_seconds(block['Time'])
+                        # Steps back in Time start a new lap (or file); count them as zero time
+                        steps = np.diff(np.concatenate(([last_time], t)))
+                        steps = np.where(steps > 0, steps, 0.0)
+                        last_time = t[-1]
+                    else:
+                        steps = np.full(len(block), 1.0 / FALLBACK_SAMPLE_RATE)
+                    replay_time = elapsed + np.cumsum(steps)
+                    elapsed = replay_time[-1]
+                    block = block.assign(ReplayTime=replay_time)
+
+                    bins = np.floor(replay_time / self.chunk_seconds)
+                    bounds = np.concatenate(([0], np.flatnonzero(np.diff(bins)) + 1, [len(block)]))
+                    for lo, hi in zip(bounds[:-1], bounds[1:]):
+                        delay = started + replay_time[hi - 1] / self.speedup - time.monotonic()
+                        if delay > 0 and self._stop.wait(delay):
+                            return
+                        if not self._put(block.iloc[lo:hi]):
+                            return
+        except Exception as e:
+            logger.error(f"Replay of {self.paths} failed: {e}")
+            self._put(e)
+        self._put(_END)
+
+    def chunks(self) -> Iterator[pd.DataFrame]:
+        """
+        Start the replay and yield its chunks as they become due.
+
+        Raises:
+            RuntimeError: If the source was already started
+            Exception: Errors raised while reading the files
+        """
+        if self._thread is not None:
+            raise RuntimeError("ReplaySource can only be consumed once")
+        self._thread = threading.Thread(target=self._produce, name='telemetry-replay', daemon=True)
+        self._thread.start()
+        try:
+            while True:
+                item = self._queue.get()
+                if item is _END:
+                    return
+                if isinstance(item, Exception):
+                    raise item
+                yield item
+        finally:
+            self.close()
+
+    def close(self) -> None:
+        """Stop the producer thread (it exits within one queue timeout)."""
+        self._stop.set()
+        if self._thread is not None and self._thread is not threading.current_thread():
+            self._thread.join(timeout=1.0)
+
+
+def _json_value(value: Any) -> Any:
+    if isinstance(value, np.generic):
+        value = value.item()
+    if isinstance(value, float) and not np.isfinite(value):
+        return None
+    return value
+
+
+def live_updates(source: TelemetrySource,
+                 window: Optional[int] = None,
+                 brake_threshold: Optional[float] = None) -> Iterator[Dict[str, Any]]:
+    """
+    Consume a telemetry source with an IncrementalAnalyzer, yielding one update per chunk.
+
+    Args:
+        source: Telemetry feed
+        window: Samples covered by the rolling metrics (None: the whole feed)
+        brake_threshold: Braking threshold (default: chosen from the Brake
+            scale by the IncrementalAnalyzer)
+
+    Yields:
+        dict: {'replay_time', 'samples', 'last' (latest value of each LIVE_CHANNELS
+            channel present), 'metrics' (IncrementalAnalyzer.metrics())}; NaN
+            values are None so the update serializes to strict JSON
+    """
+    analyzer = IncrementalAnalyzer(window=window, brake_threshold=brake_threshold)
+    for chunk in source.chunks():
+        metrics = analyzer.update(chunk)
+        last = chunk.iloc[-1]
+        yield {
+            'replay_time': _json_value(float(last['ReplayTime'])) if 'ReplayTime' in chunk.columns else None,
+            'samples': analyzer.samples,
+            'last': {col: _json_value(last[col]) for col in LIVE_CHANNELS if col in chunk.columns},
+            'metrics': {key: _json_value(value) for key, value in metrics.items()},
+        }
@@ -3,35 +3,111 @@ matplotlib.use('Agg')  # Use non-interactive backend for web
 import matplotlib.pyplot as plt
 import matplotlib as mpl
 import matplotlib.collections
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_agg import FigureCanvasAgg
 import pandas as pd
 import numpy as np
+import threading
 from typing import Optional, Dict, Any, List
 
+from .circuit_cache import CircuitCache, layout_array
+from .downsampling import downsample_frame
+from .resampling import distance_grid, nearest_indices, resample_laps
+
+# Render profiles:
+#   'print' - 300 dpi, tight bounding box, one pyplot figure per plot, every sample drawn
+#   'web'   - screen resolution, rasterized scatter/line collections, no tight-bbox
+#             second pass, figures pooled per thread and cleared between renders, and
+#             telemetry downsampled (min/max per bucket) to about max_points per series
+RENDER_PROFILES = {
+    'print': {'dpi': 300, 'bbox_inches': 'tight', 'rasterized': False, 'reuse_figures': False, 'max_points': None},
+    'web': {'dpi': 100, 'bbox_inches': None, 'rasterized': True, 'reuse_figures': True, 'max_points': 2000},
+}
+
+_figure_pool = threading.local()
+
+def _profile_settings(profile: str) -> Dict[str, Any]:
+    if profile not in RENDER_PROFILES:
+        raise ValueError(f"Unknown render profile: {profile} (expected one of {list(RENDER_PROFILES)})")
+    return RENDER_PROFILES[profile]
+
+def _uses_pool(profile: str, save_path: Optional[str]) -> bool:
+    # Pooled figures are not managed by pyplot, so they can only be saved, not shown
+    return bool(save_path) and _profile_settings(profile)['reuse_figures']
+
+def _new_figure(profile: str, save_path: Optional[str], figsize, nrows: int = 1, ncols: int = 1, sharex: bool = False):
+    """Return (fig, axes) for a plot, reusing a cleared pooled figure for the web profile."""
+    settings = _profile_settings(profile)
+    if not _uses_pool(profile, save_path):
+        return plt.subplots(nrows, ncols, sharex=sharex, figsize=figsize, dpi=settings['dpi'])
+    pool = getattr(_figure_pool, 'figures', None)
+    if pool is None:
+        pool = _figure_pool.figures = {}
+    key = (tuple(figsize), settings['dpi'])
+    fig = pool.get(key)
+    if fig is None:
+        fig = Figure(figsize=figsize, dpi=settings['dpi'])
+        FigureCanvasAgg(fig)
+        pool[key] = fig
+    else:
+        fig.clear()
+    return fig, fig.subplots(nrows, ncols, sharex=sharex)
+
+def _reduce_for_profile(telemetry: pd.DataFrame, profile: str, columns: List[str]) -> pd.DataFrame:
+    """Downsample telemetry to the profile's point budget while keeping the shape of columns."""
+    max_points = _profile_settings(profile)['max_points']
+    if max_points is None:
+        return telemetry
+    return downsample_frame(telemetry, max_points, columns=columns, method='minmax')
+
+def _finish_figure(fig, profile: str, save_path: Optional[str]) -> None:
+    """Save (or show) a figure created by _new_figure() using the profile's output settings."""
+    settings = _profile_settings(profile)
+    if save_path:
+        fig.savefig(save_path, dpi=settings['dpi'], bbox_inches=settings['bbox_inches'])
+        if not _uses_pool(profile, save_path):
+            plt.close(fig)  # Close figure to free memory
+    else:
+        plt.show()
+
+def get_track_outline(session: Any, circuits: Optional[CircuitCache] = None) -> Optional[np.ndarray]:
+    """
+    Return the track outline (N x 2 array) of a session's circuit, or None if unavailable.
+
+    The outline is the layout polyline of the circuit geometry cache
+    (default: CircuitCache() at cache/circuits).
+    """
+    try:
+        return layout_array((circuits or CircuitCache()).get(session))
+    except Exception:
+        return None
+
 def plot_colored_track_map(
     session: Any,
     telemetry: pd.DataFrame,
     color_by: str = 'nGear',
     driver_label: str = 'Driver',
-    save_path: Optional[str] = None
+    save_path: Optional[str] = None,
+    track_outline: Optional[np.ndarray] = None,
+    profile: str = 'print'
 ) -> None:
     """
     Plot the actual track map with telemetry colored by a chosen channel (e.g., gear, speed, throttle).
     Args:
-        session: FastF1 session object (needed for track outline)
+        session: FastF1 session object (needed for track outline unless track_outline is given)
         telemetry: DataFrame with columns ['X', 'Y', ...]
         color_by: str, telemetry column to color by (e.g., 'nGear', 'Speed', 'Throttle')
         driver_label: str, label for the driver
         save_path: optional, if provided, save figure to this path
+        track_outline: optional, precomputed outline from get_track_outline()
+        profile: render profile, 'print' (default) or 'web' (see RENDER_PROFILES)
     """
-    # Get track outline
-    try:
-        circuit_info = session.get_circuit_info()
-        track_outline = circuit_info['Layout']
-    except Exception:
-        # fallback: just plot telemetry X/Y if outline not available
-        track_outline = None
+    # Get track outline (fallback: just plot telemetry X/Y if outline not available)
+    if track_outline is None:
+        track_outline = get_track_outline(session)
+    telemetry = _reduce_for_profile(telemetry, profile, ['X', 'Y', color_by])
 
-    fig, ax = plt.subplots(figsize=(10, 7), dpi=300)
+    fig, ax = _new_figure(profile, save_path, (10, 7))
     # Plot the track outline if available
     if track_outline is not None:
         ax.plot(track_outline[:, 0], track_outline[:, 1], color='black', linewidth=2, alpha=0.3, label='Track Outline')
@@ -40,11 +116,12 @@ def plot_colored_track_map(
     points = np.array([telemetry['X'], telemetry['Y']]).T.reshape(-1, 1, 2)
     segments = np.concatenate([points[:-1], points[1:]], axis=1)
     norm = mpl.colors.Normalize(vmin=telemetry[color_by].min(), vmax=telemetry[color_by].max())
-    lc = mpl.collections.LineCollection(segments, cmap='plasma', norm=norm)
+    lc = mpl.collections.LineCollection(segments, cmap='plasma', norm=norm,
+                                        rasterized=_profile_settings(profile)['rasterized'])
     lc.set_array(telemetry[color_by])
     lc.set_linewidth(2)
     line = ax.add_collection(lc)
-    cbar = plt.colorbar(line, ax=ax)
+    cbar = fig.colorbar(line, ax=ax)
     cbar.set_label(color_by, fontsize=13)
 
     ax.set_xlabel('X (m)', fontsize=13)
@@ -52,12 +129,8 @@ def plot_colored_track_map(
     ax.set_title(f'Track Map - {driver_label} ({color_by})', fontsize=15, fontweight='bold')
     ax.axis('equal')
     ax.grid(True, linestyle='--', alpha=0.5)
-    plt.tight_layout()
-    if save_path:
-        plt.savefig(save_path, dpi=300, bbox_inches='tight')
-        plt.close()  # Close figure to free memory
-    else:
-        plt.show()
+    fig.tight_layout()
+    _finish_figure(fig, profile, save_path)
 import matplotlib.pyplot as plt
 from matplotlib.collections import LineCollection
 import numpy as np
@@ -66,7 +139,8 @@ def plot_throttle_brake_trace(
     telemetry: pd.DataFrame,
     lap_info: Dict[str, Any],
     driver_code: str,
-    save_path: Optional[str] = None
+    save_path: Optional[str] = None,
+    profile: str = 'print'
 ) -> None:
     """
     Plot speed, throttle, and brake traces with sector color coding.
@@ -75,16 +149,19 @@ def plot_throttle_brake_trace(
         lap_info: dict with keys 'lap_number', 'lap_time', 'sector1_end', 'sector2_end', 'sector3_end'
         driver_code: str, e.g. 'VER'
         save_path: optional, if provided, save figure to this path
+        profile: render profile, 'print' (default) or 'web' (see RENDER_PROFILES)
     """
     # Sector color mapping
     sector_colors = {1: '#FF0000', 2: '#00FF00', 3: '#0000FF'}
     sector_bounds = [0, lap_info['sector1_end'], lap_info['sector2_end'], lap_info['sector3_end']]
     sector_labels = ['Sector 1', 'Sector 2', 'Sector 3']
+    telemetry = _reduce_for_profile(telemetry, profile, ['Speed', 'Throttle', 'Brake'])
     
     # Prepare figure
-    fig, axes = plt.subplots(3, 1, sharex=True, figsize=(12, 8), dpi=300)
-    plt.subplots_adjust(hspace=0.1)
+    fig, axes = _new_figure(profile, save_path, (12, 8), nrows=3, sharex=True)
+    fig.subplots_adjust(hspace=0.1)
     font_kwargs = dict(fontsize=13)
+    rasterized = _profile_settings(profile)['rasterized']
     
     # Helper to plot colored line segments
     def plot_colored_line(ax, x, y, sectors, ylabel):
@@ -113,13 +190,13 @@ def plot_throttle_brake_trace(
     if 'DRS_Active' in telemetry.columns:
         drs_on = telemetry[telemetry['DRS_Active'] > 0]
         for ax in axes:
-            ax.scatter(drs_on['Distance'], [ax.get_ylim()[1]*0.98]*len(drs_on), color='magenta', marker='v', s=30, label='DRS Active' if ax==axes[0] else None, zorder=5)
+            ax.scatter(drs_on['Distance'], [ax.get_ylim()[1]*0.98]*len(drs_on), color='magenta', marker='v', s=30, label='DRS Active' if ax==axes[0] else None, zorder=5, rasterized=rasterized)
 
     # Annotate pit stop if available
     if 'Pit' in telemetry.columns:
         pit_on = telemetry[telemetry['Pit'] > 0]
         for ax in axes:
-            ax.scatter(pit_on['Distance'], [ax.get_ylim()[0]+2]*len(pit_on), color='black', marker='s', s=30, label='Pit Stop' if ax==axes[0] else None, zorder=5)
+            ax.scatter(pit_on['Distance'], [ax.get_ylim()[0]+2]*len(pit_on), color='black', marker='s', s=30, label='Pit Stop' if ax==axes[0] else None, zorder=5, rasterized=rasterized)
 
     axes[2].set_xlabel('Distance (m)', **font_kwargs)
     lap_time_str = str(lap_info['lap_time']) if 'lap_time' in lap_info else ''
@@ -132,19 +209,16 @@ def plot_throttle_brake_trace(
         ax.spines['right'].set_visible(False)
         ax.margins(x=0)
     
-    plt.tight_layout(rect=[0, 0, 1, 0.96])
-    if save_path:
-        plt.savefig(save_path, dpi=300, bbox_inches='tight')
-        plt.close()
-    else:
-        plt.show()
+    fig.tight_layout(rect=[0, 0, 1, 0.96])
+    _finish_figure(fig, profile, save_path)
 
 def plot_driver_comparison(
     driver1_telemetry: pd.DataFrame,
     driver2_telemetry: pd.DataFrame,
     driver1_label: str = 'Driver 1',
     driver2_label: str = 'Driver 2',
-    save_path: Optional[str] = None
+    save_path: Optional[str] = None,
+    profile: str = 'print'
 ) -> None:
     """
     Plot side-by-side comparison of two drivers' speed, throttle, and brake traces.
@@ -154,10 +228,14 @@ def plot_driver_comparison(
         driver1_label: str, label for driver 1
         driver2_label: str, label for driver 2
         save_path: optional, if provided, save figure to this path
+        profile: render profile, 'print' (default) or 'web' (see RENDER_PROFILES)
     """
-    fig, axes = plt.subplots(3, 1, sharex=True, figsize=(12, 8), dpi=300)
-    plt.subplots_adjust(hspace=0.1)
+    driver1_telemetry = _reduce_for_profile(driver1_telemetry, profile, ['Speed', 'Throttle', 'Brake'])
+    driver2_telemetry = _reduce_for_profile(driver2_telemetry, profile, ['Speed', 'Throttle', 'Brake'])
+    fig, axes = _new_figure(profile, save_path, (12, 8), nrows=3, sharex=True)
+    fig.subplots_adjust(hspace=0.1)
     font_kwargs = dict(fontsize=13)
+    rasterized = _profile_settings(profile)['rasterized']
 
     # Speed
     axes[0].plot(driver1_telemetry['Distance'], driver1_telemetry['Speed'], label=driver1_label, color='red', linewidth=2)
@@ -189,11 +267,11 @@ def plot_driver_comparison(
         if 'DRS_Active' in telemetry.columns:
             drs_on = telemetry[telemetry['DRS_Active'] > 0]
             for ax in axes:
-                ax.scatter(drs_on['Distance'], [ax.get_ylim()[1]*0.98]*len(drs_on), color=color, marker='v', s=25, label=f'DRS {driver1_label if idx==0 else driver2_label}' if ax==axes[0] else None, zorder=5)
+                ax.scatter(drs_on['Distance'], [ax.get_ylim()[1]*0.98]*len(drs_on), color=color, marker='v', s=25, label=f'DRS {driver1_label if idx==0 else driver2_label}' if ax==axes[0] else None, zorder=5, rasterized=rasterized)
         if 'Pit' in telemetry.columns:
             pit_on = telemetry[telemetry['Pit'] > 0]
             for ax in axes:
-                ax.scatter(pit_on['Distance'], [ax.get_ylim()[0]+2]*len(pit_on), color='black', marker='s', s=25, label=f'Pit {driver1_label if idx==0 else driver2_label}' if ax==axes[0] else None, zorder=5)
+                ax.scatter(pit_on['Distance'], [ax.get_ylim()[0]+2]*len(pit_on), color='black', marker='s', s=25, label=f'Pit {driver1_label if idx==0 else driver2_label}' if ax==axes[0] else None, zorder=5, rasterized=rasterized)
 
     # Professional formatting
     for ax in axes:
@@ -201,20 +279,18 @@ def plot_driver_comparison(
         ax.spines['right'].set_visible(False)
         ax.margins(x=0)
 
-    plt.tight_layout(rect=[0, 0, 1, 0.97])
+    fig.tight_layout(rect=[0, 0, 1, 0.97])
     fig.suptitle(f"{driver1_label} vs {driver2_label} - Telemetry Comparison", fontsize=15, fontweight='bold')
-    if save_path:
-        plt.savefig(save_path, dpi=300, bbox_inches='tight')
-        plt.close()
-    else:
-        plt.show()
+    _finish_figure(fig, profile, save_path)
 
 def plot_speed_delta(
     driver1_telemetry: pd.DataFrame,
     driver2_telemetry: pd.DataFrame,
     driver1_label: str = 'Driver 1',
     driver2_label: str = 'Driver 2',
-    save_path: Optional[str] = None
+    save_path: Optional[str] = None,
+    profile: str = 'print',
+    lap_keys: Optional[List[Any]] = None
 ) -> None:
     """
     Plot the speed delta and cumulative time delta between two drivers along the lap distance.
@@ -224,24 +300,22 @@ def plot_speed_delta(
         driver1_label: str, label for driver 1
         driver2_label: str, label for driver 2
         save_path: optional, if provided, save figure to this path
+        profile: render profile, 'print' (default) or 'web' (see RENDER_PROFILES)
+        lap_keys: optional resampling cache key per lap (e.g. telemetry_store.lap_store_key(lap)),
+            so repeated renders reuse the cached resampled laps
     """
-    # Interpolate both drivers to a common distance axis
-    common_dist = np.linspace(
-        max(driver1_telemetry['Distance'].min(), driver2_telemetry['Distance'].min()),
-        min(driver1_telemetry['Distance'].max(), driver2_telemetry['Distance'].max()),
-        1000
-    )
-    speed1 = np.interp(common_dist, driver1_telemetry['Distance'], driver1_telemetry['Speed'])
-    speed2 = np.interp(common_dist, driver2_telemetry['Distance'], driver2_telemetry['Speed'])
-    time1 = np.interp(common_dist, driver1_telemetry['Distance'], driver1_telemetry['Time'])
-    time2 = np.interp(common_dist, driver2_telemetry['Distance'], driver2_telemetry['Time'])
-    speed_delta = speed1 - speed2
-    time_delta = (time1 - time2)
+    # Resample both drivers onto a common distance axis
+    common_dist = distance_grid([driver1_telemetry, driver2_telemetry], 1000)
+    laps = resample_laps([driver1_telemetry, driver2_telemetry], common_dist, columns=['Speed', 'Time'],
+                         keys=lap_keys)
+    speed_delta = -laps.delta('Speed')[1]
+    time_delta = -laps.delta('Time')[1]
     time_delta -= time_delta[0]  # Normalize to zero at start
 
-    fig, axes = plt.subplots(2, 1, sharex=True, figsize=(12, 6), dpi=300)
-    plt.subplots_adjust(hspace=0.15)
+    fig, axes = _new_figure(profile, save_path, (12, 6), nrows=2, sharex=True)
+    fig.subplots_adjust(hspace=0.15)
     font_kwargs = dict(fontsize=13)
+    rasterized = _profile_settings(profile)['rasterized']
 
     # Speed delta
     axes[0].plot(common_dist, speed_delta, color='purple', linewidth=2)
@@ -265,11 +339,11 @@ def plot_speed_delta(
         if 'DRS_Active' in telemetry.columns:
             drs_on = telemetry[telemetry['DRS_Active'] > 0]
             for ax in axes:
-                ax.scatter(drs_on['Distance'], [ax.get_ylim()[1]*0.98]*len(drs_on), color=color, marker='v', s=20, label=f'DRS {driver1_label if idx==0 else driver2_label}' if ax==axes[0] else None, zorder=5)
+                ax.scatter(drs_on['Distance'], [ax.get_ylim()[1]*0.98]*len(drs_on), color=color, marker='v', s=20, label=f'DRS {driver1_label if idx==0 else driver2_label}' if ax==axes[0] else None, zorder=5, rasterized=rasterized)
         if 'Pit' in telemetry.columns:
             pit_on = telemetry[telemetry['Pit'] > 0]
             for ax in axes:
-                ax.scatter(pit_on['Distance'], [ax.get_ylim()[0]+0.02*(ax.get_ylim()[1]-ax.get_ylim()[0])]*len(pit_on), color='black', marker='s', s=20, label=f'Pit {driver1_label if idx==0 else driver2_label}' if ax==axes[0] else None, zorder=5)
+                ax.scatter(pit_on['Distance'], [ax.get_ylim()[0]+0.02*(ax.get_ylim()[1]-ax.get_ylim()[0])]*len(pit_on), color='black', marker='s', s=20, label=f'Pit {driver1_label if idx==0 else driver2_label}' if ax==axes[0] else None, zorder=5, rasterized=rasterized)
 
     # Professional formatting
     for ax in axes:
@@ -277,18 +351,15 @@ def plot_speed_delta(
         ax.spines['right'].set_visible(False)
         ax.margins(x=0)
 
-    plt.tight_layout(rect=[0, 0, 1, 0.96])
+    fig.tight_layout(rect=[0, 0, 1, 0.96])
     fig.suptitle(f"{driver1_label} vs {driver2_label} - Speed & Time Delta", fontsize=15, fontweight='bold')
-    if save_path:
-        plt.savefig(save_path, dpi=300, bbox_inches='tight')
-        plt.close()
-    else:
-        plt.show()
+    _finish_figure(fig, profile, save_path)
 
 def plot_gg_diagram(
     telemetry: pd.DataFrame,
     driver_label: str = 'Driver',
-    save_path: Optional[str] = None
+    save_path: Optional[str] = None,
+    profile: str = 'print'
 ) -> None:
     """
     Plot a GG diagram (lateral vs longitudinal g-forces) from telemetry data.
@@ -296,34 +367,34 @@ def plot_gg_diagram(
         telemetry: DataFrame with columns ['GforceLat', 'GforceLong']
         driver_label: str, label for the driver
         save_path: optional, if provided, save figure to this path
+        profile: render profile, 'print' (default) or 'web' (see RENDER_PROFILES)
     """
     if 'GforceLat' not in telemetry or 'GforceLong' not in telemetry:
         raise ValueError('Telemetry must contain GforceLat and GforceLong columns.')
-    plt.figure(figsize=(7, 7), dpi=300)
-    plt.scatter(telemetry['GforceLat'], telemetry['GforceLong'], s=8, c=telemetry.get('Speed', None), cmap='viridis', alpha=0.7)
-    plt.axhline(0, color='k', linestyle='--', linewidth=1)
-    plt.axvline(0, color='k', linestyle='--', linewidth=1)
-    plt.xlabel('Lateral G (g)', fontsize=13)
-    plt.ylabel('Longitudinal G (g)', fontsize=13)
-    plt.title(f'GG Diagram - {driver_label}', fontsize=15, fontweight='bold')
-    plt.grid(True, linestyle='--', alpha=0.5)
-    plt.gca().set_aspect('equal', 'box')
-    plt.tick_params(labelsize=12)
+    telemetry = _reduce_for_profile(telemetry, profile, ['GforceLat', 'GforceLong'])
+    fig, ax = _new_figure(profile, save_path, (7, 7))
+    sc = ax.scatter(telemetry['GforceLat'], telemetry['GforceLong'], s=8, c=telemetry.get('Speed', None), cmap='viridis', alpha=0.7,
+                    rasterized=_profile_settings(profile)['rasterized'])
+    ax.axhline(0, color='k', linestyle='--', linewidth=1)
+    ax.axvline(0, color='k', linestyle='--', linewidth=1)
+    ax.set_xlabel('Lateral G (g)', fontsize=13)
+    ax.set_ylabel('Longitudinal G (g)', fontsize=13)
+    ax.set_title(f'GG Diagram - {driver_label}', fontsize=15, fontweight='bold')
+    ax.grid(True, linestyle='--', alpha=0.5)
+    ax.set_aspect('equal', 'box')
+    ax.tick_params(labelsize=12)
     if 'Speed' in telemetry:
-        cbar = plt.colorbar(label='Speed (km/h)')
+        cbar = fig.colorbar(sc, ax=ax, label='Speed (km/h)')
         cbar.ax.tick_params(labelsize=12)
-    plt.tight_layout()
-    if save_path:
-        plt.savefig(save_path, dpi=300, bbox_inches='tight')
-        plt.close()
-    else:
-        plt.show()
+    fig.tight_layout()
+    _finish_figure(fig, profile, save_path)
 
 def plot_corner_analysis(
     telemetry: pd.DataFrame,
     corner_locations: List[float],
     driver_label: str = 'Driver',
-    save_path: Optional[str] = None
+    save_path: Optional[str] = None,
+    profile: str = 'print'
 ) -> None:
     """
     Plot corner-by-corner performance: entry, apex, and exit speeds for each corner.
@@ -332,45 +403,36 @@ def plot_corner_analysis(
         corner_locations: list or array of apex distances (meters)
         driver_label: str, label for the driver
         save_path: optional, if provided, save figure to this path
+        profile: render profile, 'print' (default) or 'web' (see RENDER_PROFILES)
     """
     entry_offset = 50  # meters before apex
     exit_offset = 50   # meters after apex
-    entry_speeds = []
-    apex_speeds = []
-    exit_speeds = []
-    for apex in corner_locations:
-        # Entry speed
-        entry_idx = (np.abs(telemetry['Distance'] - (apex - entry_offset))).argmin()
-        entry_speeds.append(telemetry['Speed'].iloc[entry_idx])
-        # Apex speed
-        apex_idx = (np.abs(telemetry['Distance'] - apex)).argmin()
-        apex_speeds.append(telemetry['Speed'].iloc[apex_idx])
-        # Exit speed
-        exit_idx = (np.abs(telemetry['Distance'] - (apex + exit_offset))).argmin()
-        exit_speeds.append(telemetry['Speed'].iloc[exit_idx])
+    apexes = np.asarray(corner_locations, dtype=float)
+    # Nearest samples to every entry, apex and exit point in one lookup
+    idx = nearest_indices(telemetry['Distance'].to_numpy(dtype=float),
+                          np.concatenate([apexes - entry_offset, apexes, apexes + exit_offset]))
+    speed = telemetry['Speed'].to_numpy()
+    entry_speeds, apex_speeds, exit_speeds = np.split(speed[idx], 3)
     corners = np.arange(1, len(corner_locations) + 1)
-    plt.figure(figsize=(12, 5), dpi=300)
-    plt.plot(corners, entry_speeds, marker='o', label='Entry Speed', color='#1f77b4')
-    plt.plot(corners, apex_speeds, marker='s', label='Apex Speed', color='#ff7f0e')
-    plt.plot(corners, exit_speeds, marker='^', label='Exit Speed', color='#2ca02c')
-    plt.xlabel('Corner Number', fontsize=13)
-    plt.ylabel('Speed (km/h)', fontsize=13)
-    plt.title(f'Corner-by-Corner Analysis - {driver_label}', fontsize=15, fontweight='bold')
-    plt.grid(True, linestyle='--', alpha=0.5)
-    plt.legend(fontsize=12)
-    plt.xticks(corners)
-    plt.tick_params(labelsize=12)
-    plt.tight_layout()
-    if save_path:
-        plt.savefig(save_path, dpi=300, bbox_inches='tight')
-        plt.close()
-    else:
-        plt.show()
+    fig, ax = _new_figure(profile, save_path, (12, 5))
+    ax.plot(corners, entry_speeds, marker='o', label='Entry Speed', color='#1f77b4')
+    ax.plot(corners, apex_speeds, marker='s', label='Apex Speed', color='#ff7f0e')
+    ax.plot(corners, exit_speeds, marker='^', label='Exit Speed', color='#2ca02c')
+    ax.set_xlabel('Corner Number', fontsize=13)
+    ax.set_ylabel('Speed (km/h)', fontsize=13)
+    ax.set_title(f'Corner-by-Corner Analysis - {driver_label}', fontsize=15, fontweight='bold')
+    ax.grid(True, linestyle='--', alpha=0.5)
+    ax.legend(fontsize=12)
+    ax.set_xticks(corners)
+    ax.tick_params(labelsize=12)
+    fig.tight_layout()
+    _finish_figure(fig, profile, save_path)
 
 def plot_gear_usage_map(
     telemetry: pd.DataFrame,
     driver_label: str = 'Driver',
-    save_path: Optional[str] = None
+    save_path: Optional[str] = None,
+    profile: str = 'print'
 ) -> None:
     """
     Plot a map of the track colored by gear selection.
@@ -378,34 +440,34 @@ def plot_gear_usage_map(
         telemetry: DataFrame with columns ['X', 'Y', 'nGear']
         driver_label: str, label for the driver
         save_path: optional, if provided, save figure to this path
+        profile: render profile, 'print' (default) or 'web' (see RENDER_PROFILES)
     """
     if not all(col in telemetry for col in ['X', 'Y', 'nGear']):
         raise ValueError('Telemetry must contain X, Y, and nGear columns.')
+    telemetry = _reduce_for_profile(telemetry, profile, ['X', 'Y', 'nGear'])
     x = telemetry['X'].values
     y = telemetry['Y'].values
     gears = telemetry['nGear'].astype(int).values
     cmap = plt.get_cmap('plasma', np.max(gears) - np.min(gears) + 1)
-    plt.figure(figsize=(10, 7), dpi=300)
-    sc = plt.scatter(x, y, c=gears, cmap=cmap, s=8, marker='o', alpha=0.85)
-    cbar = plt.colorbar(sc, ticks=np.arange(np.min(gears), np.max(gears)+1))
+    fig, ax = _new_figure(profile, save_path, (10, 7))
+    sc = ax.scatter(x, y, c=gears, cmap=cmap, s=8, marker='o', alpha=0.85,
+                    rasterized=_profile_settings(profile)['rasterized'])
+    cbar = fig.colorbar(sc, ax=ax, ticks=np.arange(np.min(gears), np.max(gears)+1))
     cbar.set_label('Gear', fontsize=13)
     cbar.ax.tick_params(labelsize=12)
-    plt.xlabel('X (m)', fontsize=13)
-    plt.ylabel('Y (m)', fontsize=13)
-    plt.title(f'Gear Usage Map - {driver_label}', fontsize=15, fontweight='bold')
-    plt.axis('equal')
-    plt.grid(True, linestyle='--', alpha=0.5)
-    plt.tight_layout()
-    if save_path:
-        plt.savefig(save_path, dpi=300, bbox_inches='tight')
-        plt.close()
-    else:
-        plt.show()
+    ax.set_xlabel('X (m)', fontsize=13)
+    ax.set_ylabel('Y (m)', fontsize=13)
+    ax.set_title(f'Gear Usage Map - {driver_label}', fontsize=15, fontweight='bold')
+    ax.axis('equal')
+    ax.grid(True, linestyle='--', alpha=0.5)
+    fig.tight_layout()
+    _finish_figure(fig, profile, save_path)
 
 def plot_brake_usage_map(
     telemetry: pd.DataFrame,
     driver_label: str = 'Driver',
-    save_path: Optional[str] = None
+    save_path: Optional[str] = None,
+    profile: str = 'print'
 ) -> None:
     """
     Plot a map of the track colored by brake intensity/pressure.
@@ -413,9 +475,11 @@ def plot_brake_usage_map(
         telemetry: DataFrame with columns ['X', 'Y', 'Brake']
         driver_label: str, label for the driver
         save_path: optional, if provided, save figure to this path
+        profile: render profile, 'print' (default) or 'web' (see RENDER_PROFILES)
     """
     if not all(col in telemetry for col in ['X', 'Y', 'Brake']):
         raise ValueError('Telemetry must contain X, Y, and Brake columns.')
+    telemetry = _reduce_for_profile(telemetry, profile, ['X', 'Y', 'Brake'])
     
     x = telemetry['X'].values
     y = telemetry['Y'].values
@@ -427,19 +491,109 @@ def plot_brake_usage_map(
     except:
         brake = np.array([float(b) if pd.notna(b) else 0.0 for b in brake])
     
-    plt.figure(figsize=(10, 7), dpi=300)
-    sc = plt.scatter(x, y, c=brake, cmap='hot', s=8, marker='o', alpha=0.85, vmin=0, vmax=100)
-    cbar = plt.colorbar(sc)
+    fig, ax = _new_figure(profile, save_path, (10, 7))
+    sc = ax.scatter(x, y, c=brake, cmap='hot', s=8, marker='o', alpha=0.85, vmin=0, vmax=100,
+                    rasterized=_profile_settings(profile)['rasterized'])
+    cbar = fig.colorbar(sc, ax=ax)
     cbar.set_label('Brake Pressure (%)', fontsize=13)
     cbar.ax.tick_params(labelsize=12)
-    plt.xlabel('X (m)', fontsize=13)
-    plt.ylabel('Y (m)', fontsize=13)
-    plt.title(f'Brake Usage Map - {driver_label}', fontsize=15, fontweight='bold')
-    plt.axis('equal')
-    plt.grid(True, linestyle='--', alpha=0.5)
-    plt.tight_layout()
-    if save_path:
-        plt.savefig(save_path, dpi=300, bbox_inches='tight')
-        plt.close()
-    else:
-        plt.show()
+    ax.set_xlabel('X (m)', fontsize=13)
+    ax.set_ylabel('Y (m)', fontsize=13)
+    ax.set_title(f'Brake Usage Map - {driver_label}', fontsize=15, fontweight='bold')
+    ax.axis('equal')
+    ax.grid(True, linestyle='--', alpha=0.5)
+    fig.tight_layout()
+    _finish_figure(fig, profile, save_path)
+
+def plot_delta_matrix(
+    final_gaps: pd.DataFrame,
+    title: str = 'Lap Time Gap Matrix',
+    save_path: Optional[str] = None,
+    profile: str = 'print'
+) -> None:
+    """
+    Plot an all-pairs driver gap matrix as an annotated heat map.
+    Args:
+        final_gaps: square DataFrame of gaps in seconds (row driver minus column driver),
+            e.g. DeltaMatrix.final_gaps()
+        title: str, plot title
+        save_path: optional, if provided, save figure to this path
+        profile: render profile, 'print' (default) or 'web' (see RENDER_PROFILES)
+    """
+    # Order drivers fastest first (smallest gap to any fixed reference driver)
+    order = np.argsort(final_gaps.iloc[:, 0].to_numpy(), kind='stable')
+    gaps = final_gaps.iloc[order, order]
+    values = gaps.to_numpy(dtype=float)
+    n = len(gaps)
+    limit = float(np.nanmax(np.abs(values))) if n else 0.0
+    limit = limit or 1.0  # Keep a valid color range when all gaps are zero
+
+    size = max(6, 0.45 * n + 2)
+    fig, ax = _new_figure(profile, save_path, (size + 1.5, size))
+    im = ax.imshow(values, cmap='RdBu_r', vmin=-limit, vmax=limit)
+    cbar = fig.colorbar(im, ax=ax)
+    cbar.set_label('Gap (s), row - column', fontsize=13)
+    ax.set_xticks(np.arange(n))
+    ax.set_yticks(np.arange(n))
+    ax.set_xticklabels(gaps.columns, rotation=90)
+    ax.set_yticklabels(gaps.index)
+    if n <= 25:
+        for i in range(n):
+            for j in range(n):
+                if i != j:
+                    ax.text(j, i, f'{values[i, j]:+.2f}', ha='center', va='center', fontsize=7,
+                            color='white' if abs(values[i, j]) > 0.6 * limit else 'black')
+    ax.set_title(title, fontsize=15, fontweight='bold')
+    fig.tight_layout()
+    _finish_figure(fig, profile, save_path)
+
+COMPOUND_COLORS = {'SOFT': '#da291c', 'MEDIUM': '#ffd12e', 'HARD': '#7f7f7f', 'INTERMEDIATE': '#43b02a', 'WET': '#0067ad'}
+
+def plot_stint_report(
+    lap_metrics: pd.DataFrame,
+    stints: pd.DataFrame,
+    title: str = 'Stint Analysis',
+    save_path: Optional[str] = None,
+    profile: str = 'print'
+) -> None:
+    """
+    Plot lap times with per-stint degradation fits and throttle smoothness per lap.
+    Args:
+        lap_metrics: per-lap table from stint_analysis.stint_lap_metrics()
+        stints: per-stint summary from stint_analysis.summarize_stints()
+        title: str, plot title
+        save_path: optional, if provided, save figure to this path
+        profile: render profile, 'print' (default) or 'web' (see RENDER_PROFILES)
+    """
+    fig, (ax1, ax2) = _new_figure(profile, save_path, (14, 9), nrows=2, sharex=True)
+    # Laps used for the degradation fits, as flagged by stint_analysis.lap_table()
+    representative = lap_metrics['representative'].astype(bool)
+    for compound, laps in lap_metrics.groupby('Compound'):
+        color = COMPOUND_COLORS.get(compound, 'black')
+        rep = representative[laps.index]
+        ax1.scatter(laps['LapNumber'][rep], laps['lap_time'][rep], color=color, edgecolors='black', s=30,
+                    label=compound, zorder=3)
+        ax1.scatter(laps['LapNumber'][~rep], laps['lap_time'][~rep], facecolors='none', edgecolors=color, s=30,
+                    zorder=3)
+        if 'throttle_smoothness' in laps:
+            ax2.scatter(laps['LapNumber'], laps['throttle_smoothness'], color=color, edgecolors='black', s=25,
+                        zorder=3)
+    for _, stint in stints.iterrows():
+        if pd.isna(stint['degradation_slope']):
+            continue
+        laps = lap_metrics[(lap_metrics['Driver'] == stint['Driver']) & (lap_metrics['Stint'] == stint['Stint'])
+                           & representative]
+        # Fit line through the stint's representative laps, drawn against lap number
+        offset = np.mean(laps['lap_time'] - stint['degradation_slope'] * laps['TyreLife'])
+        ax1.plot(laps['LapNumber'], offset + stint['degradation_slope'] * laps['TyreLife'], '--',
+                 color=COMPOUND_COLORS.get(stint['Compound'], 'black'), linewidth=1.5,
+                 label=f"{stint['Driver']} stint {stint['Stint']}: {stint['degradation_slope']:+.3f} s/lap")
+    ax1.set_ylabel('Lap Time (s)', fontsize=12)
+    ax1.legend(loc='upper right', fontsize=9)
+    ax1.grid(True, alpha=0.3)
+    ax1.set_title(title, fontsize=15, fontweight='bold')
+    ax2.set_xlabel('Lap Number', fontsize=12)
+    ax2.set_ylabel('Throttle Smoothness (mean |Δ| %)', fontsize=12)
+    ax2.grid(True, alpha=0.3)
+    fig.tight_layout()
+    _finish_figure(fig, profile, save_path)
@@ -0,0 +1,198 @@
+"""
+F1 Cache Warm-up Module
+
+Prefetches whole seasons into the on-disk caches so the web tier never pays
+for a cold session.
+
+For every session of the requested seasons (from fastf1.get_event_schedule)
+warm_season() loads the session, which fills FastF1's own cache. It then writes
+the derived caches the application reads:
+
+- cleaned lap telemetry for every lap (telemetry store, cache/telemetry)
+- the lap table (stored once), driver list, lap count and session info
+  (summary store, cache/sessions), found under both the round number and the
+  event name
+
+A warmed session is then served from these caches: the web app selects laps
+from the stored lap table and reads their stored telemetry without loading
+the session (see F1DataLoader.get_lap_session()).
+
+Sessions are processed with bounded parallelism: a few sessions at a time,
+each extracting its lap telemetry on a small thread pool. Sessions already
+summarized are skipped unless refresh is requested, so an interrupted warm-up
+can simply be rerun.
+
+Example Usage:
+    results = warm_season([2023, 2024], cache_dir='cache', max_sessions=2)
+    python -m src.main --warm-cache 2023-2024
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple, Union
+import logging
+import time
+
+import fastf1
+import pandas as pd
+
+from .session_pool import make_session_key
+
+logger = logging.getLogger(__name__)
+
+# Schedule session names -> session identifiers used throughout the application
+SESSION_CODES = {
+    'Practice 1': 'FP1',
+    'Practice 2': 'FP2',
+    'Practice 3': 'FP3',
+    'Qualifying': 'Q',
+    'Sprint': 'S',
+    'Race': 'R',
+}
+
+SessionRef = Tuple[int, int, str, str]
+
+
+def parse_years(value: Union[int, str]) -> List[int]:
+    """
+    Parse a year or an inclusive year range ('2024', '2022-2024', '2022,2024').
+
+    Raises:
+        ValueError: If the value is not a year, range or list of years
+    """
+    years = []
+    for part in str(value).split(','):
+        part = part.strip()
+        try:
+            if '-' in part:
+                start, stop = (int(p) for p in part.split('-', 1))
+                if stop < start:
+                    raise ValueError
+                years.extend(range(start, stop + 1))
+            else:
+                years.append(int(part))
+        except ValueError:
+            raise ValueError(f"Invalid year or year range: {value!r}") from None
+    return years
+
+
+def season_sessions(year: int,
+                    session_types: Optional[Sequence[str]] = None,
+                    include_future: bool = False) -> List[SessionRef]:
+    """
+    List the sessions of a season from the FastF1 event schedule.
+
+    Args:
+        year: Season year
+        session_types: Only include these identifiers (default: all of SESSION_CODES)
+        include_future: Also list sessions that have not taken place yet
+
+    Returns:
+        list: (year, round, event name, session type) per session, in schedule order
+    """
+    schedule = fastf1.get_event_schedule(year, include_testing=False)
+    now = pd.Timestamp.now(tz='UTC').tz_localize(None)
+    sessions = []
+    for _, event in schedule.iterrows():
+        round_number = int(event['RoundNumber'])
+        if round_number <= 0:
+            continue
+        for i in range(1, 6):
+            code = SESSION_CODES.get(event.get(f'Session{i}'))
+            if code is None or (session_types and code not in session_types):
+                continue
+            date = event.get(f'Session{i}DateUtc')
+            if not include_future and pd.notna(date) and pd.Timestamp(date) > now:
+                continue
+            sessions.append((int(year), round_number, str(event['EventName']), code))
+    return sessions
+
+
+def warm_session(loader: Any,
+                 ref: SessionRef,
+                 telemetry: bool = True,
+                 max_workers: Optional[int] = None) -> Dict[str, Any]:
+    """
+    Load one session and write its derived caches.
+
+    The session is dropped from the loader's pool afterwards (unless it was
+    already pooled), so warming a season does not hold many sessions in memory.
+
+    Args:
+        loader: F1DataLoader whose caches are filled
+        ref: (year, round, event name, session type) from season_sessions()
+        telemetry: Also extract and store the telemetry of every lap
+        max_workers: Concurrent telemetry extractions for the session
+
+    Returns:
+        dict: Session reference, number of laps/drivers, stored telemetry laps and seconds taken
+    """
+    year, round_number, event_name, session_type = ref
+    start = time.perf_counter()
+    pool_key = make_session_key(year, round_number, session_type)
+    was_pooled = pool_key in loader.pool
+    session = loader.get_session(year, round_number, session_type)
+    try:
+        stored = 0
+        if telemetry and not session.laps.empty:
+            results = loader.get_telemetry_many(session.laps, max_workers=max_workers, skip_errors=True)
+            stored = sum(result is not None for result in results)
+        summary = loader.save_session_summary(
+            session, keys=[(year, round_number, session_type), (year, event_name, session_type)])
+    finally:
+        if not was_pooled:
+            loader.pool.remove(pool_key)
+    result = {
+        'year': year, 'round': round_number, 'event': event_name, 'session': session_type,
+        'laps': int(len(session.laps)), 'drivers': len(summary['drivers']) if summary else 0,
+        'telemetry_laps': stored, 'seconds': round(time.perf_counter() - start, 2),
+    }
+    logger.info(f"Warmed {year} {event_name} {session_type}: {result['laps']} laps, "
+                f"{stored} with telemetry in {result['seconds']} s")
+    return result
+
+
+def warm_season(years: Iterable[int],
+                loader: Any = None,
+                cache_dir: str = 'cache',
+                session_types: Optional[Sequence[str]] = None,
+                max_sessions: int = 2,
+                max_workers: Optional[int] = None,
+                telemetry: bool = True,
+                refresh: bool = False) -> List[Dict[str, Any]]:
+    """
+    Prefetch every session of one or more seasons into the caches.
+
+    Args:
+        years: Season years
+        loader: F1DataLoader to fill (default: a new loader on cache_dir)
+        cache_dir: Cache directory when no loader is given
+        session_types: Only warm these session identifiers (default: all)
+        max_sessions: Sessions loaded concurrently
+        max_workers: Concurrent telemetry extractions per session
+        telemetry: Also store the telemetry of every lap
+        refresh: Rewarm sessions that already have a stored summary
+
+    Returns:
+        list: One result dict per session (see warm_session()); failed
+            sessions have an 'error' entry instead of counts
+    """
+    if loader is None:
+        from .data_acquisition import F1DataLoader
+        loader = F1DataLoader(cache_dir=cache_dir)
+    refs = []
+    for year in years:
+        for ref in season_sessions(year, session_types):
+            if not refresh and loader.get_session_summary(ref[0], ref[1], ref[3]) is not None:
+                continue
+            refs.append(ref)
+    logger.info(f"Warming {len(refs)} sessions with {max_sessions} in parallel")
+
+    def run(ref: SessionRef) -> Dict[str, Any]:
+        try:
+            return warm_session(loader, ref, telemetry=telemetry, max_workers=max_workers)
+        except Exception as e:
+            logger.error(f"Failed to warm {ref}: {e}")
+            return {'year': ref[0], 'round': ref[1], 'event': ref[2], 'session': ref[3], 'error': str(e)}
+
+    with ThreadPoolExecutor(max_workers=max(1, max_sessions), thread_name_prefix='f1-warmup') as executor:
+        return list(executor.map(run, refs))
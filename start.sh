@@ -9,4 +9,4 @@ mkdir -p outputs/web
 mkdir -p cache
 
 # Start the application
-exec gunicorn app:app --bind 0.0.0.0:$PORT
\ No newline at end of file
+exec gunicorn src.app:app --bind 0.0.0.0:$PORT --workers 1 --threads 8
\ No newline at end of file
@@ -0,0 +1,53 @@
+import pytest
+import pandas as pd
+import numpy as np
+from src.batch_metrics import StackedTelemetry, compute_batch_metrics, batch_braking_zones, batch_gear_shifts
+from src.performance_metrics import DriverPerformanceAnalyzer
+
+def make_lap(rng, n):
+    return pd.DataFrame({
+        'Time': pd.to_timedelta(np.arange(n) * 0.25, unit='s'),
+        'Distance': np.cumsum(rng.uniform(1, 10, n)),
+        'Speed': rng.uniform(80, 320, n),
+        'Throttle': rng.choice([0, 3, 50, 99, 100], n),
+        'Brake': rng.choice([0, 0, 0, 60], n),
+        'RPM': rng.uniform(8000, 12000, n),
+        'nGear': rng.integers(1, 9, n),
+    })
+
+@pytest.fixture
+def laps():
+    rng = np.random.default_rng(1)
+    return {(drv, lap): make_lap(rng, rng.integers(5, 60)) for drv in ['VER', 'HAM'] for lap in range(1, 4)}
+
+def test_batch_metrics_match_single_lap_analyzer(laps):
+    stacked = StackedTelemetry.from_frames(laps)
+    metrics = compute_batch_metrics(stacked)
+    assert len(metrics) == len(laps)
+    for row, (key, frame) in zip(metrics.itertuples(), laps.items()):
+        analyzer = DriverPerformanceAnalyzer(frame)
+        assert (row.Driver, row.LapNumber) == key
+        assert row.full_throttle_percentage == pytest.approx(analyzer.full_throttle_percentage())
+        assert row.coasting_time_percentage == pytest.approx(analyzer.coasting_time_percentage())
+        assert row.throttle_smoothness == pytest.approx(analyzer.throttle_smoothness())
+        assert row.braking_zones == len(analyzer.braking_zones())
+        assert row.upshifts == len(analyzer.gear_shift_timing())
+
+def test_zones_and_shifts_do_not_span_laps():
+    lap = pd.DataFrame({'Distance': [0, 10, 20], 'Speed': [100, 90, 80], 'Throttle': [0, 0, 0],
+                        'Brake': [0, 50, 50], 'RPM': [1, 2, 3], 'nGear': [3, 4, 5]})
+    stacked = StackedTelemetry.from_frames([(('VER', 1), lap), (('VER', 2), lap.iloc[::-1].reset_index(drop=True))])
+    zones = batch_braking_zones(stacked)
+    assert zones[['LapNumber', 'start_idx', 'end_idx']].values.tolist() == [[1, 1, 2], [2, 0, 1]]
+    shifts = batch_gear_shifts(stacked)
+    assert shifts['LapNumber'].tolist() == [1, 1]
+
+def test_on_off_brake_channel_detects_zones():
+    # FastF1 reports Brake as 0/1; the default threshold adapts to that scale
+    lap = pd.DataFrame({'Distance': np.arange(8) * 10.0, 'Speed': np.full(8, 200.0), 'Throttle': np.zeros(8),
+                        'Brake': [0, 1, 1, 0, 0, 1, 0, 0]})
+    stacked = StackedTelemetry.from_frames([(('VER', 1), lap)])
+    assert compute_batch_metrics(stacked)['braking_zones'].tolist() == [2]
+    assert batch_braking_zones(stacked)['start_distance'].tolist() == [10.0, 50.0]
+    # An explicit percentage threshold still applies
+    assert compute_batch_metrics(stacked, brake_threshold=10)['braking_zones'].tolist() == [0]
@@ -0,0 +1,60 @@
+import numpy as np
+import pytest
+import pandas as pd
+from src.batch_metrics import StackedTelemetry
+from src.brake_analysis import MultiLapBrakeAnalyzer
+from src.performance_metrics import DriverPerformanceAnalyzer
+
+# Brake points (m) per lap of three braking zones; lap 2 also lifts and brakes briefly at 2500 m
+BRAKE_POINTS = np.array([[800, 2000, 4000], [810, 1990, 4020], [790, 2030, 3990], [820, 2000, 4010]])
+PEAKS = np.array([[80, 90, 70], [85, 90, 60], [75, 95, 65], [80, 85, 70]])
+
+def make_lap(points, peaks, extra=None, lengths=(100, 150, 200)):
+    distance = np.arange(0, 5000, 10.0)
+    brake = np.zeros(len(distance))
+    for start, peak, length in zip(points, peaks, lengths):
+        brake[(distance >= start) & (distance < start + length)] = peak
+    if extra is not None:
+        brake[(distance >= extra) & (distance < extra + 20)] = 30
+    return pd.DataFrame({
+        'Time': pd.to_timedelta(distance / 50, unit='s'),
+        'Distance': distance,
+        'Speed': np.full(len(distance), 180.0),
+        'Brake': brake,
+    })
+
+def make_laps():
+    return [make_lap(points, peaks, 2500 if i == 1 else None)
+            for i, (points, peaks) in enumerate(zip(BRAKE_POINTS, PEAKS))]
+
+def test_zone_dispersion():
+    brakes = MultiLapBrakeAnalyzer(make_laps())
+    table = brakes.zone_table()
+    assert table['laps'].tolist() == [4, 4, 4]  # the lap 2 brake stab is not a zone
+    assert np.allclose(table['distance'], np.median(BRAKE_POINTS, axis=0))
+    assert np.allclose(table['brake_point_std'], BRAKE_POINTS.std(axis=0))
+    assert np.allclose(table['peak_pressure_std'], PEAKS.std(axis=0))
+    assert np.allclose(table['duration_mean'], [1.8, 2.8, 3.8])  # (length - 10 m) / 50 m/s
+    assert np.allclose(table['duration_std'], 0)
+    assert np.isclose(brakes.consistency(), BRAKE_POINTS.std(axis=0).mean())
+
+def test_stacked_input_and_analyzer():
+    frames = make_laps()
+    stacked = StackedTelemetry.from_frames({('VER', i + 1): f for i, f in enumerate(frames)})
+    table = MultiLapBrakeAnalyzer(stacked).zone_table()
+    assert len(table) == 3
+    analyzer = DriverPerformanceAnalyzer(frames[0], laps=frames)
+    assert np.isclose(analyzer.brake_consistency(), BRAKE_POINTS.std(axis=0).mean())
+    assert np.isclose(analyzer.brake_consistency('peak_pressure'), PEAKS.std(axis=0).mean())
+    assert np.isnan(DriverPerformanceAnalyzer(frames[0]).brake_consistency())
+    with pytest.raises(ValueError):
+        DriverPerformanceAnalyzer(frames[0], laps=pd.DataFrame({'LapNumber': [1]})).brake_consistency()
+
+def test_close_zones_are_not_chained():
+    # Chicane: two braking zones ~100 m apart whose brake points chain without a 50 m gap
+    points = np.array([[800, 890], [830, 900], [850, 920], [820, 910]])
+    laps = [make_lap(p, [80, 60], lengths=(30, 30)) for p in points]
+    table = MultiLapBrakeAnalyzer(laps).zone_table()
+    assert table['laps'].tolist() == [4, 4]
+    assert np.allclose(table['distance'], np.median(points, axis=0))
+    assert np.allclose(table['peak_pressure_std'], 0)
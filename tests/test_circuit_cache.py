@@ -0,0 +1,54 @@
+import numpy as np
+import pandas as pd
+from src.circuit_cache import CircuitCache, circuit_key, corner_distances, layout_array
+
+class DummyEvent(dict):
+    year = 2024
+
+class DummyCircuitInfo:
+    corners = pd.DataFrame({'X': [10.0, 20.0], 'Y': [5.0, 6.0], 'Number': [2, 1], 'Letter': ['', 'A'],
+                            'Angle': [0.0, 0.0], 'Distance': [1500.0, 400.0]})
+    marshal_sectors = pd.DataFrame({'X': [0.0], 'Y': [0.0], 'Number': [1], 'Letter': [''], 'Angle': [0.0],
+                                    'Distance': [np.nan]})
+    rotation = 92.0
+
+class DummySession:
+    def __init__(self, info=True):
+        self.event = DummyEvent(Location='Monza', EventName='Italian Grand Prix')
+        self.info = info
+        self.calls = 0
+
+    def get_circuit_info(self):
+        self.calls += 1
+        if not self.info:
+            raise ValueError('no circuit info')
+        return DummyCircuitInfo()
+
+def make_telemetry():
+    dist = np.arange(0, 3000, 10.0)
+    speed = 300 - 200 * np.exp(-((dist - 800) / 100) ** 2) - 150 * np.exp(-((dist - 2000) / 100) ** 2)
+    angle = dist / dist.max() * 2 * np.pi
+    return pd.DataFrame({'Distance': dist, 'Speed': speed, 'X': 500 * np.cos(angle), 'Y': 300 * np.sin(angle)})
+
+def test_circuit_info_geometry_is_cached(tmp_path):
+    session = DummySession()
+    circuits = CircuitCache(tmp_path)
+    geometry = circuits.get(session, make_telemetry())
+    assert circuit_key(session) == ('monza', 2024)
+    assert geometry['source'] == 'circuit_info'
+    assert corner_distances(geometry) == [400.0, 1500.0]
+    assert geometry['corners'][0]['letter'] == 'A'
+    assert geometry['marshal_sectors'] == []  # markers without a distance are dropped
+    assert layout_array(geometry).shape == (300, 2)
+    assert circuits.get(session) is geometry
+    # A fresh cache (e.g. after a restart) reads the stored JSON without calling the session
+    assert CircuitCache(tmp_path).get(session) == geometry
+    assert session.calls == 1
+
+def test_speed_minima_fallback(tmp_path):
+    session = DummySession(info=False)
+    geometry = CircuitCache(tmp_path).get(session, make_telemetry())
+    assert geometry['source'] == 'speed_minima'
+    assert np.allclose(corner_distances(geometry), [800, 2000], atol=10)
+    assert layout_array(CircuitCache(tmp_path).get(session)) is not None
+    assert session.calls == 1
@@ -0,0 +1,47 @@
+import io
+import numpy as np
+import pandas as pd
+from src.csv_stream import iter_csv, iter_laps_csv, write_csv
+
+def make_telemetry(n):
+    return pd.DataFrame({
+        'Time': pd.to_timedelta(np.linspace(0, 80, n), unit='s'),
+        'Distance': np.linspace(0, 5000, n, dtype='float32'),
+        'Speed': np.random.uniform(80, 330, n).astype('float32'),
+        'Throttle': np.random.uniform(0, 100, n).astype('float32'),
+        'Brake': (np.random.rand(n) > 0.8).astype('float32'),
+        'RPM': np.random.uniform(8000, 12000, n).astype('float32'),
+        'nGear': np.random.randint(1, 9, n).astype('int8'),
+        'DRS': np.zeros(n, dtype='int8'),
+        'X': np.random.uniform(-9000, 9000, n).astype('float32'),
+        'Y': np.random.uniform(-9000, 9000, n).astype('float32'),
+        'Z': np.random.uniform(0, 200, n).astype('float32'),
+    })
+
+class FakeLoader:
+    def __init__(self, telemetry):
+        self.telemetry = telemetry
+
+    def get_telemetry(self, lap):
+        if lap['LapNumber'] == 2:
+            raise ValueError('no telemetry')
+        return self.telemetry
+
+def test_chunked_csv_matches_one_shot_export():
+    telemetry = make_telemetry(1234)
+    chunked = pd.read_csv(io.StringIO(''.join(iter_csv(telemetry, chunk_rows=100))))
+    expected = telemetry[['Time', 'Distance', 'Speed', 'Throttle', 'Brake', 'RPM', 'nGear', 'X', 'Y', 'Z']].copy()
+    expected['Time'] = expected['Time'].dt.total_seconds()
+    one_shot = pd.read_csv(io.StringIO(expected.to_csv(index=False)))
+    pd.testing.assert_frame_equal(chunked, one_shot)
+
+def test_multi_lap_stream_has_one_header_and_skips_failed_laps(tmp_path):
+    telemetry = make_telemetry(300)
+    laps = [{'Driver': 'VER', 'LapNumber': n} for n in (1, 2, 3)]
+    path = write_csv(iter_laps_csv(FakeLoader(telemetry), laps, chunk_rows=64), tmp_path / 'laps.csv')
+    df = pd.read_csv(path)
+    assert list(df.columns[:2]) == ['Driver', 'LapNumber']
+    assert len(df) == 2 * len(telemetry)
+    assert sorted(df['LapNumber'].unique()) == [1, 3]
+    assert np.isclose(df['Time'].iloc[len(telemetry)], 0.0)
+    assert list(tmp_path.iterdir()) == [path]
@@ -0,0 +1,30 @@
+import numpy as np
+import pandas as pd
+import pytest
+from src.delta_matrix import compute_delta_matrix
+from src.visualization import plot_delta_matrix
+
+def make_lap(pace, n=500):
+    dist = np.linspace(0, 5000, n)
+    return pd.DataFrame({'Distance': dist, 'Time': pd.to_timedelta(dist / pace, unit='s')})
+
+def test_all_pairs_and_ranking():
+    laps = {'AAA': make_lap(60.0), 'BBB': make_lap(61.0), 'CCC': make_lap(59.0)}
+    matrix = compute_delta_matrix(laps, n_points=200)
+    assert matrix.curves.shape == (3, 3, 200)
+    gaps = matrix.final_gaps()
+    assert np.allclose(np.diag(gaps), 0)
+    assert np.allclose(gaps.to_numpy(), -gaps.to_numpy().T)
+    assert gaps.loc['BBB', 'CCC'] == pytest.approx(5000 / 61 - 5000 / 59)
+    assert np.allclose(matrix.pair('BBB', 'CCC'), matrix.times[1] - matrix.times[2])
+    assert list(matrix.ranking()['Driver']) == ['BBB', 'AAA', 'CCC']
+
+def test_needs_two_drivers():
+    with pytest.raises(ValueError):
+        compute_delta_matrix({'AAA': make_lap(60.0)})
+
+def test_plot_delta_matrix(tmp_path):
+    matrix = compute_delta_matrix({'AAA': make_lap(60.0), 'BBB': make_lap(61.0)}, n_points=50)
+    out = tmp_path / 'matrix.png'
+    plot_delta_matrix(matrix.final_gaps(), save_path=str(out), profile='web')
+    assert out.exists()
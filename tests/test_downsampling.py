@@ -0,0 +1,40 @@
+import numpy as np
+import pandas as pd
+import pytest
+from src.downsampling import lttb_indices, minmax_indices, downsample_indices, downsample_frame
+
+def make_series(n=20000):
+    x = np.linspace(0, 5000, n)
+    y = 200 + 80 * np.sin(x / 300)
+    y[12345] = 5.0  # single-sample minimum that must survive
+    return x, y
+
+def test_lttb_bounds_size_and_keeps_spike():
+    x, y = make_series()
+    idx = lttb_indices(x, y, 500)
+    assert len(idx) == 500
+    assert idx[0] == 0 and idx[-1] == len(x) - 1
+    assert np.all(np.diff(idx) > 0)
+    assert 12345 in idx
+
+def test_minmax_keeps_every_bucket_extreme():
+    x, y = make_series()
+    idx = minmax_indices(y, 400)
+    assert len(idx) <= 400
+    assert y[idx].min() == y.min() and y[idx].max() == y.max()
+
+def test_small_input_is_unchanged():
+    x = np.arange(10.0)
+    assert list(lttb_indices(x, x, 100)) == list(range(10))
+    assert list(minmax_indices(x, 100)) == list(range(10))
+
+def test_downsample_frame_keeps_peaks_in_every_channel():
+    x, y = make_series()
+    brake = np.zeros_like(x)
+    brake[777] = 100.0
+    frame = pd.DataFrame({'Distance': x, 'Speed': y, 'Brake': brake})
+    small = downsample_frame(frame, 1000, columns=['Speed', 'Brake'])
+    assert len(small) <= 1000
+    assert small['Speed'].min() == 5.0 and small['Brake'].max() == 100.0
+    with pytest.raises(ValueError):
+        downsample_indices(x, [y], 100, method='stride')
@@ -0,0 +1,31 @@
+import os
+from flask import Flask
+from src.http_cache import NO_STORE, conditional_json, file_etag, json_body
+
+app = Flask(__name__)
+
+@app.route('/drivers')
+def drivers():
+    return conditional_json({'success': True, 'drivers': ['HAM', 'VER']})
+
+def test_json_body_is_canonical():
+    assert json_body({'b': 1, 'a': [1, 2]}) == json_body({'a': [1, 2], 'b': 1})
+
+def test_conditional_json_answers_304():
+    client = app.test_client()
+    first = client.get('/drivers')
+    assert first.status_code == 200 and first.json['drivers'] == ['HAM', 'VER']
+    assert first.headers['Cache-Control'] != NO_STORE
+    etag = first.headers['ETag']
+    second = client.get('/drivers', headers={'If-None-Match': etag})
+    assert second.status_code == 304 and second.data == b''
+    assert client.get('/drivers', headers={'If-None-Match': '"stale"'}).status_code == 200
+
+def test_file_etag_follows_content(tmp_path):
+    path = tmp_path / 'export.csv'
+    path.write_text('a,b\n1,2\n')
+    first = file_etag(path)
+    assert file_etag(path) == first
+    path.write_text('a,b\n1,3\n')
+    os.utime(path, ns=(0, path.stat().st_mtime_ns + 1000))
+    assert file_etag(path) != first
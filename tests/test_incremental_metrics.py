@@ -0,0 +1,70 @@
+import numpy as np
+import pandas as pd
+import pytest
+from src.incremental_metrics import IncrementalAnalyzer
+from src.performance_metrics import DriverPerformanceAnalyzer
+
+def make_telemetry(n=1000, seed=0):
+    rng = np.random.default_rng(seed)
+    brake = np.zeros(n)
+    for start in range(40, n, 150):
+        brake[start:start + 30] = rng.uniform(20, 100)
+    return pd.DataFrame({
+        'Distance': np.arange(n) * 5.0,
+        'Throttle': np.where(brake > 0, 0, np.clip(rng.normal(80, 30, n), 0, 100)).round(),
+        'Brake': brake,
+    })
+
+def chunks(frame, seed=1):
+    rng = np.random.default_rng(seed)
+    bounds = np.cumsum(rng.integers(1, 120, len(frame)))
+    bounds = np.concatenate(([0], bounds[bounds < len(frame)], [len(frame)]))
+    return [frame.iloc[lo:hi] for lo, hi in zip(bounds[:-1], bounds[1:])]
+
+@pytest.mark.parametrize('window', [None, 300])
+def test_matches_full_recompute(window):
+    telemetry = make_telemetry()
+    live = IncrementalAnalyzer(window=window)
+    seen = 0
+    for chunk in chunks(telemetry):
+        metrics = live.update(chunk)
+        seen += len(chunk)
+        frame = telemetry.iloc[max(0, seen - window) if window else 0:seen]
+        analyzer = DriverPerformanceAnalyzer(frame)
+        assert metrics['samples'] == len(frame)
+        assert metrics['full_throttle_percentage'] == pytest.approx(analyzer.full_throttle_percentage())
+        assert metrics['coasting_time_percentage'] == pytest.approx(analyzer.coasting_time_percentage())
+        if len(frame) > 1:
+            assert metrics['throttle_smoothness'] == pytest.approx(analyzer.throttle_smoothness())
+
+def test_braking_zones_across_chunks():
+    telemetry = make_telemetry()
+    live = IncrementalAnalyzer()
+    # Boundaries inside zones (50 is inside 40:70) and right after one (70)
+    for lo, hi in [(0, 50), (50, 55), (55, 70), (70, 200), (200, 1000)]:
+        live.update(telemetry.iloc[lo:hi])
+    zones = live.zones()
+    expected = DriverPerformanceAnalyzer(telemetry)
+    assert list(zip(zones['start_sample'], zones['end_sample'])) == expected.braking_zones()
+    assert np.allclose(zones['max_brake'], expected.max_brake_pressure_per_zone())
+    assert zones['start_distance'].iloc[0] == 200.0
+    assert zones['end_distance'].iloc[0] == 345.0
+    assert not live.metrics()['in_braking_zone']
+    live.update(telemetry.iloc[40:45])
+    assert live.metrics()['in_braking_zone']
+
+def test_window_drops_old_zones():
+    live = IncrementalAnalyzer(window=100)
+    live.update(make_telemetry())
+    assert live.metrics()['samples'] == 100
+    assert live.zones()['start_sample'].min() >= 900
+
+def test_on_off_brake_channel():
+    telemetry = make_telemetry()
+    telemetry['Brake'] = telemetry['Brake'] > 0
+    live = IncrementalAnalyzer()
+    for chunk in chunks(telemetry):
+        live.update(chunk)
+    zones = live.zones()
+    assert live.brake_threshold == 0.5
+    assert list(zip(zones['start_sample'], zones['end_sample'])) == DriverPerformanceAnalyzer(telemetry).braking_zones()
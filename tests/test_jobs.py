@@ -0,0 +1,39 @@
+import math
+import time
+import pytest
+from src.jobs import JobQueue
+
+def wait_for(queue, job_id, timeout=30):
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        job = queue.get(job_id)
+        if job.status in ('done', 'failed'):
+            return job
+        time.sleep(0.01)
+    raise TimeoutError(job_id)
+
+def test_job_result_and_progress():
+    queue = JobQueue(max_workers=2, render_workers=0)
+    def work(job):
+        job.set_progress('Rendering')
+        return queue.render(math.sqrt, 16)
+    job = wait_for(queue, queue.submit(work))
+    assert job.status == 'done'
+    assert job.result == 4
+    queue.shutdown()
+
+def test_failed_job_reports_error():
+    queue = JobQueue(max_workers=1, render_workers=0)
+    def work(job):
+        raise ValueError('Driver XYZ not found in session')
+    job = wait_for(queue, queue.submit(work))
+    assert job.status == 'failed'
+    assert job.to_dict()['error'] == 'Driver XYZ not found in session'
+    assert queue.get('unknown') is None
+    queue.shutdown()
+
+def test_render_in_worker_process():
+    queue = JobQueue(max_workers=1, render_workers=1)
+    job = wait_for(queue, queue.submit(lambda job: queue.render(math.factorial, 10)))
+    assert job.result == 3628800
+    queue.shutdown()
@@ -0,0 +1,58 @@
+import numpy as np
+import pandas as pd
+from scipy.io import loadmat
+from src.data_acquisition import F1DataLoader
+from src.mat_export import mat_name, write_mat
+from src.telemetry_schema import TELEMETRY_DTYPES
+
+class DummySession:
+    name = 'Qualifying'
+    event = {'EventName': 'Monaco Grand Prix'}
+
+class DummyLap(dict):
+    def __init__(self, driver, lap_number, telemetry):
+        super().__init__(Driver=driver, LapNumber=float(lap_number), LapTime=pd.Timedelta(seconds=70 + lap_number))
+        self.session = DummySession()
+        self.telemetry = telemetry
+    def get_telemetry(self):
+        if self.telemetry is None:
+            raise ValueError('no data')
+        return self.telemetry
+
+def make_telemetry(n=200):
+    return pd.DataFrame({
+        'Time': pd.to_timedelta(np.linspace(0, 70, n), unit='s'),
+        'Distance': np.linspace(0, 3300, n),
+        'Speed': np.random.uniform(80, 300, n),
+        'Throttle': np.random.uniform(0, 100, n),
+        'Brake': np.random.rand(n) > 0.8,
+        'RPM': np.random.uniform(8000, 12000, n),
+        'nGear': np.random.randint(1, 9, n),
+        'DRS': np.zeros(n),
+        'X': np.random.rand(n), 'Y': np.random.rand(n), 'Z': np.random.rand(n),
+    })
+
+def test_mat_name():
+    assert mat_name('VER') == 'VER'
+    assert mat_name(12) == 'x_12'
+    assert mat_name('2024 Monaco-Q') == 'x_2024_Monaco_Q'
+
+def test_write_mat_keeps_dtypes_and_values(tmp_path):
+    telemetry = make_telemetry()
+    path = write_mat({'VER': {'lap_1': telemetry}}, tmp_path / 'out.mat')
+    lap = loadmat(path, squeeze_me=True, struct_as_record=False)['VER'].lap_1
+    assert lap.nGear.dtype == TELEMETRY_DTYPES['nGear']
+    assert lap.Speed.dtype == TELEMETRY_DTYPES['Speed']
+    assert np.allclose(lap.Time, telemetry['Time'].dt.total_seconds())
+    assert np.array_equal(lap.Speed, telemetry['Speed'].to_numpy(dtype='float32'))
+    assert list(tmp_path.iterdir()) == [path]
+
+def test_loader_export_to_mat_multi_lap(tmp_path):
+    loader = F1DataLoader(cache_dir=str(tmp_path / 'cache'))
+    laps = [DummyLap('VER', 1, make_telemetry()), DummyLap('VER', 2, None), DummyLap('HAM', 1, make_telemetry(150))]
+    path = loader.export_to_mat(laps, 'laps.mat', output_dir=str(tmp_path))
+    data = loadmat(path, squeeze_me=True, struct_as_record=False)
+    assert len(data['HAM'].lap_1.Speed) == 150
+    assert not hasattr(data['VER'], 'lap_2')
+    assert list(data['laps'].Field) == ['VER.lap_1', 'HAM.lap_1']
+    assert np.allclose(data['laps'].LapTime, [71, 71])
@@ -1,4 +1,5 @@
 import pytest
+import numpy as np
 import pandas as pd
 from src.performance_metrics import DriverPerformanceAnalyzer
 
@@ -13,3 +14,49 @@ def test_full_throttle_percentage():
     analyzer = DriverPerformanceAnalyzer(df)
     pct = analyzer.full_throttle_percentage()
     assert 0 <= pct <= 100
+
+def test_braking_zones_edges():
+    df = pd.DataFrame({'Brake': [20, 50, 0, 0, 30, 0, 40], 'Distance': [0, 10, 20, 30, 40, 50, 60]})
+    analyzer = DriverPerformanceAnalyzer(df)
+    assert analyzer.braking_zones() == [(0, 1), (4, 4), (6, 6)]
+    assert analyzer.max_brake_pressure_per_zone() == [50, 30, 40]
+
+def test_per_apex_lookups():
+    df = pd.DataFrame({
+        'Distance': [0, 10, 20, 30, 40, 50, 60, 70],
+        'Speed': [200, 180, 120, 90, 100, 150, 190, 220],
+        'Brake': [0, 50, 80, 0, 0, 0, 0, 0],
+        'Throttle': [100, 0, 0, 0, 5, 60, 100, 100],
+    })
+    analyzer = DriverPerformanceAnalyzer(df)
+    assert analyzer.brake_application_points([30, 5]) == [10, pytest.approx(float('nan'), nan_ok=True)]
+    assert analyzer.throttle_pickup_after_apex([30, 70])[0] == 20
+    assert analyzer.min_speed_per_corner([30]) == [90]
+    assert analyzer.corner_entry_speed([55], entry_offset=50) == [200]
+    assert analyzer.corner_exit_speed([0], exit_offset=42) == [100]
+
+def test_speed_minima():
+    # Hairpin at 1000 m, chicane at 2500/2600 m, a 5 km/h dip at 3500 m and a flat-bottomed corner at 4200 m
+    dist = np.arange(0, 5000, 10.0)
+    speed = np.full(len(dist), 300.0)
+    speed -= 230 * np.exp(-((dist - 1000) / 150) ** 2)
+    speed -= 180 * np.exp(-((dist - 2500) / 120) ** 2) + 150 * np.exp(-((dist - 2600) / 120) ** 2)
+    speed -= 5 * np.exp(-((dist - 3500) / 50) ** 2)
+    speed -= np.minimum(160 * np.exp(-((dist - 4200) / 200) ** 2), 150)
+    analyzer = DriverPerformanceAnalyzer(pd.DataFrame({'Distance': dist, 'Speed': speed}))
+    apexes = analyzer.speed_minima()
+    assert len(apexes) == 3
+    assert apexes[0] == pytest.approx(1000, abs=10)
+    assert 2500 <= apexes[1] <= 2600
+    assert 4000 <= apexes[2] <= 4400
+    assert analyzer.speed_minima(min_drop=1)[:3] == apexes[:2] + [pytest.approx(3500, abs=10)]
+
+def test_on_off_brake_channel():
+    # FastF1's Brake is on/off: the threshold is picked from the channel's scale
+    df = pd.DataFrame({'Brake': [False, True, True, False, False, True, False],
+                       'Distance': [0, 10, 20, 30, 40, 50, 60]})
+    analyzer = DriverPerformanceAnalyzer(df)
+    assert analyzer.brake_threshold == 0.5
+    assert analyzer.braking_zones() == [(1, 2), (5, 5)]
+    assert analyzer.brake_application_points([30]) == [10]
+    assert DriverPerformanceAnalyzer(df, brake_threshold=10).braking_zones() == []
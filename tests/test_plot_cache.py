@@ -0,0 +1,38 @@
+import os
+import pytest
+from src import plot_cache
+from src.plot_cache import PlotCache
+
+def test_key_is_stable_and_order_independent():
+    a = PlotCache.key_for(session='2024:monaco:Q', driver='VER', plot_type='trace')
+    b = PlotCache.key_for(plot_type='trace', driver='VER', session='2024:monaco:Q')
+    assert a == b
+    assert a != PlotCache.key_for(session='2024:monaco:Q', driver='HAM', plot_type='trace')
+
+def test_key_changes_with_plot_version(monkeypatch):
+    key = PlotCache.key_for(session='2024:monaco:Q', driver='VER', plot_type='trace')
+    monkeypatch.setattr(plot_cache, 'PLOT_VERSION', plot_cache.PLOT_VERSION + 1)
+    assert PlotCache.key_for(session='2024:monaco:Q', driver='VER', plot_type='trace') != key
+
+def test_publish_and_lookup(tmp_path):
+    cache = PlotCache(tmp_path)
+    key = cache.key_for(driver='VER')
+    assert cache.lookup(key) is None
+    tmp = cache.temp_path(key)
+    tmp.write_bytes(b'png')
+    path = cache.publish(key, tmp)
+    assert cache.lookup(key) == path
+    assert not tmp.exists()
+
+def test_eviction_keeps_recently_used(tmp_path):
+    cache = PlotCache(tmp_path, max_bytes=250)
+    keys = [cache.key_for(lap=i) for i in range(3)]
+    for i, key in enumerate(keys):
+        tmp = cache.temp_path(key)
+        tmp.write_bytes(b'x' * 100)
+        os.utime(tmp, (1000 + i, 1000 + i))
+        cache.publish(key, tmp)
+        os.utime(cache.path_for(key), (1000 + i, 1000 + i))
+    assert cache.lookup(keys[0]) is None
+    assert cache.lookup(keys[1]) is not None
+    assert cache.lookup(keys[2]) is not None
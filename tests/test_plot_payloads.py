@@ -0,0 +1,47 @@
+import json
+import numpy as np
+import pandas as pd
+import pytest
+from src.plot_payloads import build_payload, decode_array, decimate_indices
+
+def make_telemetry(n=5000, offset=0.0):
+    dist = np.linspace(0, 5000, n)
+    return pd.DataFrame({
+        'Time': pd.to_timedelta(dist / (60 + offset), unit='s'),
+        'Distance': dist,
+        'Speed': 200 + 50 * np.sin(dist / 300) + offset,
+        'Throttle': np.clip(100 * np.sin(dist / 200), 0, 100),
+        'Brake': np.clip(-100 * np.sin(dist / 200), 0, 100),
+        'nGear': (np.arange(n) // 700) % 8 + 1,
+        'X': np.cos(dist / 800) * 1000,
+        'Y': np.sin(dist / 800) * 1000,
+    })
+
+def test_decimation_keeps_endpoints():
+    idx = decimate_indices(5000, 100)
+    assert len(idx) <= 100 and idx[0] == 0 and idx[-1] == 4999
+    assert len(decimate_indices(50, 100)) == 50
+
+def test_trace_payload_is_json_and_decimated():
+    tel = make_telemetry()
+    lap_info = {'lap_number': 1, 'lap_time': '1:12.3', 'sector1_end': 1600, 'sector2_end': 3300, 'sector3_end': 5000}
+    payload = build_payload({'plot_type': 'trace', 'telemetry': tel, 'driver': 'VER', 'lap_info': lap_info},
+                            max_points=500)
+    json.dumps(payload)
+    speed = payload['panels'][0]['series'][0]
+    assert len(decode_array(speed['y'])) <= 500
+    assert decode_array(speed['x'])[-1] == pytest.approx(5000)
+    assert [v['x'] for v in payload['vlines']] == [1600, 3300]
+
+def test_delta_payload_handles_timedelta_time():
+    spec = {'plot_type': 'delta', 'telemetry': make_telemetry(), 'telemetry2': make_telemetry(offset=1.0),
+            'driver': 'VER', 'compare_driver': 'HAM'}
+    payload = build_payload(spec, max_points=200)
+    speed_delta = decode_array(payload['panels'][0]['series'][0]['y'])
+    time_delta = decode_array(payload['panels'][1]['series'][0]['y'])
+    assert np.allclose(speed_delta, -1.0, atol=1e-3)
+    assert time_delta[0] == 0 and time_delta[-1] > 0
+
+def test_unsupported_plot_type():
+    with pytest.raises(ValueError):
+        build_payload({'plot_type': 'gg', 'telemetry': make_telemetry(), 'driver': 'VER'})
@@ -0,0 +1,52 @@
+import numpy as np
+import pandas as pd
+import pytest
+from src.resampling import (LapResampler, distance_grid, nearest_indices, resample, resample_laps)
+from src.visualization import plot_speed_delta
+
+def make_lap(n=600, seed=0, length=5000.0):
+    rng = np.random.default_rng(seed)
+    dist = np.sort(rng.uniform(0, length, n))
+    return pd.DataFrame({
+        'Time': pd.to_timedelta(dist / 60, unit='s'),
+        'Distance': dist,
+        'Speed': 200 + 80 * np.sin(dist / 300),
+        'Throttle': rng.uniform(0, 100, n),
+        'nGear': (np.arange(n) // 75) % 8 + 1,
+    })
+
+def test_resample_matches_np_interp():
+    lap = make_lap()
+    grid = np.linspace(-10, 5100, 777)
+    out = resample(lap, grid, ['Speed', 'Throttle', 'Time'])
+    assert out.shape == (777, 3)
+    assert np.allclose(out[:, 0], np.interp(grid, lap['Distance'], lap['Speed']))
+    assert np.allclose(out[:, 1], np.interp(grid, lap['Distance'], lap['Throttle']))
+    seconds = lap['Time'].dt.total_seconds().to_numpy()
+    assert np.allclose(out[:, 2], np.interp(grid, lap['Distance'], seconds - seconds[0]))
+
+def test_step_channels_are_not_interpolated():
+    lap = make_lap()
+    gears = resample(lap, distance_grid([lap]), ['nGear'])[:, 0]
+    assert set(np.unique(gears)) <= set(lap['nGear'].unique())
+
+def test_stack_and_cache():
+    laps = [make_lap(seed=1), make_lap(seed=2)]
+    resampler = LapResampler(max_entries=2)
+    stacked = resampler.stack(laps, distance_grid(laps, 500), columns=['Speed', 'Time'], keys=['a', 'b'])
+    assert stacked.values.shape == (2, 500, 2)
+    assert stacked.delta('Speed')[0].max() == 0
+    again = resampler.resample(laps[0], stacked.grid, ['Speed', 'Time'], key='a')
+    assert again is resampler.resample(laps[0], stacked.grid, ['Speed', 'Time'], key='a')
+    resampler.resample(laps[0], stacked.grid, ['Speed'], key='c')
+    assert len(resampler) == 2
+    assert resample_laps(laps, n_points=100).values.shape[:2] == (2, 100)
+
+def test_nearest_indices_ties_go_to_earlier_sample():
+    dist = np.array([0.0, 10.0, 20.0])
+    assert list(nearest_indices(dist, [5.0, 14.0, 16.0, -3.0, 99.0])) == [0, 1, 2, 0, 2]
+
+def test_speed_delta_plot_with_timedelta_time(tmp_path):
+    out = tmp_path / 'delta.png'
+    plot_speed_delta(make_lap(seed=3), make_lap(seed=4), 'VER', 'HAM', save_path=str(out), profile='web')
+    assert out.exists()
@@ -0,0 +1,57 @@
+import pandas as pd
+from src.schedule_index import ScheduleIndex
+
+def make_schedule(year):
+    return pd.DataFrame({
+        'RoundNumber': [0, 2, 1, 3],
+        'EventName': ['Pre-Season Testing', 'Saudi Arabian Grand Prix', 'Bahrain Grand Prix', 'British Grand Prix'],
+        'Location': ['Sakhir', 'Jeddah', 'Sakhir', 'Silverstone'],
+        'Country': ['Bahrain', 'Saudi Arabia', 'Bahrain', 'United Kingdom'],
+        'EventDate': pd.to_datetime([f'{year}-02-21', f'{year}-03-09', f'{year}-03-02', f'{year}-07-07']),
+        'EventFormat': ['testing', 'conventional', 'conventional', 'conventional'],
+    })
+
+class CountingFetch:
+    def __init__(self):
+        self.calls = 0
+        self.fail = False
+    def __call__(self, year):
+        self.calls += 1
+        if self.fail:
+            raise ConnectionError('offline')
+        return make_schedule(year)
+
+def test_index_lookups_and_persistence(tmp_path):
+    fetch = CountingFetch()
+    index = ScheduleIndex(tmp_path / 'schedule.json', fetch=fetch)
+    assert [t['round'] for t in index.tracks(2024)] == [1, 2, 3]
+    assert index.find(2024, 2)['name'] == 'Saudi Arabian Grand Prix'
+    assert index.find(2024, 'british grand prix')['round'] == 3
+    assert index.find(2024, 'jedda')['round'] == 2
+    assert index.find(2024, 'silverstne')['round'] == 3
+    assert index.find(2024, 'Monaco') is None
+    assert fetch.calls == 1
+
+    restarted = ScheduleIndex(tmp_path / 'schedule.json', fetch=fetch)
+    assert restarted.tracks_json(2024) == index.tracks_json(2024)
+    assert fetch.calls == 1
+
+def test_records_keep_timestamp_date_format(tmp_path):
+    index = ScheduleIndex(tmp_path / 'schedule.json', fetch=CountingFetch())
+    assert index.tracks(2024)[0]['date'] == '2024-03-02 00:00:00'
+
+def test_resolve_race_falls_back_to_the_track_string(tmp_path):
+    fetch = CountingFetch()
+    index = ScheduleIndex(tmp_path / 'schedule.json', fetch=fetch)
+    assert index.resolve_race(2024, 'Silverstone') == 3
+    assert index.resolve_race(2024, 'Monaco') == 'Monaco'
+    fetch.fail = True
+    assert index.resolve_race(2025, 'Silverstone') == 'Silverstone'
+
+def test_index_refreshes_after_ttl_and_serves_stale_when_offline(tmp_path):
+    fetch = CountingFetch()
+    index = ScheduleIndex(tmp_path / 'schedule.json', ttl=0, fetch=fetch)
+    body, etag = index.tracks_json(2024)
+    fetch.fail = True
+    assert index.tracks_json(2024) == (body, etag)
+    assert fetch.calls == 2
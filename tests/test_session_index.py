@@ -0,0 +1,41 @@
+import numpy as np
+import pandas as pd
+from fastf1.core import Laps
+from src.session_index import SessionIndex
+
+def make_laps(seed=0, n=120):
+    rng = np.random.default_rng(seed)
+    drivers = rng.choice(['VER', 'HAM', 'LEC', 'NOR'], n)
+    lap_time = pd.to_timedelta(rng.choice([80.0, 80.5, 81.0, 82.0, np.nan], n), unit='s')
+    return Laps(pd.DataFrame({
+        'Driver': drivers,
+        'DriverNumber': ['1'] * n,
+        'LapNumber': np.arange(1, n + 1, dtype=float),
+        'LapTime': lap_time,
+        'IsPersonalBest': rng.random(n) > 0.5,
+    }))
+
+def test_index_matches_fastf1_lap_selection():
+    for seed in range(5):
+        laps = make_laps(seed)
+        index = SessionIndex(laps)
+        assert index.drivers == sorted(laps['Driver'].unique())
+        for driver in index.drivers:
+            driver_laps = laps.pick_drivers([driver])
+            expected = driver_laps.pick_fastest()
+            lap = index.lap(driver.lower(), 'fastest')
+            assert (lap is None) == (expected is None)
+            if expected is not None:
+                assert lap['LapNumber'] == expected['LapNumber']
+            assert index.lap(driver, 'first')['LapNumber'] == driver_laps.iloc[0]['LapNumber']
+            assert index.lap(driver, 'last')['LapNumber'] == driver_laps.iloc[-1]['LapNumber']
+            number = driver_laps.iloc[1]['LapNumber']
+            assert index.lap(driver, lap_number=int(number))['Driver'] == driver
+            assert len(index.driver_laps(driver)) == len(driver_laps)
+
+def test_index_lookups_for_unknown_drivers_and_empty_sessions():
+    index = SessionIndex(make_laps())
+    assert index.has_driver('ver') and not index.has_driver('XYZ')
+    assert index.lap('XYZ') is None and index.lap('VER', lap_number=10 ** 6) is None
+    empty = SessionIndex(make_laps().iloc[:0])
+    assert empty.drivers == [] and empty.lap('VER') is None
@@ -0,0 +1,65 @@
+import threading
+import time
+import pytest
+import pandas as pd
+from src.session_pool import SessionPool, make_session_key, format_session_key, parse_session_key
+
+class DummySession:
+    def __init__(self, rows=10):
+        self.laps = pd.DataFrame({'Driver': ['VER'] * rows, 'LapNumber': range(rows)})
+
+def test_session_key_roundtrip():
+    key = make_session_key(2024, 'Monaco ', 'q')
+    assert key == (2024, 'monaco', 'Q')
+    assert parse_session_key(format_session_key(key)) == key
+    with pytest.raises(ValueError):
+        parse_session_key('2024:monaco')
+
+def test_lru_eviction_by_count():
+    pool = SessionPool(max_sessions=2)
+    for race in ['monaco', 'monza', 'spa']:
+        pool.put(make_session_key(2024, race, 'Q'), DummySession())
+    pool.get(make_session_key(2024, 'monza', 'Q'))
+    pool.put(make_session_key(2024, 'imola', 'Q'), DummySession())
+    assert pool.keys() == [make_session_key(2024, 'monza', 'Q'), make_session_key(2024, 'imola', 'Q')]
+
+def test_eviction_by_memory_budget():
+    pool = SessionPool(max_sessions=10, max_bytes=1)
+    pool.put(make_session_key(2024, 'monaco', 'Q'), DummySession())
+    pool.put(make_session_key(2024, 'monza', 'Q'), DummySession())
+    assert pool.keys() == [make_session_key(2024, 'monza', 'Q')]
+
+def test_get_or_load_only_loads_on_miss():
+    pool = SessionPool()
+    calls = []
+    key = make_session_key(2024, 'monaco', 'R')
+    load = lambda: calls.append(1) or DummySession()
+    first = pool.get_or_load(key, load)
+    assert pool.get_or_load(key, load) is first
+    assert len(calls) == 1
+
+def test_concurrent_loads_are_coalesced():
+    pool = SessionPool()
+    calls = []
+    def slow_load():
+        calls.append(1)
+        time.sleep(0.05)
+        return DummySession()
+    key = make_session_key(2024, 'monaco', 'Q')
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(pool.get_or_load(key, slow_load))) for _ in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert len(calls) == 1
+    assert all(r is results[0] for r in results)
+
+def test_failed_load_is_not_cached():
+    pool = SessionPool()
+    key = make_session_key(2024, 'monaco', 'Q')
+    def failing():
+        raise ValueError('boom')
+    with pytest.raises(ValueError):
+        pool.get_or_load(key, failing)
+    assert pool.get_or_load(key, DummySession) is not None
@@ -0,0 +1,52 @@
+import numpy as np
+import pandas as pd
+from src.stint_analysis import stint_lap_metrics, summarize_stints, write_stint_report
+
+def make_telemetry(seed, n=400):
+    rng = np.random.default_rng(seed)
+    brake = np.zeros(n)
+    brake[100:120] = 1
+    brake[300:310] = 1
+    return pd.DataFrame({
+        'Time': pd.to_timedelta(np.linspace(0, 80, n), unit='s'),
+        'Distance': np.linspace(0, 5000, n),
+        'Speed': rng.uniform(80, 320, n),
+        'Throttle': np.clip(rng.normal(70, 30, n), 0, 100),
+        'Brake': brake,
+        'nGear': rng.integers(1, 9, n),
+    })
+
+class FakeLoader:
+    def get_telemetry_many(self, laps, max_workers=None, skip_errors=False):
+        return [None if lap['LapNumber'] == 3 else make_telemetry(int(lap['LapNumber'])) for lap in laps]
+
+def make_laps():
+    lap_numbers = np.arange(1, 21)
+    stint = np.where(lap_numbers <= 10, 1, 2)
+    tyre_life = np.where(stint == 1, lap_numbers, lap_numbers - 10)
+    lap_time = np.where(stint == 1, 90 + 0.10 * tyre_life, 89 + 0.05 * tyre_life)
+    lap_time[6] += 20  # Slow lap (yellow flag)
+    pit_in = pd.Series(pd.NaT, index=lap_numbers - 1, dtype='timedelta64[ns]')
+    pit_in[9] = pd.Timedelta(seconds=3000)
+    return pd.DataFrame({
+        'Driver': 'VER', 'LapNumber': lap_numbers.astype(float), 'LapTime': pd.to_timedelta(lap_time, unit='s'),
+        'Stint': stint.astype(float), 'Compound': np.where(stint == 1, 'MEDIUM', 'HARD'),
+        'TyreLife': tyre_life.astype(float), 'PitInTime': pit_in.to_numpy(), 'PitOutTime': pd.NaT,
+    })
+
+def test_stint_summary(tmp_path):
+    lap_metrics = stint_lap_metrics(FakeLoader(), make_laps())
+    assert len(lap_metrics) == 20
+    assert np.isnan(lap_metrics.loc[2, 'throttle_smoothness'])
+    assert list(np.flatnonzero(~lap_metrics['representative'])) == [6, 9]  # slow lap and in lap
+    assert np.allclose(lap_metrics.drop(index=2)['braking_distance'], (19 + 9) * 5000 / 399, rtol=1e-4)
+
+    stints = summarize_stints(lap_metrics)
+    assert list(stints['Compound']) == ['MEDIUM', 'HARD']
+    assert list(stints['laps']) == [10, 10]
+    assert list(stints['representative_laps']) == [8, 10]  # slow lap and in lap excluded
+    assert np.allclose(stints['degradation_slope'], [0.10, 0.05])
+    assert np.allclose(stints['braking_consistency'], 0, atol=1e-3)
+
+    paths = write_stint_report(lap_metrics, stints, str(tmp_path), 'ver_test', profile='web')
+    assert all(path.exists() for path in paths.values())
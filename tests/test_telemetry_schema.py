@@ -0,0 +1,37 @@
+import numpy as np
+import pandas as pd
+from src.telemetry_schema import TELEMETRY_DTYPES, apply_telemetry_schema
+from src.data_acquisition import clean_telemetry
+
+def make_raw(n=700):
+    return pd.DataFrame({
+        'Time': pd.to_timedelta(np.linspace(0, 80, n), unit='s'),
+        'Distance': np.linspace(0, 5000, n),
+        'Speed': np.random.uniform(80, 330, n),
+        'Throttle': np.random.uniform(0, 100, n),
+        'Brake': np.random.rand(n) > 0.8,
+        'RPM': np.random.uniform(8000, 12000, n),
+        'nGear': np.random.randint(1, 9, n).astype(float),
+        'DRS': np.zeros(n),
+        'X': np.random.uniform(-9000, 9000, n),
+        'Y': np.random.uniform(-9000, 9000, n),
+        'Z': np.random.uniform(0, 200, n),
+    })
+
+def test_clean_telemetry_uses_compact_schema():
+    raw = make_raw()
+    clean = clean_telemetry(raw)
+    for col, dtype in TELEMETRY_DTYPES.items():
+        assert clean[col].dtype == dtype
+    assert pd.api.types.is_timedelta64_dtype(clean['Time'])
+    assert clean.memory_usage(index=False).sum() * 2 < raw.astype({'Brake': float}).memory_usage(index=False).sum()
+    assert np.allclose(clean['Distance'], raw['Distance'], atol=1e-3)
+
+def test_schema_leaves_unknown_and_nan_integer_columns_usable():
+    df = pd.DataFrame({'nGear': [1.0, np.nan, 3.0], 'Other': [1.5, 2.5, 3.5]})
+    out = apply_telemetry_schema(df)
+    assert out['nGear'].dtype == np.float32
+    assert out['Other'].dtype == np.float64
+    assert df['nGear'].dtype == np.float64
+    compact = apply_telemetry_schema(out)
+    assert compact is out
@@ -0,0 +1,81 @@
+import pytest
+import pandas as pd
+import numpy as np
+from src.telemetry_store import TelemetryStore
+from src.data_acquisition import F1DataLoader
+
+class DummyEvent(dict):
+    year = 2024
+
+class DummySession:
+    name = 'Qualifying'
+    event = DummyEvent(EventName='Monaco Grand Prix')
+
+class DummyLap(dict):
+    def __init__(self, telemetry):
+        super().__init__(Driver='VER', LapNumber=12.0)
+        self.session = DummySession()
+        self.telemetry = telemetry
+        self.calls = 0
+    def get_telemetry(self):
+        self.calls += 1
+        return self.telemetry
+
+def make_telemetry(n=50):
+    return pd.DataFrame({
+        'Time': pd.to_timedelta(np.linspace(0, 10, n), unit='s'),
+        'Distance': np.linspace(0, 500, n),
+        'Speed': np.random.uniform(80, 300, n),
+        'Throttle': np.random.uniform(0, 100, n),
+        'Brake': np.random.rand(n) > 0.8,
+        'RPM': np.random.uniform(8000, 12000, n),
+        'nGear': np.random.randint(1, 9, n),
+        'DRS': np.zeros(n),
+        'X': np.random.rand(n), 'Y': np.random.rand(n), 'Z': np.random.rand(n),
+    })
+
+def test_store_roundtrip(tmp_path):
+    store = TelemetryStore(tmp_path)
+    key = (2024, 'Monaco Grand Prix', 'Qualifying', 'VER', 12)
+    assert store.load(key) is None
+    telemetry = make_telemetry()
+    store.save(key, telemetry)
+    loaded = store.load(key)
+    pd.testing.assert_frame_equal(loaded, telemetry)
+    assert list(store.load(key, columns=['Speed', 'Time']).columns) == ['Speed', 'Time']
+
+def test_loader_serves_repeat_requests_from_store(tmp_path):
+    loader = F1DataLoader(cache_dir=str(tmp_path))
+    lap = DummyLap(make_telemetry())
+    first = loader.get_telemetry(lap)
+    second = loader.get_telemetry(lap)
+    assert lap.calls == 1
+    pd.testing.assert_frame_equal(first, second)
+
+class NumberedLap(DummyLap):
+    def __init__(self, telemetry, lap_number):
+        super().__init__(telemetry)
+        self['LapNumber'] = float(lap_number)
+    def get_telemetry(self):
+        if self.telemetry is None:
+            raise ValueError('no data')
+        return super().get_telemetry()
+
+def test_get_telemetry_many_keeps_order_and_uses_store(tmp_path):
+    loader = F1DataLoader(cache_dir=str(tmp_path))
+    frames = [make_telemetry(n=20 + i) for i in range(6)]
+    laps = [NumberedLap(frame, i + 1) for i, frame in enumerate(frames)]
+    loader.get_telemetry(laps[2])
+    results = loader.get_telemetry_many(laps, max_workers=3)
+    assert [len(r) for r in results] == [len(f) for f in frames]
+    assert laps[2].calls == 1
+    loader.get_telemetry_many(laps)
+    assert all(lap.calls == 1 for lap in laps)
+
+def test_get_telemetry_many_errors(tmp_path):
+    loader = F1DataLoader(cache_dir=str(tmp_path))
+    laps = [NumberedLap(make_telemetry(), 1), NumberedLap(None, 2)]
+    with pytest.raises(ValueError):
+        loader.get_telemetry_many(laps)
+    results = loader.get_telemetry_many(laps, skip_errors=True)
+    assert results[0] is not None and results[1] is None
@@ -0,0 +1,74 @@
+import time
+import numpy as np
+import pandas as pd
+import pytest
+from src.performance_metrics import DriverPerformanceAnalyzer
+from src.telemetry_store import TelemetryStore
+from src.telemetry_stream import ReplaySource, find_replay_files, live_updates
+
+def make_lap(lap_number, n=200):
+    rng = np.random.default_rng(lap_number)
+    brake = np.zeros(n)
+    brake[50:70] = 1
+    brake[150:160] = 1
+    return pd.DataFrame({
+        'Driver': 'VER', 'LapNumber': lap_number,
+        'Time': np.arange(n) * 0.1,
+        'Distance': np.arange(n) * 25.0,
+        'Speed': rng.uniform(80, 320, n),
+        'Throttle': np.where(brake > 0, 0, rng.uniform(0, 100, n)).round(),
+        'Brake': brake,
+    })
+
+def test_replay_csv_laps_in_time_order(tmp_path):
+    laps = pd.concat([make_lap(1), make_lap(2)], ignore_index=True)
+    laps.to_csv(tmp_path / 'ver_driver.csv', index=False)
+    chunks = list(ReplaySource([tmp_path / 'ver_driver.csv'], speedup=np.inf, chunk_seconds=1.0,
+                               read_rows=150).chunks())
+    replayed = pd.concat(chunks, ignore_index=True)
+    assert np.allclose(replayed['Speed'], laps['Speed'])
+    # Replay time continues across the lap boundary instead of jumping back
+    assert np.all(np.diff(replayed['ReplayTime']) >= 0)
+    assert replayed['ReplayTime'].iloc[-1] == pytest.approx(39.8)
+    assert max(c['ReplayTime'].iloc[-1] - c['ReplayTime'].iloc[0] for c in chunks) < 1.0
+
+def test_replay_store_entry_is_paced(tmp_path):
+    store = TelemetryStore(tmp_path / 'telemetry')
+    lap = make_lap(1, n=20).drop(columns=['Driver', 'LapNumber'])
+    lap['Time'] = pd.to_timedelta(lap['Time'], unit='s')
+    path = store.save((2024, 'Monaco', 'Q', 'VER', 1), lap)
+    started = time.monotonic()
+    chunks = list(ReplaySource([path], speedup=10, chunk_seconds=0.5).chunks())
+    assert time.monotonic() - started >= 1.9 / 10
+    assert sum(len(c) for c in chunks) == 20
+
+def test_backpressure_and_close(tmp_path):
+    make_lap(1, n=2000).to_csv(tmp_path / 'long.csv', index=False)
+    source = ReplaySource([tmp_path / 'long.csv'], speedup=np.inf, chunk_seconds=0.1, max_buffered=2)
+    chunks = source.chunks()
+    next(chunks)
+    time.sleep(0.2)
+    # The producer waits for the consumer instead of reading ahead
+    assert source._queue.qsize() <= 2
+    assert source._thread.is_alive()
+    chunks.close()
+    assert not source._thread.is_alive()
+
+def test_live_updates(tmp_path):
+    lap = make_lap(1)
+    lap.to_csv(tmp_path / 'lap.csv', index=False)
+    updates = list(live_updates(ReplaySource([tmp_path / 'lap.csv'], speedup=np.inf)))
+    final = updates[-1]
+    analyzer = DriverPerformanceAnalyzer(lap)
+    assert final['samples'] == len(lap)
+    assert final['last']['Driver'] == 'VER'
+    assert final['metrics']['full_throttle_percentage'] == pytest.approx(analyzer.full_throttle_percentage())
+    assert final['metrics']['braking_zones'] == len(analyzer.braking_zones(threshold=0.5))
+    assert find_replay_files([tmp_path, tmp_path / 'missing']) == [tmp_path / 'lap.csv']
+
+def test_rejects_unknown_files(tmp_path):
+    (tmp_path / 'plot.png').write_bytes(b'')
+    with pytest.raises(ValueError):
+        ReplaySource([tmp_path / 'plot.png'])
+    with pytest.raises(ValueError):
+        ReplaySource([], speedup=1)
@@ -1,7 +1,9 @@
 import pytest
 import pandas as pd
 import numpy as np
-from src.visualization import plot_throttle_brake_trace
+from src import visualization
+from src.resampling import default_resampler
+from src.visualization import plot_speed_delta, plot_throttle_brake_trace
 
 def test_plot_throttle_brake_trace(tmp_path):
     telemetry = pd.DataFrame({
@@ -16,3 +18,31 @@ def test_plot_throttle_brake_trace(tmp_path):
     out_path = tmp_path / 'trace.png'
     plot_throttle_brake_trace(telemetry, lap_info, driver_code, save_path=str(out_path))
     assert out_path.exists()
+
+def test_web_profile_reuses_figure(tmp_path):
+    telemetry = pd.DataFrame({
+        'Distance': np.linspace(0, 100, 10),
+        'Speed': np.random.uniform(100, 300, 10),
+        'Throttle': np.random.uniform(0, 100, 10),
+        'Brake': np.random.uniform(0, 100, 10),
+        'Sector': [1]*3 + [2]*3 + [3]*4
+    })
+    lap_info = {'lap_number': 1, 'lap_time': '1:12.345', 'sector1_end': 30, 'sector2_end': 60, 'sector3_end': 100}
+    figures = []
+    for name in ('a.png', 'b.png'):
+        plot_throttle_brake_trace(telemetry, lap_info, 'VER', save_path=str(tmp_path / name), profile='web')
+        figures.append(visualization._figure_pool.figures[((12, 8), 100)])
+    assert figures[0] is figures[1]
+    assert (tmp_path / 'a.png').exists() and (tmp_path / 'b.png').exists()
+    with pytest.raises(ValueError):
+        plot_throttle_brake_trace(telemetry, lap_info, 'VER', save_path=str(tmp_path / 'c.png'), profile='poster')
+
+def test_speed_delta_resamples_keyed_laps_through_cache(tmp_path):
+    distance = np.linspace(0, 1000, 200)
+    laps = [pd.DataFrame({'Distance': distance, 'Speed': np.full(200, speed),
+                          'Time': pd.to_timedelta(distance / speed * 3.6, unit='s')}) for speed in (200.0, 180.0)]
+    before = len(default_resampler)
+    plot_speed_delta(laps[0], laps[1], 'VER', 'HAM', save_path=str(tmp_path / 'delta.png'), profile='web',
+                     lap_keys=[('test', 'VER', 1), ('test', 'HAM', 1)])
+    assert (tmp_path / 'delta.png').exists()
+    assert len(default_resampler) == before + 2
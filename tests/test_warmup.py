@@ -0,0 +1,84 @@
+import numpy as np
+import pandas as pd
+import pytest
+from src.data_acquisition import F1DataLoader
+from src.session_summary import StoredSession
+from src.session_pool import make_session_key
+from src.warmup import parse_years, warm_session
+
+def make_telemetry(n=40):
+    return pd.DataFrame({
+        'Time': pd.to_timedelta(np.linspace(0, 10, n), unit='s'),
+        'Distance': np.linspace(0, 500, n),
+        'Speed': np.random.uniform(80, 300, n),
+        'Throttle': np.random.uniform(0, 100, n),
+        'Brake': np.random.rand(n) > 0.8,
+        'RPM': np.random.uniform(8000, 12000, n),
+        'nGear': np.random.randint(1, 9, n),
+        'DRS': np.zeros(n),
+        'X': np.random.rand(n), 'Y': np.random.rand(n), 'Z': np.random.rand(n),
+    })
+
+class DummyLap(dict):
+    def __init__(self, session, driver, lap_number):
+        super().__init__(Driver=driver, LapNumber=float(lap_number))
+        self.session = session
+    def get_telemetry(self):
+        return make_telemetry()
+
+class DummyLaps(pd.DataFrame):
+    _metadata = ['session']
+    def iterlaps(self):
+        for i, row in self.iterrows():
+            yield i, DummyLap(self.session, row['Driver'], row['LapNumber'])
+
+class DummyEvent(dict):
+    year = 2024
+
+class DummySession:
+    name = 'Qualifying'
+    event = DummyEvent(EventName='Monaco Grand Prix')
+    def __init__(self):
+        self.laps = DummyLaps({'Driver': ['VER', 'VER', 'HAM'], 'LapNumber': [1.0, 2.0, 1.0]})
+        self.laps.session = self
+
+def test_parse_years():
+    assert parse_years('2024') == [2024]
+    assert parse_years('2022-2024') == [2022, 2023, 2024]
+    assert parse_years('2021,2023-2024') == [2021, 2023, 2024]
+    with pytest.raises(ValueError):
+        parse_years('2024-2022')
+
+def test_warm_session_writes_derived_caches(tmp_path):
+    loader = F1DataLoader(cache_dir=str(tmp_path))
+    session = DummySession()
+    key = make_session_key(2024, 8, 'Q')
+    loader.pool.put(key, session)
+    result = warm_session(loader, (2024, 8, 'Monaco Grand Prix', 'Q'))
+    assert result['laps'] == 3 and result['telemetry_laps'] == 3 and result['drivers'] == 2
+    for race in (8, 'Monaco Grand Prix'):
+        assert loader.get_session_summary(2024, race, 'Q')['drivers'] == ['HAM', 'VER']
+    assert loader.summary_store.load(key)['n_laps'] == 3
+    assert len(loader.summary_store.load_laps(key)) == 3
+    assert loader.telemetry_store.contains((2024, 'Monaco Grand Prix', 'Qualifying', 'HAM', 1))
+    assert key in loader.pool
+
+def test_warmed_session_serves_laps_without_loading(tmp_path):
+    loader = F1DataLoader(cache_dir=str(tmp_path))
+    key = make_session_key(2024, 8, 'Q')
+    loader.pool.put(key, DummySession())
+    warm_session(loader, (2024, 8, 'Monaco Grand Prix', 'Q'))
+    # The lap table is written once and linked from the event name summary
+    assert (loader.summary_store.path_for(key) / 'laps.json').is_file()
+    by_name = make_session_key(2024, 'Monaco Grand Prix', 'Q')
+    assert not (loader.summary_store.path_for(by_name) / 'laps.json').exists()
+    assert len(loader.summary_store.load_laps(by_name)) == 3
+
+    cold = F1DataLoader(cache_dir=str(tmp_path))
+    session = cold.get_lap_session(2024, 'Monaco Grand Prix', 'Q')
+    assert isinstance(session, StoredSession)
+    assert cold.get_all_drivers(session) == ['HAM', 'VER']
+    lap = cold.get_driver_lap('VER', lap_number=2, session=session)
+    telemetry = cold.get_telemetry(lap)
+    assert len(telemetry) == 40
+    assert by_name not in cold.pool and key not in cold.pool